@@ -0,0 +1,71 @@
+"""Benchmark of the import time of exopandas.exodataframe and of the construction of the column registries.
+
+Usage: python benchmarks/bench_import.py [n_repeat]
+
+The import is timed in fresh interpreters (cold import), the backends of the databases (astropy,
+PyAstronomy) should only be imported when a database is used. The construction of the column
+registries is compared with the former construction of column_info DataFrames row by row.
+"""
+import sys
+from statistics import median
+from subprocess import run
+from timeit import timeit
+
+from pandas import DataFrame, concat
+
+from exopandas.databases.column_info import create_empty_column_info, add_column_2_column_info, unified_cols
+
+
+def time_cold_import(module="exopandas.exodataframe", n_repeat=5):
+    """Return the median time (in s) needed to import module in a fresh interpreter."""
+    code = ("from time import perf_counter; t0 = perf_counter(); import {}; print(perf_counter() - t0)"
+            "".format(module))
+    times = []
+    for _ in range(n_repeat):
+        res = run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        times.append(float(res.stdout.split()[-1]))
+    return median(times)
+
+
+def get_heavy_modules_imported(module="exopandas.exodataframe", heavy=("astropy", "PyAstronomy")):
+    """Return the heavy backends imported by the import of module (in a fresh interpreter)."""
+    code = ("import sys; import {}; print(' '.join(sorted(set(name.split('.')[0] for name in sys.modules) & {})))"
+            "".format(module, set(heavy)))
+    res = run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return res.stdout.split()
+
+
+def build_registry():
+    """Build a column_info registry with one row per unified column."""
+    column_info = create_empty_column_info()
+    for record in unified_cols:
+        column_info = add_column_2_column_info(column_info=column_info, original_column=record.column,
+                                               unified_column=record.column, unit=record.unit)
+    return column_info
+
+
+def build_dataframe_rowwise():
+    """Build a column_info DataFrame the former way: one row appended (copied) per column."""
+    unified_df = unified_cols.dataframe.copy()
+    column_info = DataFrame({"original_column": [], "unified_column": [], "description": [], "unit": []})
+    for record in unified_cols:
+        # Full scan of the unified columns as in the former add_column_2_column_info
+        idx = unified_df.index[unified_df["column"] == record.column].tolist()[0]
+        row = DataFrame([{'original_column': record.column, 'unified_column': record.column,
+                          'description': unified_df.loc[idx, "description"], 'unit': record.unit}])
+        column_info = concat([column_info, row], ignore_index=True)
+    return column_info
+
+
+if __name__ == "__main__":
+    n_repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    n_build = 20
+    print("cold import exopandas.exodataframe: {:.3f} s".format(time_cold_import(n_repeat=n_repeat)))
+    print("heavy backends imported: {}".format(get_heavy_modules_imported() or "none"))
+    print("cold import exopandas.databases.exoplanetarchive: {:.3f} s"
+          "".format(time_cold_import("exopandas.databases.exoplanetarchive", n_repeat=n_repeat)))
+    t_registry = timeit(build_registry, number=n_build) / n_build
+    t_dataframe = timeit(build_dataframe_rowwise, number=n_build) / n_build
+    print("column_info of {} columns, registry: {:.2f} ms".format(len(unified_cols), t_registry * 1e3))
+    print("column_info of {} columns, row by row DataFrame: {:.2f} ms (x{:.0f})"
+          "".format(len(unified_cols), t_dataframe * 1e3, t_dataframe / t_registry))
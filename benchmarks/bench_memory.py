@@ -0,0 +1,53 @@
+"""Benchmark of the memory used by a catalog before and after the compaction of its dtypes.
+
+Usage: python benchmarks/bench_memory.py [n_rows]
+
+The catalog mimics the exoplanet archive: object string names and references, integer flags and
+float64 measurements given with a few significant digits and their error bars.
+"""
+import sys
+
+import astropy.units as uu
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from exopandas.databases.column_info import without_unit
+from exopandas.databases.column_registry import FrameColumnInfo
+from exopandas.dtypes import get_dtype_plan, get_memory_report
+
+
+def create_table(n_rows):
+    """Return a catalog like table and its FrameColumnInfo."""
+    rng = default_rng(0)
+    n_stars = max(n_rows // 2, 1)
+    star = rng.integers(0, n_stars, n_rows)
+    df = DataFrame({"st_name": ["Star-{}".format(i) for i in star],
+                    "pl_name": ["Star-{} {}".format(i, "bcdefgh"[j % 7]) for j, i in enumerate(star)],
+                    "pl_mass_orig": rng.choice(["Mass", "Msini", "Msin(i)/sin(i)"], n_rows),
+                    "sp_type": rng.choice(["G2 V", "K1 V", "M3 V", "F8", ""], n_rows),
+                    "reference": rng.choice(["Ref {}".format(i) for i in range(50)], n_rows),
+                    "transiting?": rng.integers(0, 2, n_rows),
+                    "pl_per": rng.lognormal(2, 1.5, n_rows).round(5),
+                    "pl_radj": rng.uniform(0.05, 2, n_rows).round(3),
+                    "st_teff": rng.normal(5500, 800, n_rows).round(0),
+                    "t_tr": rng.uniform(2450000, 2460000, n_rows).round(5),
+                    }).astype({"st_name": object, "pl_name": object, "pl_mass_orig": object, "sp_type": object,
+                               "reference": object})
+    # Relative error bars, except for the transit times which are measured to ~1e-4 day
+    for column, relative in [("pl_per", True), ("pl_radj", True), ("st_teff", True), ("t_tr", False)]:
+        scale = df[column] if relative else 1e-2
+        df[column + "_err_sup"] = (scale * rng.uniform(1e-3, 5e-2, n_rows)).round(5)
+        df[column + "_err_inf"] = -df[column + "_err_sup"]
+    column_info = FrameColumnInfo()
+    units = {"transiting?": without_unit, "pl_per": uu.d, "pl_radj": uu.R_jup, "st_teff": uu.K, "t_tr": uu.d}
+    for column in df.columns:
+        unit = units.get(column.split("_err")[0], without_unit)
+        column_info.add(column=column, description="", unit=unit, unified=True)
+    return df, column_info
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    df, column_info = create_table(n_rows)
+    compacted = df.astype(get_dtype_plan(df, column_info=column_info))
+    print(get_memory_report(df, compacted).to_string())
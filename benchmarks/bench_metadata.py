@@ -0,0 +1,44 @@
+"""Benchmark of the overhead of the ExoDataFrame metadata on the common pandas operations.
+
+Usage: python benchmarks/bench_metadata.py [n_rows]
+
+Each operation is timed on a plain DataFrame and on an ExoDataFrame with the same data and a
+column_info for all its columns. The ratio should stay close to 1.
+"""
+import sys
+from timeit import repeat
+
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from exopandas.exodataframe import ExoDataFrame
+
+
+def create_tables(n_rows, n_columns=40):
+    """Return a DataFrame and the corresponding ExoDataFrame."""
+    rng = default_rng(0)
+    df = DataFrame({"pl_per" if i == 0 else "col{}".format(i): rng.lognormal(1, 1, n_rows)
+                    for i in range(n_columns)})
+    edf = ExoDataFrame(df)
+    for column in edf.columns:
+        edf.add_column_info(column=column, description="", unit="w/o unit", unified=True)
+    return df, edf
+
+
+operations = {"boolean filter": lambda df: df[df.pl_per < 5],
+              "column selection": lambda df: df[["pl_per", "col1", "col2"]],
+              "column access": lambda df: df["pl_per"],
+              "row slice": lambda df: df.iloc[:100],
+              "arithmetic": lambda df: df * 2,
+              "copy": lambda df: df.copy(),
+              }
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    df, edf = create_tables(n_rows)
+    for name, operation in operations.items():
+        t_df = min(repeat(lambda: operation(df), number=200, repeat=5)) / 200
+        t_edf = min(repeat(lambda: operation(edf), number=200, repeat=5)) / 200
+        print("{:<17} DataFrame: {:7.1f} us, ExoDataFrame: {:7.1f} us (x{:.2f})"
+              "".format(name, t_df * 1e6, t_edf * 1e6, t_edf / t_df))
@@ -0,0 +1,43 @@
+"""Benchmark of the Monte Carlo propagation of the error bars of the derived quantities.
+
+Usage: python benchmarks/bench_montecarlo.py [n_rows] [n_samples] [max_workers]
+
+The planetary density and equilibrium temperature are derived for a synthetic catalog with asymmetric
+error bars. The memory used is capped by the chunks of rows (see exopandas.montecarlo).
+"""
+import sys
+from time import perf_counter
+
+import astropy.units as uu
+from numpy.random import default_rng
+
+from exopandas.exodataframe import ExoDataFrame
+
+
+def create_table(n_rows):
+    """Return an ExoDataFrame with the inputs of pl_rhoj and pl_teq."""
+    rng = default_rng(0)
+    edf = ExoDataFrame({"pl_massj": rng.lognormal(0, 1, n_rows), "pl_radj": rng.uniform(0.1, 2, n_rows),
+                        "st_rad": rng.uniform(0.3, 2, n_rows), "st_mass": rng.uniform(0.3, 1.5, n_rows),
+                        "pl_per": rng.lognormal(2, 1.5, n_rows), "st_teff": rng.normal(5500, 800, n_rows)})
+    units = {"pl_massj": uu.M_jup, "pl_radj": uu.R_jup, "st_rad": uu.R_sun, "st_mass": uu.M_sun, "pl_per": uu.d,
+             "st_teff": uu.K}
+    for column in list(edf.columns):
+        edf[column + "_err_inf"] = edf[column] * rng.uniform(0.01, 0.3, n_rows)
+        edf[column + "_err_sup"] = edf[column] * rng.uniform(0.01, 0.3, n_rows)
+    for column in edf.columns:
+        edf.add_column_info(column=column, description="", unit=units[column.split("_err")[0]], unified=True)
+    return edf
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_samples = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    edf = create_table(n_rows)
+    for method, kwargs_montecarlo in [("analytic", None),
+                                      ("montecarlo", {"n_samples": n_samples, "max_workers": max_workers,
+                                                      "random_state": 0})]:
+        start = perf_counter()
+        edf.derive(["pl_rhoj", "pl_teq"], method=method, kwargs_montecarlo=kwargs_montecarlo)
+        print("{:<10} {} rows: {:.3f} s".format(method, n_rows, perf_counter() - start))
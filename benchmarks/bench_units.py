@@ -0,0 +1,48 @@
+"""Benchmark of the conversion of the columns into the units of the unified columns.
+
+Usage: python benchmarks/bench_units.py [n_rows]
+
+The vectorised conversion (exopandas.databases.unit_conversion) is compared with a naive
+conversion creating one astropy Quantity per value.
+"""
+import sys
+from timeit import timeit
+
+import astropy.units as uu
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from exopandas.databases.column_registry import FrameColumnInfo
+from exopandas.databases.unit_conversion import convert_2_units
+
+
+def create_table(n_rows):
+    """Return a table with columns in non unified units and its FrameColumnInfo."""
+    rng = default_rng(0)
+    units = {"pl_per": uu.h, "pl_per_err_inf": uu.h, "pl_per_err_sup": uu.h, "pl_a": uu.km,
+             "pl_radj": uu.R_earth, "st_teff": uu.deg_C, "ra": uu.rad, "dec": uu.rad}
+    df = DataFrame({column: rng.uniform(0, 1, n_rows) for column in units})
+    column_info = FrameColumnInfo()
+    for column, unit in units.items():
+        column_info.add(column=column, description="", unit=unit, unified=True)
+    target = {"pl_per": uu.d, "pl_per_err_inf": uu.d, "pl_per_err_sup": uu.d, "pl_a": uu.au,
+              "pl_radj": uu.R_jup, "st_teff": uu.K, "ra": uu.deg, "dec": uu.deg}
+    return df, column_info, target
+
+
+def convert_naive(df, column_info, units):
+    """Convert the columns value by value with astropy Quantities."""
+    for column, unit_to in units.items():
+        unit_from = column_info.get(column).unit
+        df[column] = [(value * unit_from).to_value(unit_to, equivalencies=uu.temperature())
+                      for value in df[column]]
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    df, column_info, target = create_table(n_rows)
+    t_vectorised = timeit(lambda: convert_2_units(df.copy(), column_info, target), number=20) / 20
+    t_naive = timeit(lambda: convert_naive(df.copy(), column_info, target), number=1)
+    print("{} rows x {} columns, vectorised: {:.2f} ms".format(n_rows, len(target), t_vectorised * 1e3))
+    print("{} rows x {} columns, Quantity per value: {:.2f} ms (x{:.0f})"
+          "".format(n_rows, len(target), t_naive * 1e3, t_naive / t_vectorised))
@@ -0,0 +1,191 @@
+"""Synthetic catalogs mimicking the schemas of the databases of dico_databases.
+
+The catalogs are written in local files, in the format read by the loaders of the databases, with
+scale times the approximate number of rows of the real databases (base_sizes). The values are random
+but realistic enough for the loaders, the unification and the merges: the planets of all the catalogs
+have names of the form "Star-<i> <letter>", so that the catalogs can be merged on the names.
+
+install_catalogs redirects the databases to the synthetic files: the loaders reading local files
+(exoplanet archive, TEPCat) are pointed to them and the databases downloaded by PyAstronomy (exoplanet.eu,
+SWEETCat) are registered again with a loader reading the files.
+"""
+from os.path import join
+
+from numpy import arange, where
+from numpy.random import default_rng
+from pandas import DataFrame, read_csv
+
+from exopandas.databases.column_info import non_app
+from exopandas.databases.projection import get_column_selector
+from exopandas.databases.registry import dico_databases
+
+
+# Approximate number of rows of the real databases
+base_sizes = {"exoplanetarchive": 4000, "exoplaneteu": 5000, "sweetcat": 3000, "tepcat well-studied": 700,
+              "tepcat planning": 700, "tepcat little-studied": 400, "tepcat homogeneous-meas": 250,
+              "tepcat homogeneous-phys": 250, "tepcat obliquity": 200}
+
+# Module attribute of the path of the databases read from local files
+database_file_attributes = {"exoplanetarchive": ("exopandas.databases.exoplanetarchive", "database_file"),
+                            "tepcat well-studied": ("exopandas.databases.tepcat", "database_file_WS"),
+                            "tepcat planning": ("exopandas.databases.tepcat", "database_file_Pl"),
+                            "tepcat little-studied": ("exopandas.databases.tepcat", "database_file_LS"),
+                            "tepcat homogeneous-meas": ("exopandas.databases.tepcat", "database_file_HM"),
+                            "tepcat homogeneous-phys": ("exopandas.databases.tepcat", "database_file_HP"),
+                            "tepcat obliquity": ("exopandas.databases.tepcat", "database_file_Ob")}
+
+name_columns = {"pl_hostname", "star_name", "star"}
+planet_name_columns = {"pl_name", "name", "System"}
+
+
+def get_names(n_rows, planet=True):
+    """Return the names of n_rows planets (two planets per star) or of their host stars."""
+    star = arange(n_rows) // 2
+    if planet:
+        return ["Star-{} {}".format(i, "bc"[j % 2]) for j, i in enumerate(star)]
+    return ["Star-{}".format(i) for i in star]
+
+
+def create_column(column, n_rows, rng, text=False):
+    """Return random values for a column, according to its name."""
+    if column in planet_name_columns:
+        return get_names(n_rows)
+    if column in name_columns:
+        return get_names(n_rows, planet=False)
+    if column in ("ra", ):
+        return rng.uniform(0, 360, n_rows).round(6)
+    if column in ("dec", ):
+        return rng.uniform(-90, 90, n_rows).round(6)
+    if column in ("pl_tranflag", ):
+        return rng.integers(0, 2, n_rows)
+    if text:
+        return rng.choice(["Value {}".format(i) for i in range(20)], n_rows)
+    return rng.lognormal(0, 1, n_rows).round(5)
+
+
+def create_table(columns, n_rows, rng, text_columns=(), error_suffixes=(), missing_fraction=0.1):
+    """Return a catalog with the columns and the error bars of the numerical ones.
+
+    :param list_of_str columns: Columns of the catalog
+    :param int n_rows: Number of rows
+    :param numpy.random.Generator rng: Random generator
+    :param list_of_str text_columns: Columns with text values
+    :param tuple_of_str error_suffixes: Suffixes of the error bars added for each numerical column
+    :param float missing_fraction: Fraction of the numerical values which are missing
+    :return DataFrame table: Catalog
+    """
+    table = {}
+    for column in columns:
+        text = column in text_columns
+        table[column] = create_column(column, n_rows, rng, text=text)
+        numerical = not(text) and (column not in name_columns | planet_name_columns | {"pl_tranflag", })
+        if numerical:
+            table[column] = where(rng.random(n_rows) < missing_fraction, float("nan"), table[column])
+            for i, suffix in enumerate(error_suffixes):
+                table[column + suffix] = ((-1)**i * rng.uniform(0, 0.1, n_rows) * table[column]).round(5)
+    return DataFrame(table)
+
+
+def create_catalog(database, n_rows, rng):
+    """Return a synthetic catalog with the schema of a database.
+
+    :param str database: Name of the database
+    :param int n_rows: Number of rows
+    :param numpy.random.Generator rng: Random generator
+    :return DataFrame catalog: Catalog, with the columns of the source file of the database
+    """
+    from exopandas.databases import tepcat
+    if database in ("exoplanetarchive", "exoplaneteu", "sweetcat"):
+        column_info = dico_databases[database]["column_info"]
+        text_columns = [record.original_column for record in column_info
+                        if (record.unit == non_app) and (record.original_column != "pl_tranflag")]
+        columns = [record.original_column for record in column_info
+                   if not(record.original_column.endswith(("_error_min", "_error_max")))]
+        # exoplanet.eu has error columns in its column_info, the archive has err1/err2 suffixes
+        error_suffixes = {"exoplanetarchive": ("err1", "err2"), "exoplaneteu": ("_error_max", "_error_min"),
+                          "sweetcat": ()}[database]
+        catalog = create_table(columns + ["other"], n_rows, rng, text_columns=text_columns,
+                               error_suffixes=error_suffixes)
+        if database == "sweetcat":
+            # SWEETCat is a catalog of stars, with one row per host star
+            catalog["star"] = ["Star-{}".format(i) for i in range(n_rows)]
+    elif database in ("tepcat well-studied", "tepcat little-studied"):
+        names = tepcat.columns_WS if database == "tepcat well-studied" else tepcat.columns_LS
+        main = [col for col in names if "_err" not in col]
+        catalog = create_table(main, n_rows, rng, text_columns=["Discovery_reference", "Recent_reference"],
+                               error_suffixes=("_erru", "_errd"))
+        for col in names:
+            if col not in catalog.columns:
+                catalog[col] = rng.uniform(0, 0.1, n_rows).round(5)
+        catalog = catalog[names]
+    elif database == "tepcat planning":
+        names = tepcat.columns_Pl
+        catalog = create_table(names, n_rows, rng, text_columns=["Type", "Ephemeris_reference"])
+        catalog["RA_h"] = rng.integers(0, 24, n_rows)
+        catalog["RA_m"] = rng.integers(0, 60, n_rows)
+        catalog["RA_s"] = rng.uniform(0, 60, n_rows).round(2)
+        catalog["Dec_d"] = ["{:+03d}".format(d) for d in rng.integers(-89, 90, n_rows)]
+        catalog["Dec_m"] = rng.integers(0, 60, n_rows)
+        catalog["Dec_s"] = rng.uniform(0, 60, n_rows).round(1)
+        catalog["T0 (HJD or BJD)"] = rng.uniform(2450000, 2460000, n_rows).round(6)
+    else:
+        catalog = create_table(["System", "Teff", "M_A", "R_A", "Period", "M_b", "R_b", "reference"], n_rows, rng,
+                               text_columns=["reference"], error_suffixes=("_erru", "_errd"))
+    return catalog
+
+
+def write_catalog(database, path, n_rows, seed=0):
+    """Write a synthetic catalog in the format of the source file of a database.
+
+    :param str database: Name of the database
+    :param str path: Path of the file
+    :param int n_rows: Number of rows
+    :param int seed: Seed of the random generator
+    """
+    catalog = create_catalog(database, n_rows, default_rng(seed))
+    with open(path, "w") as f:
+        if database == "exoplanetarchive":
+            f.write("# Synthetic catalog with the columns of the exoplanet archive\n")
+        catalog.to_csv(f, index=False)
+
+
+def write_catalogs(folder, scale=1, databases=None, seed=0):
+    """Write the synthetic catalogs of several databases.
+
+    :param str folder: Folder of the files
+    :param float scale: Number of rows relative to the real databases (base_sizes)
+    :param list_of_str databases: Databases (all the ones of base_sizes by default)
+    :param int seed: Seed of the random generators
+    :return dict paths: Dictionary {database: path of the catalog}
+    """
+    paths = {}
+    for i, database in enumerate(base_sizes if databases is None else databases):
+        paths[database] = join(folder, "{}.csv".format(database.replace(" ", "_")))
+        write_catalog(database, paths[database], max(int(base_sizes[database] * scale), 1), seed=seed + i)
+    return paths
+
+
+def make_csv_loader(path):
+    """Return a load_db function reading a csv file (with the projection of the columns)."""
+    def load_db(columns=None, chunksize=None):
+        return read_csv(path, usecols=None if columns is None else get_column_selector(columns),
+                        chunksize=chunksize)
+    return load_db
+
+
+def install_catalogs(paths):
+    """Redirect the databases to synthetic catalogs.
+
+    :param dict paths: Dictionary {database: path of the catalog} (see write_catalogs)
+    """
+    from importlib import import_module
+    for database, path in paths.items():
+        if database in database_file_attributes:
+            module, attribute = database_file_attributes[database]
+            setattr(import_module(module), attribute, path)
+            # The registry resolves the source file once
+            dico_databases[database]._resolved.pop("source_file", None)
+        else:
+            entry = dico_databases[database]
+            dico_databases.register(database, column_info=entry["column_info"], load_db=make_csv_loader(path),
+                                    source_file=path, key=entry["key"], merge_on=entry["merge_on"])
@@ -0,0 +1,236 @@
+"""Benchmark suite of the hot paths of exopandas on synthetic catalogs.
+
+Usage:
+    python benchmarks/suite.py run [--scales 1 10 100] [--repeat 5] [--select NAME] [--output FILE]
+    python benchmarks/suite.py compare OLD_FILE NEW_FILE [--threshold 1.2]
+
+run writes synthetic catalogs mimicking each database (see catalogs.py) at each scale (relative to the
+size of the real databases) in a temporary folder, then times:
+- the cold import of exopandas.exodataframe,
+- each loader (load_db),
+- ExoDataFrame.load with unification, without and with the on-disk cache,
+- a pairwise merge and a N-way load_many,
+- the attach of the merged ExoDataFrame published in shared memory,
+- get_unit and get_description over all the columns of the merged ExoDataFrame.
+Each benchmark is run repeat times (minimum and median times are kept) and once more with tracemalloc
+to measure its peak memory. The results and the versions of the environment are stored in a JSON file
+(results/<date>.json by default), two of them can be compared with compare to find the regressions.
+"""
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from os import makedirs
+from os.path import dirname, join
+from statistics import median
+from subprocess import run
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import tracemalloc
+
+import catalogs
+
+
+merge_databases = ["exoplanetarchive", "exoplaneteu"]
+load_many_databases = ["exoplanetarchive", "exoplaneteu", "tepcat well-studied", "tepcat planning"]
+# The overlapping columns are resolved, with "keep_both" the suffixed columns of a third database collide
+kwargs_merge_col = {"rule": "min_error"}
+# Name of the publication in shared memory of the merged ExoDataFrame
+shared_name = "benchmark-suite"
+
+
+def time_function(function, repeat=5):
+    """Return the minimum and median times (in s) of repeat calls of function."""
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    return min(times), median(times)
+
+
+def get_peak_memory(function):
+    """Return the peak memory (in bytes) allocated during a call of function."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def time_cold_import(module="exopandas.exodataframe", memory=False):
+    """Return the time (in s) of the import of module, measured in a fresh interpreter.
+
+    The start of the interpreter is not included, only the import is timed in the child process.
+
+    :param str module: Name of the module
+    :param bool memory: If True, the peak memory (in bytes) allocated by the import is returned instead
+        (measured with tracemalloc, which slows the import down)
+    :return float/int measure: Time of the import or its peak memory
+    """
+    if memory:
+        code = ("import tracemalloc; tracemalloc.start(); import {}; print(tracemalloc.get_traced_memory()[1])"
+                "".format(module))
+    else:
+        code = ("from time import perf_counter; t0 = perf_counter(); import {}; print(perf_counter() - t0)"
+                "".format(module))
+    res = run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return int(res.stdout.split()[-1]) if memory else float(res.stdout.split()[-1])
+
+
+def get_benchmarks():
+    """Return the list of (name, function) of the benchmarks (run on the installed catalogs)."""
+    from exopandas.databases.registry import dico_databases
+    from exopandas.exodataframe import ExoDataFrame
+
+    def load(database, use_cache):
+        return lambda: ExoDataFrame().load(database, unify=True, use_cache=use_cache)
+
+    def merge():
+        edf = ExoDataFrame()
+        edf.load(merge_databases[0], use_cache=True)
+        for database in merge_databases[1:]:
+            edf.merge(database, use_cache=True, kwargs_merge_col=kwargs_merge_col)
+        return edf
+
+    merged = merge()
+    merged.publish(shared_name)
+
+    def attach():
+        edf = ExoDataFrame()
+        edf.attach(shared_name)
+        return edf
+
+    benchmarks = []
+    for database in catalogs.base_sizes:
+        benchmarks.append(("load_db[{}]".format(database), dico_databases[database]["load_db"]))
+    for database in catalogs.base_sizes:
+        benchmarks.append(("load[{}]".format(database), load(database, use_cache=False)))
+        # The cache is written by a first load
+        ExoDataFrame().load(database, use_cache=True)
+        benchmarks.append(("load_cached[{}]".format(database), load(database, use_cache=True)))
+    benchmarks += [("merge[{}]".format("+".join(merge_databases)), merge),
+                   ("load_many[{}]".format("+".join(load_many_databases)),
+                    lambda: ExoDataFrame().load_many(load_many_databases, use_cache=True, max_workers=1,
+                                                         kwargs_merge_col=kwargs_merge_col)),
+                   ("attach[{}]".format("+".join(merge_databases)), attach),
+                   ("get_unit[{} columns]".format(len(merged.columns)),
+                    lambda: [merged.get_unit(col) for col in merged.columns]),
+                   ("get_description[{} columns]".format(len(merged.columns)),
+                    lambda: [merged.get_description(col) for col in merged.columns]),
+                   ]
+    return benchmarks
+
+
+def get_environment():
+    """Return the versions of the environment of the benchmarks."""
+    from importlib.metadata import version, PackageNotFoundError
+    environment = {"python": platform.python_version(), "platform": platform.platform(),
+                   "date": datetime.now().isoformat(timespec="seconds")}
+    for package in ("numpy", "pandas", "astropy", "pyarrow"):
+        try:
+            environment[package] = version(package)
+        except PackageNotFoundError:
+            environment[package] = None
+    res = run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=dirname(__file__) or ".")
+    environment["commit"] = res.stdout.strip() if res.returncode == 0 else None
+    return environment
+
+
+def run_suite(scales=(1, 10, 100), repeat=5, select=None):
+    """Run the benchmarks and return the results.
+
+    :param list_of_float scales: Scales of the synthetic catalogs
+    :param int repeat: Number of timed calls of each benchmark
+    :param str select: If provided, only the benchmarks whose name contains select are run
+    :return dict results: Dictionary with the keys "environment" and "results" (list of dictionaries
+        with the keys name, scale, time_min, time_median, repeat and peak_memory)
+    """
+    from exopandas.databases import cache
+    from exopandas.sharing import unpublish
+    results = []
+
+    def add_result(name, scale, function, import_module=None):
+        if (select is not None) and (select not in name):
+            return
+        if import_module is None:
+            time_min, time_median = time_function(function, repeat=repeat)
+            peak_memory = get_peak_memory(function)
+        else:
+            # The import is measured in fresh interpreters, not in this process
+            times = [time_cold_import(import_module) for _ in range(repeat)]
+            time_min, time_median = min(times), median(times)
+            peak_memory = time_cold_import(import_module, memory=True)
+        result = {"name": name, "scale": scale, "time_min": time_min, "time_median": time_median,
+                  "repeat": repeat, "peak_memory": peak_memory}
+        results.append(result)
+        print("{:<60} x{:<5g} {:10.4f} s {:10.1f} MiB".format(name, scale or 0, time_min,
+                                                                result["peak_memory"] / 2**20))
+
+    add_result("import[exopandas.exodataframe]", None, None, import_module="exopandas.exodataframe")
+    for scale in scales:
+        with TemporaryDirectory() as folder:
+            cache.cache_folder = join(folder, "cache")
+            catalogs.install_catalogs(catalogs.write_catalogs(folder, scale=scale))
+            try:
+                for name, function in get_benchmarks():
+                    add_result(name, scale, function)
+            finally:
+                unpublish(shared_name)
+    return {"environment": get_environment(), "results": results}
+
+
+def compare_results(old, new, threshold=1.2):
+    """Print the ratio of the times of the benchmarks of two runs and return the regressions.
+
+    :param dict old: Results of the reference run
+    :param dict new: Results of the new run
+    :param float threshold: Ratio of the minimum times above which a benchmark is a regression
+    :return list_of_str regressions: Names (and scales) of the regressions
+    """
+    old_results = {(res["name"], res["scale"]): res for res in old["results"]}
+    regressions = []
+    for res in new["results"]:
+        key = (res["name"], res["scale"])
+        if key not in old_results:
+            continue
+        ratio = res["time_min"] / old_results[key]["time_min"]
+        ratio_memory = res["peak_memory"] / max(old_results[key]["peak_memory"], 1)
+        flag = ""
+        if ratio > threshold:
+            flag = "REGRESSION"
+            regressions.append("{} x{}".format(*key))
+        print("{:<60} x{!s:<5} time x{:.2f} memory x{:.2f} {}".format(key[0], key[1], ratio, ratio_memory, flag))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Benchmark suite of exopandas")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    parser_run = subparsers.add_parser("run", help="Run the benchmarks")
+    parser_run.add_argument("--scales", type=float, nargs="+", default=[1, 10, 100])
+    parser_run.add_argument("--repeat", type=int, default=5)
+    parser_run.add_argument("--select", default=None)
+    parser_run.add_argument("--output", default=None)
+    parser_compare = subparsers.add_parser("compare", help="Compare the results of two runs")
+    parser_compare.add_argument("old")
+    parser_compare.add_argument("new")
+    parser_compare.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args()
+    if args.command == "run":
+        results = run_suite(scales=args.scales, repeat=args.repeat, select=args.select)
+        output = args.output
+        if output is None:
+            makedirs(join(dirname(__file__), "results"), exist_ok=True)
+            output = join(dirname(__file__), "results", "{}.json".format(datetime.now().strftime("%Y%m%d-%H%M%S")))
+        with open(output, "w") as f:
+            json.dump(results, f, indent=1)
+        print("Results written in {}".format(output))
+    else:
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        sys.exit(1 if compare_results(old, new, threshold=args.threshold) else 0)
@@ -0,0 +1,247 @@
+"""Resolution of the overlapping columns of a merge.
+
+When two ExoDataFrames with a same column X are merged, pandas keeps both columns with a suffix (X_x
+and X_y). The rule of the column defines how they are resolved:
+- "keep_both": the two suffixed columns are kept (default),
+- "left": the value of the left ExoDataFrame is used, or the right one when the left one is missing,
+- "right": the value of the right ExoDataFrame is used, or the left one when the right one is missing,
+- "min_error": the value with the smallest error bar is used (the mean of the absolute values of the
+  error bars, like X_err_inf and X_err_sup), a value with error bar being preferred to a value
+  without. On equal error bars the left value is used,
+- "keep_both_if_differ": the two columns are kept if at least one row has two different values
+  (relative tolerance rtol for numbers), otherwise they are resolved like with "left".
+The resolution is done for all the rows at once with boolean masks, the error bars of X being taken
+from the same side as X. The error bars which are only in one of the merged DataFrames (like the error
+bars Xerr1 and Xerr2 of the exoplanet archive, named after the original name of X, see
+get_error_bar_columns) are kept, but they are missing on the rows where the value of X comes from the
+other side. The side of each value is recorded in the provenance column X_src: index of the database of
+the value in databases_included (-1 if the value is missing), so that the provenance is kept when
+several databases are merged in sequence.
+"""
+from numpy import abs as np_abs, asarray, float64, full, isclose, isnan, nanmean
+from pandas import DataFrame, concat
+from pandas.api.types import is_numeric_dtype
+
+from .databases.projection import error_suffix_pattern
+
+
+merge_rules = ("keep_both", "left", "right", "min_error", "keep_both_if_differ")
+
+provenance_suffix = "_src"
+
+kwargs_merge_col_keys = ("rule", "rules", "provenance", "rtol")
+
+
+def check_kwargs_merge_col(kwargs_merge_col):
+    """Check the keyword arguments which define the resolution of the overlapping columns.
+
+    :param dict kwargs_merge_col: Dictionary with the keys:
+        - "rule": Rule of the overlapping columns (default "keep_both"),
+        - "rules": Dictionary {column: rule} of the columns with another rule than "rule",
+        - "provenance": If True (default) the provenance columns are created for the resolved columns,
+        - "rtol": Relative tolerance used to compare the numbers with "keep_both_if_differ" (default 1e-6)
+    :return dict kwargs_merge_col: Dictionary with all the keys
+    """
+    for key in kwargs_merge_col:
+        if key not in kwargs_merge_col_keys:
+            raise ValueError("{} is not a valid key of kwargs_merge_col, use one of {}."
+                             "".format(key, list(kwargs_merge_col_keys)))
+    res = {"rule": kwargs_merge_col.get("rule", "keep_both"), "rules": dict(kwargs_merge_col.get("rules", {})),
+           "provenance": kwargs_merge_col.get("provenance", True), "rtol": kwargs_merge_col.get("rtol", 1e-6)}
+    for rule in [res["rule"], ] + list(res["rules"].values()):
+        if rule not in merge_rules:
+            raise ValueError("{} is not a valid merge rule, use one of {}.".format(rule, list(merge_rules)))
+    return res
+
+
+def get_error_size(df, columns_err):
+    """Return the mean of the absolute values of the error bars of each row (nan if there is none).
+
+    :param DataFrame df: DataFrame with the error bars
+    :param list_of_str columns_err: Columns with the error bars
+    :return array error: Error size of each row
+    """
+    errors = [np_abs(asarray(df[col], dtype=float64)) for col in columns_err if is_numeric_dtype(df[col])]
+    if len(errors) == 0:
+        return full(len(df), float("nan"))
+    if len(errors) == 1:
+        return errors[0]
+    errors = asarray(errors)
+    error = full(errors.shape[1], float("nan"))
+    defined = ~isnan(errors).all(axis=0)
+    error[defined] = nanmean(errors[:, defined], axis=0)
+    return error
+
+
+def get_take_left(left, right, rule, error_left=None, error_right=None):
+    """Return for each row True if the left value should be used.
+
+    :param Series left: Left values
+    :param Series right: Right values
+    :param str rule: Rule ("left", "right" or "min_error")
+    :param array error_left: Error size of the left values (for "min_error")
+    :param array error_right: Error size of the right values (for "min_error")
+    :return array take_left: True for the rows where the left value is used
+    """
+    left_ok = left.notna().to_numpy()
+    right_ok = right.notna().to_numpy()
+    if rule == "left":
+        return left_ok | ~right_ok
+    elif rule == "right":
+        return left_ok & ~right_ok
+    right_better = (error_right < error_left) | (isnan(error_left) & ~isnan(error_right))
+    return left_ok & (~right_ok | ~right_better)
+
+
+def differ(left, right, rtol=1e-6):
+    """Return True if at least one row has two different (non missing) values."""
+    both = (left.notna() & right.notna()).to_numpy()
+    if not(both.any()):
+        return False
+    if is_numeric_dtype(left) and is_numeric_dtype(right):
+        return not(isclose(asarray(left, dtype=float64)[both], asarray(right, dtype=float64)[both],
+                           rtol=rtol, atol=0.).all())
+    return bool((left.to_numpy()[both] != right.to_numpy()[both]).any())
+
+
+def get_overlapping_columns(res, common, suffixes=('_x', '_y')):
+    """Return the overlapping columns of a merge and their error bars.
+
+    The error bars of a column X are the overlapping columns named X followed by an error suffix (see
+    exopandas.databases.projection.error_suffix_pattern), like X_err_inf or Xerr1.
+
+    :param DataFrame res: Result of the merge
+    :param list_of_str common: Columns of both merged DataFrames
+    :param tuple_of_str suffixes: Suffixes used for the overlapping columns in the merge
+    :return dict overlapping: Dictionary {column: list of its overlapping error bar columns}, the error
+        bars of an overlapping column are not keys of the dictionary.
+    """
+    suffix_left, suffix_right = suffixes
+    if not(suffix_left) or not(suffix_right):
+        return {}
+    columns = set(res.columns)
+    common = set(common)
+    overlapping = [col[:-len(suffix_left)] for col in res.columns
+                   if isinstance(col, str) and col.endswith(suffix_left) and
+                   (col[:-len(suffix_left)] in common) and (col[:-len(suffix_left)] + suffix_right in columns) and
+                   not(col[:-len(suffix_left)].endswith(provenance_suffix))]
+    # Main column of each error bar column (the longest overlapping column it starts with)
+    main_columns = {}
+    for column in overlapping:
+        mains = [main for main in overlapping if (main != column) and column.startswith(main) and
+                 (error_suffix_pattern.match(column[len(main):]) is not None)]
+        if len(mains) > 0:
+            main_columns[column] = max(mains, key=len)
+    res = {column: [] for column in overlapping if column not in main_columns}
+    for column, main in main_columns.items():
+        if main in res:
+            res[main].append(column)
+        else:
+            res[column] = []
+    return res
+
+
+def get_error_bar_columns(columns, column, originals=(), exclude=()):
+    """Return the error bar columns of a column among the columns of a DataFrame.
+
+    The error bars of a column X are the columns named X, or one of the original names of X in the
+    databases, followed by an error suffix (see exopandas.databases.projection.error_suffix_pattern),
+    like X_err_inf or the Xerr1 of the exoplanet archive.
+
+    :param list_of_str columns: Columns of the DataFrame
+    :param str column: Name of the column
+    :param list_of_str originals: Original names of the column in the databases
+    :param list_of_str exclude: Columns which are not returned (like the overlapping columns of a merge)
+    :return list_of_str columns_err: Error bar columns
+    """
+    names = [column, ] + [original for original in originals if original != column]
+    exclude = set(exclude)
+    columns_err = []
+    for col in columns:
+        if (col == column) or not(isinstance(col, str)) or (col in exclude):
+            continue
+        if any([col.startswith(name) and (error_suffix_pattern.match(col[len(name):]) is not None)
+                for name in names]):
+            columns_err.append(col)
+    return columns_err
+
+
+def get_take_left_column(res, column, columns_err, rule, suffixes=('_x', '_y'), rtol=1e-6, companions=((), ())):
+    """Return for each row of the merge True if the left value of an overlapping column should be used.
+
+    :param DataFrame res: Result of the merge
+    :param str column: Name of the overlapping column (without suffix)
+    :param list_of_str columns_err: Overlapping error bar columns of column (without suffix)
+    :param str rule: Rule of the column (see merge_rules)
+    :param tuple_of_str suffixes: Suffixes used for the overlapping columns in the merge
+    :param float rtol: Relative tolerance used to compare the numbers with "keep_both_if_differ"
+    :param tuple companions: Error bar columns of column only in the left and only in the right DataFrame
+        (see get_error_bar_columns)
+    :return array take_left: True for the rows where the left value is used (None if the two columns
+        are kept)
+    """
+    suffix_left, suffix_right = suffixes
+    left = res[column + suffix_left]
+    right = res[column + suffix_right]
+    if rule == "keep_both":
+        return None
+    if rule == "keep_both_if_differ":
+        if differ(left, right, rtol=rtol):
+            return None
+        rule = "left"
+    if rule == "min_error":
+        columns_err = [col for col in columns_err if "err" in col[len(column):]]
+        companions_left, companions_right = [[col for col in cols if not(col.endswith("lim"))] for cols in companions]
+        return get_take_left(left, right, rule,
+                             error_left=get_error_size(res, [col + suffix_left for col in columns_err] +
+                                                       companions_left),
+                             error_right=get_error_size(res, [col + suffix_right for col in columns_err] +
+                                                        companions_right))
+    return get_take_left(left, right, rule)
+
+
+def resolve_overlapping_columns(res, common, kwargs_merge_col={}, suffixes=('_x', '_y'), companions=({}, {})):
+    """Resolve the overlapping columns of a merge according to their rules.
+
+    The suffixed columns of each resolved column X (and of its error bars) are replaced by the column X,
+    at the position of the left one. The error bars of X which are only in one of the DataFrames are set
+    missing on the rows where the value of X comes from the other one.
+
+    :param DataFrame res: Result of the merge
+    :param list_of_str common: Columns of both merged DataFrames
+    :param dict kwargs_merge_col: Rules of the overlapping columns (see check_kwargs_merge_col)
+    :param tuple_of_str suffixes: Suffixes used for the overlapping columns in the merge
+    :param tuple_of_dict companions: Dictionaries {column: error bar columns} of the error bars which are
+        only in the left and only in the right DataFrame (see get_error_bar_columns)
+    :return DataFrame res: Result of the merge with the resolved columns
+    :return dict take_left: Dictionary {resolved column: array True for the rows where the left value is
+        used} (without the error bars)
+    :return list_of_str resolved: Resolved columns, with the error bars
+    """
+    kwargs_merge_col = check_kwargs_merge_col(kwargs_merge_col)
+    suffix_left, suffix_right = suffixes
+    take_left = {}
+    values = {}
+    masked = {}
+    for column, columns_err in get_overlapping_columns(res, common, suffixes=suffixes).items():
+        rule = kwargs_merge_col["rules"].get(column, kwargs_merge_col["rule"])
+        companions_column = (companions[0].get(column, []), companions[1].get(column, []))
+        take_left_column = get_take_left_column(res, column, columns_err, rule, suffixes=suffixes,
+                                                rtol=kwargs_merge_col["rtol"], companions=companions_column)
+        if take_left_column is None:
+            continue
+        take_left[column] = take_left_column
+        for col in [column, ] + columns_err:
+            values[col] = res[col + suffix_left].where(take_left_column, res[col + suffix_right])
+        for cols, mask in zip(companions_column, (take_left_column, ~take_left_column)):
+            for col in cols:
+                masked[col] = res[col].where(mask)
+    if len(values) == 0:
+        return res, take_left, []
+    # The resolved columns are added at once, at the position of the left ones
+    columns = [col[:-len(suffix_left)] if (isinstance(col, str) and col.endswith(suffix_left) and
+                                           (col[:-len(suffix_left)] in values)) else col
+               for col in res.columns if col not in [col + suffix_right for col in values]]
+    res = res.drop(columns=[col + suffix for col in values for suffix in suffixes] + list(masked))
+    res = concat([res, DataFrame(dict(values, **masked), index=res.index)], axis=1)[columns]
+    return res, take_left, list(values)
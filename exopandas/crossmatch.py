@@ -0,0 +1,215 @@
+"""Cross-match of catalogs on the sky position of the host stars.
+
+The positions are converted into unit vectors and indexed with a KD-tree (scipy.spatial.cKDTree), so
+that the nearest neighbour of each position is found in O(n log n). The close positions are grouped in
+systems and the planets of the matched systems are paired by letter or period (see get_sky_match_keys).
+"""
+from re import compile as compile_re
+
+from numpy import (arange, arcsin, asarray, concatenate, cos, deg2rad, empty, full, int8, isfinite, nan, ones,
+                   rad2deg, sin, stack)
+from numpy.linalg import norm
+
+
+_letter_pattern = compile_re(r"\s([b-z])\s*$")
+
+
+def radec_2_unit_vectors(ra, dec):
+    """Return the unit vectors corresponding to sky positions.
+
+    :param array ra: Right ascension in degree
+    :param array dec: Declination in degree
+    :return array xyz: Unit vectors, array of shape (n, 3)
+    """
+    ra = deg2rad(asarray(ra, dtype=float))
+    dec = deg2rad(asarray(dec, dtype=float))
+    cos_dec = cos(dec)
+    return stack([cos_dec * cos(ra), cos_dec * sin(ra), sin(dec)], axis=-1)
+
+
+def chord_2_angle(chord):
+    """Convert the distance between two unit vectors into the angle between them (in arcsec)."""
+    return rad2deg(2 * arcsin(asarray(chord) / 2)) * 3600
+
+
+def angle_2_chord(angle):
+    """Convert an angle (in arcsec) into the distance between two unit vectors separated by it."""
+    return 2 * sin(deg2rad(angle / 3600.) / 2)
+
+
+def crossmatch_sky(ra1, dec1, ra2, dec2, tolerance=2.):
+    """Find, for each position 2, the nearest position 1 within tolerance.
+
+    :param array ra1: Right ascensions of the positions 1 in degree
+    :param array dec1: Declinations of the positions 1 in degree
+    :param array ra2: Right ascensions of the positions 2 in degree
+    :param array dec2: Declinations of the positions 2 in degree
+    :param float tolerance: Maximum separation of a match in arcsec
+    :return array idx: Index of the matched position 1 for each position 2 (-1 if there is no match)
+    :return array sep: Separation of the match in arcsec (nan if there is no match)
+    """
+    from scipy.spatial import cKDTree
+    xyz1 = radec_2_unit_vectors(ra1, dec1)
+    xyz2 = radec_2_unit_vectors(ra2, dec2)
+    valid1 = isfinite(xyz1).all(axis=1)
+    valid2 = isfinite(xyz2).all(axis=1)
+    idx = full(len(xyz2), -1, dtype=int)
+    sep = full(len(xyz2), nan)
+    if (valid1.sum() == 0) or (valid2.sum() == 0):
+        return idx, sep
+    idx_valid1 = arange(len(xyz1))[valid1]
+    tree = cKDTree(xyz1[valid1])
+    dist, idx_tree = tree.query(xyz2[valid2], k=1, distance_upper_bound=angle_2_chord(tolerance))
+    found = isfinite(dist)
+    idx_valid2 = arange(len(xyz2))[valid2]
+    idx[idx_valid2[found]] = idx_valid1[idx_tree[found]]
+    sep[idx_valid2[found]] = chord_2_angle(dist[found])
+    return idx, sep
+
+
+def get_system_ids(ra1, dec1, ra2, dec2, tolerance=2.):
+    """Return the system of each row of two catalogs, the systems being groups of close positions.
+
+    The positions of the two catalogs closer than tolerance are linked and the systems are the
+    connected components of these links, so the planets of a host whose positions differ slightly (in
+    the same catalog or between the catalogs) are in the same system.
+
+    :param array ra1: Right ascensions of catalog 1 in degree
+    :param array dec1: Declinations of catalog 1 in degree
+    :param array ra2: Right ascensions of catalog 2 in degree
+    :param array dec2: Declinations of catalog 2 in degree
+    :param float tolerance: Maximum separation of two positions of a system in arcsec
+    :return array system1: System of each row of catalog 1 (each row without position is a system)
+    :return array system2: System of each row of catalog 2 (each row without position is a system)
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    from scipy.spatial import cKDTree
+    xyz = concatenate([radec_2_unit_vectors(ra1, dec1), radec_2_unit_vectors(ra2, dec2)])
+    n_rows = len(xyz)
+    valid = isfinite(xyz).all(axis=1)
+    idx_valid = arange(n_rows)[valid]
+    if len(idx_valid) > 0:
+        pairs = cKDTree(xyz[valid]).query_pairs(angle_2_chord(tolerance), output_type="ndarray")
+        pairs = idx_valid[pairs]
+    else:
+        pairs = empty((0, 2), dtype=int)
+    graph = coo_matrix((ones(len(pairs), dtype=int8), (pairs[:, 0], pairs[:, 1])), shape=(n_rows, n_rows))
+    _, systems = connected_components(graph, directed=False)
+    n1 = len(asarray(ra1))
+    return systems[:n1], systems[n1:]
+
+
+def get_planet_letters(names):
+    """Return the letter of the planets (last word of their name if it is a single lower case letter).
+
+    :param array names: Names of the planets (like "WASP-12 b")
+    :return list_of_str letters: Letter of each planet (None if it has none)
+    """
+    letters = []
+    for name in names:
+        match = _letter_pattern.search(name) if isinstance(name, str) else None
+        letters.append(None if match is None else match.group(1))
+    return letters
+
+
+def _pair_system(rows1, rows2, letters1, letters2, periods1, periods2, period_rtol):
+    """Return the pairs of rows (row 1, row 2) of the planets of a system.
+
+    The planets are paired by letter, then by nearest period (within period_rtol) and finally the last
+    planet of each catalog are paired if they are alone. Two planets with different letters or periods
+    are never paired.
+    """
+    def compatible(i, j):
+        if (letters1 is not None) and (letters1[i] is not None) and (letters2[j] is not None):
+            if letters1[i] != letters2[j]:
+                return False
+        if (periods1 is not None) and isfinite(periods1[i]) and isfinite(periods2[j]):
+            if abs(periods1[i] - periods2[j]) > period_rtol * abs(periods1[i]):
+                return False
+        return True
+
+    pairs = []
+    free1 = list(rows1)
+    free2 = list(rows2)
+    if letters1 is not None:
+        by_letter = {}
+        for i in free1:
+            if letters1[i] is not None:
+                by_letter.setdefault(letters1[i], i)
+        for j in list(free2):
+            i = by_letter.pop(letters2[j], None) if letters2[j] is not None else None
+            if i is not None:
+                pairs.append((i, j))
+                free1.remove(i)
+                free2.remove(j)
+    if (periods1 is not None) and (len(free1) > 0) and (len(free2) > 0):
+        candidates = sorted([(abs(periods1[i] - periods2[j]) / abs(periods1[i]), i, j) for i in free1 for j in free2
+                             if isfinite(periods1[i]) and isfinite(periods2[j]) and (periods1[i] != 0) and
+                             compatible(i, j)])
+        for _, i, j in candidates:
+            if (i in free1) and (j in free2):
+                pairs.append((i, j))
+                free1.remove(i)
+                free2.remove(j)
+    if (len(free1) == 1) and (len(free2) == 1) and compatible(free1[0], free2[0]):
+        pairs.append((free1[0], free2[0]))
+    return pairs
+
+
+def get_sky_match_keys(ra1, dec1, ra2, dec2, tolerance=2., names1=None, names2=None, periods1=None,
+                       periods2=None, pair_planets=True, period_rtol=0.01):
+    """Return integer keys allowing to merge two catalogs on the sky position of their rows.
+
+    The rows are grouped in systems (see get_system_ids). If pair_planets is True, the planets of each
+    system are paired (see _pair_system): each row of catalog 1 has its own key and each row of
+    catalog 2 gets the key of its pair or a key which is not used in catalog 1 if it has none, so the
+    merge is one to one. Otherwise the rows of a system share the same key (all the planets of the
+    system are matched together, to merge also on other columns).
+
+    :param array ra1: Right ascensions of catalog 1 in degree
+    :param array dec1: Declinations of catalog 1 in degree
+    :param array ra2: Right ascensions of catalog 2 in degree
+    :param array dec2: Declinations of catalog 2 in degree
+    :param float tolerance: Maximum separation of a match in arcsec
+    :param array names1: Names of the planets of catalog 1 (to pair them by letter), can be None
+    :param array names2: Names of the planets of catalog 2, can be None
+    :param array periods1: Orbital periods of the planets of catalog 1 (to pair them by period), can be None
+    :param array periods2: Orbital periods of the planets of catalog 2, can be None
+    :param bool pair_planets: If True, the planets of the systems are paired
+    :param float period_rtol: Maximum relative difference of the periods of two paired planets
+    :return array key1: Keys of the rows of catalog 1
+    :return array key2: Keys of the rows of catalog 2
+    :return array sep: Separation in arcsec of the rows of catalog 2 with their pair (with the nearest
+        position of catalog 1 within tolerance if pair_planets is False), nan if there is none
+    """
+    system1, system2 = get_system_ids(ra1, dec1, ra2, dec2, tolerance=tolerance)
+    if not(pair_planets):
+        return system1, system2, crossmatch_sky(ra1, dec1, ra2, dec2, tolerance=tolerance)[1]
+    n1 = len(system1)
+    key1 = arange(n1)
+    key2 = n1 + arange(len(system2))
+    letters1 = letters2 = None
+    if (names1 is not None) and (names2 is not None):
+        letters1, letters2 = get_planet_letters(names1), get_planet_letters(names2)
+    if (periods1 is None) or (periods2 is None):
+        periods1 = periods2 = None
+    else:
+        periods1, periods2 = asarray(periods1, dtype=float), asarray(periods2, dtype=float)
+    rows1 = {}
+    for i, system in enumerate(system1.tolist()):
+        rows1.setdefault(system, []).append(i)
+    rows2 = {}
+    for j, system in enumerate(system2.tolist()):
+        if system in rows1:
+            rows2.setdefault(system, []).append(j)
+    pairs = [pair for system, rows in rows2.items()
+             for pair in _pair_system(rows1[system], rows, letters1, letters2, periods1, periods2, period_rtol)]
+    sep = full(len(system2), nan)
+    if len(pairs) > 0:
+        idx1, idx2 = asarray(pairs).T
+        key2[idx2] = idx1
+        xyz1 = radec_2_unit_vectors(asarray(ra1, dtype=float)[idx1], asarray(dec1, dtype=float)[idx1])
+        xyz2 = radec_2_unit_vectors(asarray(ra2, dtype=float)[idx2], asarray(dec2, dtype=float)[idx2])
+        sep[idx2] = chord_2_angle(norm(xyz1 - xyz2, axis=1))
+    return key1, key2, sep
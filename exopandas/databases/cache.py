@@ -0,0 +1,349 @@
+"""On-disk cache of the loaded databases.
+
+The DataFrame returned by the load_db function of a database is stored in the Feather (Arrow IPC)
+binary columnar format, uncompressed so that it can be memory-mapped when it is read back. Each
+database has at most one entry in the cache. The entry is invalidated when the source file of the
+database changes (modification time, size and content hash) or, for databases without local source
+file (the ones downloaded by PyAstronomy), when it is older than cache_max_age. The total size of
+the cache is bounded by cache_max_size, the least recently used entries being evicted first.
+
+The cache can be used by several processes at the same time (ExoDataFrame.load_many with
+use_processes): the files are written through unique temporary files and the updates of the index are
+serialised by a lock file.
+"""
+from contextlib import contextmanager
+from os import close, makedirs, remove, replace, stat
+from os.path import basename, expanduser, isfile, join, getsize
+from hashlib import blake2b
+from json import load as load_json, dump as dump_json
+from tempfile import mkstemp
+from threading import RLock
+from time import time
+
+try:
+    from fcntl import LOCK_EX, LOCK_UN, flock
+except ImportError:  # Windows
+    flock = None
+
+from ..profiling import stage
+from . import snapshots
+from .projection import select_columns
+
+
+cache_folder = expanduser("~/Data/exoplanet_database/cache")
+cache_max_size = 2 * 1024**3  # Maximum total size of the cache files in bytes
+cache_max_age = 7 * 24 * 3600  # Maximum age in seconds of the entries without source file
+
+index_filename = "index.json"
+
+# Serialise the read-modify-write of the index between the threads (see ExoDataFrame.load_many), the
+# processes are serialised by a lock on the file index_filename + ".lock" (see _lock_index)
+_index_lock = RLock()
+_index_lock_depth = 0
+
+
+def _get_index_path():
+    return join(cache_folder, index_filename)
+
+
+def _read_index():
+    """Return the cache index (dictionary database name -> entry)."""
+    try:
+        with open(_get_index_path()) as f:
+            return load_json(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(index):
+    """Atomically write the cache index."""
+    makedirs(cache_folder, exist_ok=True)
+    tmp_path = _get_tmp_path(_get_index_path())
+    with open(tmp_path, "w") as f:
+        dump_json(index, f, indent=1)
+    replace(tmp_path, _get_index_path())
+
+
+def _get_tmp_path(path):
+    """Return the path of a new temporary file in the folder of path (unique between the processes)."""
+    fd, tmp_path = mkstemp(dir=cache_folder, prefix=basename(path) + ".", suffix=".tmp")
+    close(fd)
+    return tmp_path
+
+
+@contextmanager
+def _lock_index():
+    """Context serialising the read-modify-write of the index between the threads and the processes.
+
+    The context is reentrant within a thread (the file lock is only taken by the outermost context).
+    Without fcntl (Windows), only the threads are serialised.
+    """
+    global _index_lock_depth
+    with _index_lock:
+        if (_index_lock_depth > 0) or (flock is None):
+            _index_lock_depth += 1
+            try:
+                yield
+            finally:
+                _index_lock_depth -= 1
+            return
+        makedirs(cache_folder, exist_ok=True)
+        with open(_get_index_path() + ".lock", "a") as f:
+            flock(f.fileno(), LOCK_EX)
+            _index_lock_depth += 1
+            try:
+                yield
+            finally:
+                _index_lock_depth -= 1
+                flock(f.fileno(), LOCK_UN)
+
+
+def _get_cache_filename(database):
+    """Return the name of the cache file of a database."""
+    return "{}.feather".format(blake2b(database.encode(), digest_size=8).hexdigest())
+
+
+def file_digest(filename, blocksize=2**20):
+    """Return the hash of the content of a file.
+
+    :param str filename: Path to the file
+    :param int blocksize: Size of the blocks read from the file
+    :return str digest: Hexadecimal digest of the file content
+    """
+    h = blake2b(digest_size=16)
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(blocksize), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def get_source_fingerprint(source_file, entry=None):
+    """Return the fingerprint (mtime, size and hash) of the source file of a database.
+
+    :param str source_file: Path to the source file
+    :param dict entry: Cache entry of the database. If its mtime and size are the one of the source
+        file, the hash is not recomputed.
+    :return dict fingerprint: Fingerprint of the source file
+    """
+    st = stat(source_file)
+    fingerprint = {"source_file": source_file, "mtime": st.st_mtime_ns, "size": st.st_size}
+    if ((entry is not None) and (entry.get("source_file") == source_file) and
+       (entry.get("mtime") == st.st_mtime_ns) and (entry.get("size") == st.st_size)):
+        fingerprint["hash"] = entry["hash"]
+    else:
+        fingerprint["hash"] = file_digest(source_file)
+    return fingerprint
+
+
+def get_loading_fingerprint(database, source_file):
+    """Return the fingerprint of the source file of a database, to be taken before loading it.
+
+    :param str database: Name of the database
+    :param str source_file: Path to the source file of the database (None if there is none)
+    :return dict fingerprint: Fingerprint of the source file (None if there is no source file or if it
+        does not exist yet, the fingerprint being then taken when the database is cached)
+    """
+    if (source_file is None) or not(isfile(source_file)):
+        return None
+    return get_source_fingerprint(source_file, entry=_read_index().get(database, None))
+
+
+def _is_valid(entry, source_file):
+    """Return the source fingerprint and True if the cache entry is still valid."""
+    if source_file is None:
+        return None, (entry is not None) and (time() - entry["created"] < cache_max_age)
+    fingerprint = get_source_fingerprint(source_file, entry=entry)
+    if entry is None:
+        return fingerprint, False
+    return fingerprint, (entry.get("source_file") == source_file) and (entry["hash"] == fingerprint["hash"])
+
+
+def _evict(index, keep):
+    """Remove the least recently used entries until the cache size is below cache_max_size.
+
+    :param dict index: Cache index, modified in place
+    :param str keep: Name of a database whose entry should not be evicted
+    """
+    total_size = sum([entry["cache_size"] for entry in index.values()])
+    for database in sorted(index, key=lambda db: index[db]["last_access"]):
+        if total_size <= cache_max_size:
+            break
+        if database == keep:
+            continue
+        total_size -= index[database]["cache_size"]
+        clear_cache(database, index=index)
+
+
+def clear_cache(database=None, index=None):
+    """Remove the cache entry of a database or the full cache.
+
+    :param str database: Name of the database. If None, all the entries are removed.
+    :param dict index: Cache index, modified in place. If None, it is read from and written to the disk.
+    """
+    with _lock_index():
+        write = index is None
+        if write:
+            index = _read_index()
+        for db in (list(index) if database is None else [database, ]):
+            entry = index.pop(db, None)
+            if entry is not None:
+                filename = join(cache_folder, entry["cache_file"])
+                if isfile(filename):
+                    remove(filename)
+        if write:
+            _write_index(index)
+
+
+def _get_valid_cache_file(database, source_file=None, validate=True):
+    """Return the path to the cache file of a database (None if there is no valid cache entry).
+
+    The last access time of the entry is updated. If validate is False, the entry is not checked
+    against the source file.
+    """
+    with _lock_index():
+        index = _read_index()
+        entry = index.get(database, None)
+        if entry is None:
+            return None
+        if validate and not(_is_valid(entry, source_file)[1]):
+            return None
+        filename = join(cache_folder, entry["cache_file"])
+        if not(isfile(filename)):
+            return None
+        entry["last_access"] = time()
+        _write_index(index)
+    return filename
+
+
+def _read_cache_table(filename, columns=None):
+    """Return the (memory-mapped) Arrow table of a cache file, restricted to columns and their error bars."""
+    from pyarrow import feather
+    if columns is not None:
+        from pyarrow.ipc import open_file
+        with open_file(filename) as reader:
+            available = reader.schema.names
+        columns = select_columns(available, [str(col) for col in columns])
+    return feather.read_table(filename, columns=columns, memory_map=True)
+
+
+def read_cache(database, source_file=None, columns=None, validate=True):
+    """Return the cached DataFrame of a database or None if there is no valid cache entry.
+
+    :param str database: Name of the database
+    :param str source_file: Path to the source file of the database (None if there is none)
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param bool validate: If False the cached DataFrame is returned even if the source changed since
+        it was cached (used to compare the previous and new versions of a database).
+    :return DataFrame db: Cached DataFrame or None
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    filename = _get_valid_cache_file(database, source_file=source_file, validate=validate)
+    if filename is None:
+        return None
+    return _read_cache_table(filename, columns=columns).to_pandas()
+
+
+def iter_cache(database, chunksize, source_file=None, columns=None):
+    """Return an iterator over the chunks of the cached DataFrame of a database.
+
+    The cache file is memory-mapped and only one chunk at a time is converted into a DataFrame.
+
+    :param str database: Name of the database
+    :param int chunksize: Number of rows of each chunk
+    :param str source_file: Path to the source file of the database (None if there is none)
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :return generator chunks: Generator over the chunks (DataFrames) or None if there is no valid cache
+        entry
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    filename = _get_valid_cache_file(database, source_file=source_file)
+    if filename is None:
+        return None
+    table = _read_cache_table(filename, columns=columns)
+    return (table.slice(start, chunksize).to_pandas() for start in range(0, max(table.num_rows, 1), chunksize))
+
+
+def is_cache_valid(database, source_file=None):
+    """Return True if the cache entry of a database exists and its source did not change.
+
+    :param str database: Name of the database
+    :param str source_file: Path to the source file of the database (None if there is none)
+    """
+    with _lock_index():
+        return _is_valid(_read_index().get(database, None), source_file)[1]
+
+
+def write_cache(database, db, source_file=None, fingerprint=None):
+    """Store the DataFrame of a database in the cache.
+
+    :param str database: Name of the database
+    :param DataFrame db: DataFrame returned by the load_db function of the database
+    :param str source_file: Path to the source file of the database (None if there is none)
+    :param dict fingerprint: Fingerprint of the source file taken before loading the database (see
+        get_source_fingerprint), so that a source file modified during the loading does not validate
+        the cache. If None, the fingerprint of the source file is taken now.
+    """
+    try:
+        from pyarrow import ArrowException, feather
+    except ImportError:
+        print("WARNING: pyarrow is not installed, the database cache is disabled.")
+        return
+    if (fingerprint is None) and (source_file is not None):
+        fingerprint, _ = _is_valid(_read_index().get(database, None), source_file)
+    makedirs(cache_folder, exist_ok=True)
+    cache_file = _get_cache_filename(database)
+    filename = join(cache_folder, cache_file)
+    tmp_path = _get_tmp_path(filename)
+    try:
+        feather.write_feather(db, tmp_path, compression="uncompressed")
+    except (ArrowException, ValueError, TypeError) as e:
+        remove(tmp_path)
+        print("WARNING: database {} cannot be cached ({}).".format(database, e))
+        return
+    # The cache file is replaced under the lock, so that the index always describes the file in place
+    with _lock_index():
+        replace(tmp_path, filename)
+        entry = {"cache_file": cache_file, "cache_size": getsize(filename), "created": time(),
+                 "last_access": time()}
+        if fingerprint is not None:
+            entry.update(fingerprint)
+        index = _read_index()
+        index[database] = entry
+        _evict(index, keep=database)
+        _write_index(index)
+
+
+def load_db_cached(database, load_db, source_file=None, columns=None):
+    """Load a database using the cache if possible.
+
+    When the database is not in the cache, all its columns are loaded and cached, and then the
+    requested columns are selected.
+
+    :param str database: Name of the database
+    :param function load_db: Function which loads the database from its source
+    :param str source_file: Path to the source file of the database (None if there is none)
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :return DataFrame db: Loaded database
+    """
+    with stage("read_cache", database):
+        db = read_cache(database, source_file=source_file, columns=columns)
+    if db is None:
+        fingerprint = get_loading_fingerprint(database, source_file)
+        db = load_db()
+        with stage("write_cache", database):
+            write_cache(database, db, source_file=source_file, fingerprint=fingerprint)
+        if snapshots.auto_snapshot:
+            from .registry import dico_databases
+            snapshots.save_snapshot(database, db, key=dico_databases[database]["key"])
+        if columns is not None:
+            db = db[select_columns(db.columns, columns)]
+    return db
@@ -1,20 +1,22 @@
-from pandas import DataFrame
 import astropy.units as uu
 
+from .column_registry import UnifiedColumns, ColumnInfo
+from .unit_conversion import get_conversion
+
 without_unit = "w/o unit"
 non_app = "N/A"
 
 
 def create_empty_column_info():
-    """Create an empty column_info DataFrame to be used to define the column of a database.
+    """Create an empty column_info registry to be used to define the column of a database.
     """
-    return DataFrame({"original_column": [], "unified_column": [], "description": [], "unit": []})
+    return ColumnInfo()
 
 
 def add_column_2_column_info(column_info, original_column, unified_column="", description="", unit=""):
-    """Add a column description on the column_info DataFrame.
+    """Add a column description on the column_info registry.
 
-    :param DataFrame column_info: Column info DataFrame
+    :param ColumnInfo column_info: Column info registry
     :param str original_column: Original name of the column in the database
     :param str unified_column: Unified name of the column in the database. If this is not provided,
         the column will not be considered an unified column.
@@ -24,51 +26,43 @@ def add_column_2_column_info(column_info, original_column, unified_column="", de
     :param str/astropy.Unit unit: Unit of the value in the column. If the values are not number and
         thus do not have units put "N/A". If the values are number without unit put "w/o unit". Not
         providing any unit will prevent proper merging of similar columns.
+    :return ColumnInfo column_info: The updated column info registry
     """
     if unified_column != "":
-        if unified_column not in unified_cols['column'].unique():
+        unified = unified_cols.get(unified_column)
+        if unified is None:
             raise ValueError("{} is not the name of a unified column.".format(unified_column))
-        idx = unified_cols.index[unified_cols["column"] == unified_column].tolist()
-        if len(idx) > 1:
-            raise ValueError("There is several occurence of column {} in unified_cols, check it!"
-                             "".format(unified_column))
-        else:
-            idx = idx[0]
         if description != "":
             print("WARNING: For column {} you provided a unified column name, the description provided will be"
                   "ignored and the unified column description will be used instead".format(original_column))
-        description = unified_cols.loc[idx, 'description']
-        if unit != unified_cols.loc[idx, 'unit']:
+        description = unified.description
+        if (unit != unified.unit) and (get_conversion(unit, unified.unit) is None):
             print("WARNING: (column {}) The unit of the unified column in this database is different that it unit "
-                  "in the unified_cols dataframe. Right now the unit conversion is not implemented."
+                  "in the unified_cols registry and cannot be converted to it."
                   "".format(original_column))
-    return column_info.append({'original_column': original_column, 'unified_column': unified_column,
-                               'description': description, 'unit': unit},
-                              ignore_index=True)
+    column_info.add(original_column=original_column, unified_column=unified_column, description=description,
+                    unit=unit)
+    return column_info
 
 
 def create_empty_unified_cols():
-    """Create an empty unified_cols DataFrame to be used to define the unified columns.
+    """Create an empty unified_cols registry to be used to define the unified columns.
     """
-    return DataFrame({"column": [], "description": [], "unit": []})
+    return UnifiedColumns()
 
 
 def add_column_2_unified_cols(unified_info, column, description, unit):
-    """Add a column description on the column_info DataFrame.
+    """Add a column description on the unified_cols registry.
 
-    :param DataFrame unified_info: Unified column info DataFrame
-    :param str original_column: Original name of the column in the database
-    :param str unified_column: Unified name of the column in the database. If this is not provided,
-        the column will not be considered an unified column.
+    :param UnifiedColumns unified_info: Unified column info registry
+    :param str column: Name of the unified column
     :param str description: Description of the content of the column (without description of the unit).
-        If unified column is provided you should not provide this description, since the description
-        of the unified column will be used.
     :param str/astropy.Unit unit: Unit of the value in the column. If the values are not number and
-        thus do not have units put "N/A". If the values are number without unit put "w/o unit". Not
-        providing any unit will prevent proper merging of similar columns.
+        thus do not have units put "N/A". If the values are number without unit put "w/o unit".
+    :return UnifiedColumns unified_info: The updated unified column info registry
     """
-    return unified_info.append({'column': column, 'description': description, 'unit': unit},
-                               ignore_index=True)
+    unified_info.add(column=column, description=description, unit=unit)
+    return unified_info
 
 
 unified_cols = create_empty_unified_cols()
@@ -79,9 +73,11 @@ unified_cols = add_column_2_unified_cols(unified_cols, column='pl_name', descrip
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_per', description='Planetary orbital period', unit=uu.d)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_per_err_inf', description='Inferior error bar on the planetary orbital period', unit=uu.d)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_per_err_sup', description='Superior error bar on the planetary orbital period', unit=uu.d)
+unified_cols = add_column_2_unified_cols(unified_cols, column='pl_per_err', description='Error bar on the planetary orbital period', unit=uu.d)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_omega', description='*Stellar* orbital argument of periastron corresponding to the planetary one', unit=uu.deg)
 unified_cols = add_column_2_unified_cols(unified_cols, column='t_ic', description='Planetary time of inferior conjunction', unit=uu.d)
 unified_cols = add_column_2_unified_cols(unified_cols, column='t_tr', description='Planetary transit time', unit=uu.d)
+unified_cols = add_column_2_unified_cols(unified_cols, column='t_tr_err', description='Error bar on the planetary transit time', unit=uu.d)
 unified_cols = add_column_2_unified_cols(unified_cols, column='t_peri', description='Planetary periastron passage', unit=uu.d)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_inc', description='Planet orbital inclination', unit=uu.deg)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_a', description='Planet orbital semi-major axis', unit=uu.au)
@@ -103,8 +99,8 @@ unified_cols = add_column_2_unified_cols(unified_cols, column='pl_radj', descrip
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_radj_err_inf', description='Inferior error bar on planetary radius', unit=uu.R_jup)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_radj_err_sup', description='Superior error bar on planetary radius', unit=uu.R_jup)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_rad_orig', description='Origin of the planetary radius', unit='N/A')
-unified_cols = add_column_2_unified_cols(unified_cols, column='pl_g', description='Planetary surface gravity', unit=uu.m * uu.s**2)
-unified_cols = add_column_2_unified_cols(unified_cols, column='pl_rhoj', description='Planetary mean density', unit=uu.M_jup / uu.R_jup**3)
+unified_cols = add_column_2_unified_cols(unified_cols, column='pl_g', description='Planetary surface gravity', unit=uu.m / uu.s**2)
+unified_cols = add_column_2_unified_cols(unified_cols, column='pl_rhoj', description='Planetary mean density in jovian densities (M / R**3)', unit=uu.M_jup / uu.R_jup**3)
 unified_cols = add_column_2_unified_cols(unified_cols, column='pl_teq', description='Planetary equilibrium temperature', unit=uu.K)
 # Stellar physical parameters
 unified_cols = add_column_2_unified_cols(unified_cols, column='st_teff', description='Stellar effective temperature', unit=uu.K)
@@ -113,7 +109,7 @@ unified_cols = add_column_2_unified_cols(unified_cols, column='st_logg', descrip
 unified_cols = add_column_2_unified_cols(unified_cols, column='st_metal', description='Stellar metallicity', unit='dex')
 unified_cols = add_column_2_unified_cols(unified_cols, column='st_mass', description='Stellar mass', unit=uu.M_sun)
 unified_cols = add_column_2_unified_cols(unified_cols, column='st_rad', description='Stellar radius', unit=uu.R_sun)
-unified_cols = add_column_2_unified_cols(unified_cols, column='st_rho', description='Stellar mean density', unit=uu.M_sun / uu.R_sun**3)
+unified_cols = add_column_2_unified_cols(unified_cols, column='st_rho', description='Stellar mean density in solar densities (M / R**3)', unit=uu.M_sun / uu.R_sun**3)
 # Stellar RV parameter
 unified_cols = add_column_2_unified_cols(unified_cols, column='vsini', description='Stellar radial velocity rotational broadning', unit=uu.km / uu.s)
 # Star position in the sky
@@ -124,3 +120,4 @@ unified_cols = add_column_2_unified_cols(unified_cols, column='pm_dec', descript
 unified_cols = add_column_2_unified_cols(unified_cols, column='plx', description='Stellar parralaxe', unit=uu.mas)
 # Star magnitude
 unified_cols = add_column_2_unified_cols(unified_cols, column='mag_v', description='Stellar magnitude in the V band', unit=without_unit)
+unified_cols = add_column_2_unified_cols(unified_cols, column='mag_k', description='Stellar magnitude in the K band', unit=without_unit)
@@ -0,0 +1,282 @@
+"""Registries storing the description of the columns (unified columns, database columns and
+ExoDataFrame columns).
+
+This module does not import astropy, so that the ExoDataFrame can be imported without it.
+"""
+from pandas import DataFrame
+
+
+class _Record(object):
+    """Base class for the records of the column registries (one record per column)."""
+
+    __slots__ = ()
+
+    def __init__(self, *args):
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__,
+                               ", ".join(["{}={!r}".format(name, getattr(self, name)) for name in self.__slots__]))
+
+    def replace(self, **changes):
+        """Return a new record with some fields changed (the records are shared between registries and
+        should not be modified)."""
+        return self.__class__(*[changes.get(name, getattr(self, name)) for name in self.__slots__])
+
+
+class UnifiedColumn(_Record):
+    """Description of a unified column."""
+
+    __slots__ = ("column", "description", "unit")
+
+
+class DatabaseColumn(_Record):
+    """Description of a column of a database."""
+
+    __slots__ = ("original_column", "unified_column", "description", "unit")
+
+
+class _Registry(object):
+    """Base class for the column registries.
+
+    The records are stored in a list and indexed by dictionaries for O(1) lookups. The DataFrame view
+    of the registry is only built when it is requested and kept until a new record is added.
+    """
+
+    _record_class = _Record
+
+    def __init__(self):
+        self._records = []
+        self._dataframe = None
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __getitem__(self, col):
+        """Return the column col of the DataFrame view of the registry."""
+        return self.dataframe[col]
+
+    def __repr__(self):
+        return repr(self.dataframe)
+
+    def _append(self, record):
+        self._records.append(record)
+        self._dataframe = None
+
+    @property
+    def dataframe(self):
+        """DataFrame view of the registry (one row per record)"""
+        if self._dataframe is None:
+            fields = self._record_class.__slots__
+            self._dataframe = DataFrame({field: [getattr(record, field) for record in self._records]
+                                         for field in fields}, columns=list(fields))
+        return self._dataframe
+
+
+class UnifiedColumns(_Registry):
+    """Registry of the unified columns, indexed by column name."""
+
+    _record_class = UnifiedColumn
+
+    def __init__(self):
+        super(UnifiedColumns, self).__init__()
+        self._by_column = {}
+
+    def __contains__(self, column):
+        return column in self._by_column
+
+    def add(self, column, description, unit):
+        """Add a unified column to the registry.
+
+        :param str column: Name of the unified column
+        :param str description: Description of the content of the column
+        :param str/astropy.Unit unit: Unit of the value in the column
+        """
+        if column in self._by_column:
+            raise ValueError("There is several occurence of column {} in unified_cols, check it!".format(column))
+        record = UnifiedColumn(column, description, unit)
+        self._by_column[column] = record
+        self._append(record)
+
+    def get(self, column):
+        """Return the UnifiedColumn record of a column or None if it is not a unified column."""
+        return self._by_column.get(column, None)
+
+
+class ColumnInfo(_Registry):
+    """Registry of the columns of a database, indexed by original and by unified column names."""
+
+    _record_class = DatabaseColumn
+
+    def __init__(self):
+        super(ColumnInfo, self).__init__()
+        self._by_original = {}
+        self._by_unified = {}
+
+    def __contains__(self, original_column):
+        return original_column in self._by_original
+
+    def add(self, original_column, unified_column="", description="", unit=""):
+        """Add a column to the registry (see add_column_2_column_info for the parameters)."""
+        if original_column in self._by_original:
+            raise ValueError("There is several occurence of column {} in column_info, check it!"
+                             "".format(original_column))
+        if (unified_column != "") and (unified_column in self._by_unified):
+            raise ValueError("There is several columns unified as {} in column_info, check it!"
+                             "".format(unified_column))
+        record = DatabaseColumn(original_column, unified_column, description, unit)
+        self._by_original[original_column] = record
+        if unified_column != "":
+            self._by_unified[unified_column] = record
+        self._append(record)
+
+    def get_original(self, original_column):
+        """Return the DatabaseColumn record of an original column name or None if there is none."""
+        return self._by_original.get(original_column, None)
+
+    def get_unified(self, unified_column):
+        """Return the DatabaseColumn record of a unified column name or None if there is none."""
+        return self._by_unified.get(unified_column, None)
+
+    def get_renaming(self):
+        """Return the dictionary {original column name: unified column name} of the unified columns."""
+        return {original: record.unified_column for original, record in self._by_original.items()
+                if record.unified_column != ""}
+
+
+class FrameColumn(_Record):
+    """Description of a column of an ExoDataFrame.
+
+    database is the name of the database the values of the column come from ("" if the column was not
+    loaded from a database).
+    """
+
+    __slots__ = ("column", "description", "unit", "unified", "database")
+
+
+class FrameColumnInfo(_Registry):
+    """Registry of the columns of an ExoDataFrame, indexed by column name.
+
+    The registry is shared by all the ExoDataFrames derived from the same ExoDataFrame (slices,
+    copies, ...), so it is modified copy-on-write: once frozen, add and set_units raise an error and the
+    modifications are done on a copy.
+    """
+
+    _record_class = FrameColumn
+    _frozen = False
+
+    def __init__(self, records=()):
+        super(FrameColumnInfo, self).__init__()
+        self._by_column = {}
+        for record in records:
+            self._by_column[record.column] = record
+            self._records.append(record)
+
+    def __contains__(self, column):
+        return column in self._by_column
+
+    def freeze(self):
+        """Forbid the modifications of the registry and return it."""
+        self._frozen = True
+        return self
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise ValueError("This column_info is frozen (it can be shared by several ExoDataFrames), "
+                             "modify a copy of it.")
+
+    def add(self, column, description, unit, unified, database="", overwrite=False):
+        """Add a column to the registry (see ExoDataFrame.add_column_info for the parameters)."""
+        self._check_not_frozen()
+        record = FrameColumn(column, description, unit, unified, database)
+        if column in self._by_column:
+            if not(overwrite):
+                raise ValueError("{} is already in column_info !".format(column))
+            self._records[self._records.index(self._by_column[column])] = record
+            self._by_column[column] = record
+            self._dataframe = None
+            return
+        self._by_column[column] = record
+        self._append(record)
+
+    def get(self, column):
+        """Return the FrameColumn record of a column or None if there is none."""
+        return self._by_column.get(column, None)
+
+    def get_field(self, columns, field):
+        """Return the value of a field for several columns (None for the columns without record).
+
+        :param list_of_str columns: Column names
+        :param str field: Name of the field ("description", "unit", "unified" or "database")
+        :return list values: Values of the field
+        """
+        by_column = self._by_column
+        return [getattr(by_column[col], field) if col in by_column else None for col in columns]
+
+    def set_units(self, units):
+        """Change the unit of some columns (the records are replaced, not modified, since they can be
+        shared with other registries).
+
+        :param dict units: Dictionary {column name: new unit}
+        """
+        self._check_not_frozen()
+        for i, record in enumerate(self._records):
+            if record.column in units:
+                new_record = record.replace(unit=units[record.column])
+                self._records[i] = new_record
+                self._by_column[record.column] = new_record
+        self._dataframe = None
+
+    def copy(self):
+        """Return a (not frozen) copy of the registry (the records are shared)."""
+        return FrameColumnInfo(self._records)
+
+    def subset(self, columns):
+        """Return a new registry with only the records of some columns.
+
+        :param list_of_str columns: Columns to keep
+        :return FrameColumnInfo column_info: Registry of the columns
+        """
+        columns = set(columns)
+        return FrameColumnInfo([record for record in self._records if record.column in columns])
+
+    def renamed(self, mapping):
+        """Return a new registry where the columns are renamed according to mapping.
+
+        :param dict mapping: Dictionary {old column name: new column name}
+        :return FrameColumnInfo column_info: Renamed registry
+        """
+        return FrameColumnInfo([record.replace(column=mapping[record.column]) if record.column in mapping else record
+                                for record in self._records])
+
+    def merged(self, other, columns, suffixes=('_x', '_y')):
+        """Return the registry of the columns of the merge of two ExoDataFrames.
+
+        :param FrameColumnInfo other: Registry of the right ExoDataFrame
+        :param list_of_str columns: Columns of the merged ExoDataFrame
+        :param tuple_of_str suffixes: Suffixes used for the overlapping columns in the merge
+        :return FrameColumnInfo column_info: Registry of the merged ExoDataFrame
+        """
+        records = []
+        for column in columns:
+            record = self.get(column)
+            if record is None:
+                record = other.get(column)
+            if (record is None) and isinstance(column, str):
+                for suffix, registry in zip(suffixes, (self, other)):
+                    if suffix and column.endswith(suffix) and (column[:-len(suffix)] in registry):
+                        original = registry.get(column[:-len(suffix)])
+                        record = original.replace(column=column)
+                        break
+            if record is None:
+                record = FrameColumn(column, "", "", False, "")
+            records.append(record)
+        return FrameColumnInfo(records)
+
+
+# Registry of the ExoDataFrames without column information, shared by all of them
+empty_frame_column_info = FrameColumnInfo().freeze()
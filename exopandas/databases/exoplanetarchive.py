@@ -4,8 +4,11 @@ from pandas import read_csv
 import astropy.units as uu
 
 from .column_info import create_empty_column_info, add_column_2_column_info, non_app, without_unit
+from .projection import get_column_selector
 
 
+database_file = expanduser("~/Data/exoplanet_database/exoplanet_archive/planets.csv")
+
 column_info = create_empty_column_info()
 column_info = add_column_2_column_info(column_info=column_info, original_column='pl_hostname', unified_column='st_name',
                                        description='', unit=non_app)
@@ -71,8 +74,13 @@ column_info = add_column_2_column_info(column_info=column_info, original_column=
                                        description='', unit=uu.mas / uu.yr)
 
 
-def load_db():
+def load_db(columns=None, chunksize=None):
     """Load the database exoplanet.et as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
     """
-    return read_csv(expanduser("~/Data/exoplanet_database/exoplanet_archive/planets.csv"),
-                    comment="#")
+    return read_csv(database_file, comment="#", usecols=None if columns is None else get_column_selector(columns),
+                    chunksize=chunksize)
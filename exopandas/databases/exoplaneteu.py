@@ -1,7 +1,7 @@
-from PyAstronomy import pyasl
 import astropy.units as uu
 
 from .column_info import create_empty_column_info, add_column_2_column_info, non_app, without_unit
+from .projection import select_columns
 
 
 column_info = create_empty_column_info()
@@ -31,8 +31,6 @@ column_info = add_column_2_column_info(column_info=column_info, original_column=
                                        description='', unit=uu.au)
 column_info = add_column_2_column_info(column_info=column_info, original_column='impact_parameter', unified_column='b',
                                        description='', unit=without_unit)
-column_info = add_column_2_column_info(column_info=column_info, original_column='radius', unified_column='pl_radj',
-                                       description='', unit=uu.R_jup)
 column_info = add_column_2_column_info(column_info=column_info, original_column='radius_detection_type', unified_column='pl_rad_orig',
                                        description='', unit=non_app)
 column_info = add_column_2_column_info(column_info=column_info, original_column='mass', unified_column='pl_massj',
@@ -70,7 +68,14 @@ column_info = add_column_2_column_info(column_info=column_info, original_column=
 column_info = add_column_2_column_info(column_info=column_info, original_column='radius_error_max', unified_column='pl_radj_err_sup',
                                        description='', unit=uu.R_jup)
 
-def load_db():
+def load_db(columns=None):
     """Load the database exoplanet.et as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
     """
-    return pyasl.ExoplanetEU2().getAllDataPandas()
+    from PyAstronomy import pyasl
+    db = pyasl.ExoplanetEU2().getAllDataPandas()
+    if columns is not None:
+        db = db[select_columns(db.columns, columns)]
+    return db
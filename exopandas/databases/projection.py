@@ -0,0 +1,68 @@
+"""Selection of the columns to read from the database sources (projection pushdown).
+
+When only some columns of a database are requested, the loaders only read these columns and their
+error bars. The error bars of a column X are the columns named X followed by an error suffix matching
+error_suffix_pattern: "err1", "err2" and "lim" (exoplanet archive), "_err", "_erru" and "_errd"
+(TEPCat), "_error_min" and "_error_max" (exoplanet.eu).
+"""
+from inspect import signature
+from re import compile as compile_re
+
+
+error_suffix_pattern = compile_re(r"^_?(err|error)\w*$|^lim$")
+
+
+def get_original_columns(column_info, columns):
+    """Return the original names of requested columns and of their unified error bars.
+
+    :param ColumnInfo column_info: column_info of the database
+    :param list_of_str columns: Requested columns (unified or original names)
+    :return list_of_str original_columns: Original names of the columns to read
+    """
+    original_columns = []
+    for column in columns:
+        for name in [column, ] + ["{}{}".format(column, suffix) for suffix in ("_err_inf", "_err_sup", "_err")]:
+            record = column_info.get_unified(name)
+            if record is not None:
+                original_columns.append(record.original_column)
+            elif name == column:
+                original_columns.append(column)
+    return list(dict.fromkeys(original_columns))
+
+
+def get_column_selector(columns):
+    """Return a function telling if a column should be read (to be used as usecols of pandas.read_csv).
+
+    :param list_of_str columns: Original names of the columns to read
+    :return function selector: Function returning True for the columns and their error bars
+    """
+    columns = set(columns)
+
+    def selector(column):
+        if column in columns:
+            return True
+        column = str(column)
+        for col in columns:
+            if column.startswith(str(col)) and (error_suffix_pattern.match(column[len(str(col)):]) is not None):
+                return True
+        return False
+    return selector
+
+
+def select_columns(available, columns):
+    """Return the columns and their error bars among the available columns.
+
+    :param list_of_str available: Available columns
+    :param list_of_str columns: Original names of the columns to select
+    :return list_of_str selected: Selected columns, in the order of available
+    """
+    selector = get_column_selector(columns)
+    return [column for column in available if selector(column)]
+
+
+def supports_projection(load_db):
+    """Return True if the load_db function of a database accepts the columns argument."""
+    try:
+        return "columns" in signature(load_db).parameters
+    except (TypeError, ValueError):
+        return False
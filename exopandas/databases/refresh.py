@@ -0,0 +1,72 @@
+"""Row-level differences between two versions of a database.
+
+The rows of the two versions are identified by the values of the key column of the database (see the
+key of the database registry). The difference is used by ExoDataFrame.refresh to patch an
+ExoDataFrame with only the rows which changed, instead of reloading and merging everything again.
+"""
+from pandas import Index
+
+
+class DatabaseDiff(object):
+    """Difference between two versions of a database.
+
+    :attribute DataFrame inserted: Rows of the new version whose key is not in the previous version
+    :attribute DataFrame updated: Rows of the new version whose values changed
+    :attribute Index deleted: Keys of the rows of the previous version which are not in the new version
+    """
+
+    __slots__ = ("key", "inserted", "updated", "deleted")
+
+    def __init__(self, key, inserted, updated, deleted):
+        self.key = key
+        self.inserted = inserted
+        self.updated = updated
+        self.deleted = deleted
+
+    def __len__(self):
+        return len(self.inserted) + len(self.updated) + len(self.deleted)
+
+    def __repr__(self):
+        return ("{}(key={!r}, inserted={}, updated={}, deleted={})"
+                "".format(self.__class__.__name__, self.key, len(self.inserted), len(self.updated),
+                          len(self.deleted)))
+
+
+def _check_key(db, key, version):
+    if key not in db.columns:
+        raise ValueError("The key column {} is not in the {} version of the database.".format(key, version))
+    if db[key].duplicated().any():
+        raise ValueError("The key column {} of the {} version of the database is not unique: {}"
+                         "".format(key, version, list(db[key][db[key].duplicated()].unique()[:5])))
+
+
+def diff_databases(previous, new, key):
+    """Return the rows inserted, updated and deleted between two versions of a database.
+
+    Two missing values are considered equal. If the columns of the two versions are different, all
+    the rows of the new version which are in the previous one are considered updated.
+
+    :param DataFrame previous: Previous version of the database
+    :param DataFrame new: New version of the database
+    :param str key: Name of the column identifying the rows
+    :return DatabaseDiff diff: Difference between the two versions
+    """
+    _check_key(previous, key, "previous")
+    _check_key(new, key, "new")
+    previous_keys = Index(previous[key])
+    new_keys = Index(new[key])
+    inserted = ~new_keys.isin(previous_keys)
+    deleted = previous_keys[~previous_keys.isin(new_keys)]
+    if list(previous.columns) != list(new.columns):
+        updated = ~inserted
+    else:
+        # Align the common rows of the previous version on the new version and compare all the columns
+        # at once
+        columns = [col for col in new.columns if col != key]
+        aligned = previous.iloc[previous_keys.get_indexer(new_keys[~inserted])][columns]
+        common = new[~inserted][columns]
+        aligned.index = common.index
+        changed = ((aligned != common) & ~(aligned.isna() & common.isna())).any(axis=1).to_numpy()
+        updated = ~inserted
+        updated[~inserted] = changed
+    return DatabaseDiff(key=key, inserted=new[inserted], updated=new[updated], deleted=deleted)
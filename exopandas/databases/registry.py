@@ -0,0 +1,157 @@
+"""Registry of the databases available in exopandas.
+
+The column_info, load_db and source_file of a database are only resolved (and the corresponding
+module imported) when they are accessed for the first time. Like this importing exopandas does not
+import the heavy backends (PyAstronomy, astropy) of the databases that are not used.
+
+A database is registered with references of the form "module:attribute" (like entry points) or
+directly with the objects. Databases provided by other packages are registered through the entry
+points of the group "exopandas.databases". Each entry point must load to a dictionary with the keys
+"column_info", "load_db" and optionally "source_file" (objects or "module:attribute" references),
+"key" (original name of the column identifying the rows, used by ExoDataFrame.refresh) and "merge_on"
+(unified column on which the database is merged by default, "pl_name" if not provided).
+"""
+from collections.abc import Mapping
+from importlib import import_module
+from re import compile as compile_re
+
+
+entry_point_group = "exopandas.databases"
+
+_reference_pattern = compile_re(r"^[\w.]+:[\w.]+$")
+
+
+def is_reference(value):
+    """Return True if value is a reference of the form "module:attribute"."""
+    return isinstance(value, str) and (_reference_pattern.match(value) is not None)
+
+
+def resolve_reference(reference):
+    """Return the object designated by a reference of the form "module:attribute".
+
+    :param str reference: Reference to the object
+    :return object obj: The referenced object
+    """
+    module, _, attribute = reference.partition(":")
+    obj = import_module(module)
+    for attr in attribute.split(".") if attribute else []:
+        obj = getattr(obj, attr)
+    return obj
+
+
+class DatabaseEntry(Mapping):
+    """Description of a database ("column_info", "load_db", "source_file", "key" and "merge_on"), resolved
+    lazily."""
+
+    keys_entry = ("column_info", "load_db", "source_file", "key", "merge_on")
+
+    def __init__(self, column_info, load_db, source_file=None, key=None, merge_on="pl_name"):
+        self._values = {"column_info": column_info, "load_db": load_db, "source_file": source_file, "key": key,
+                        "merge_on": merge_on}
+        self._resolved = {}
+
+    def __getitem__(self, key):
+        if key not in self._resolved:
+            value = self._values[key]
+            self._resolved[key] = resolve_reference(value) if is_reference(value) else value
+        return self._resolved[key]
+
+    def __iter__(self):
+        return iter(self.keys_entry)
+
+    def __len__(self):
+        return len(self.keys_entry)
+
+
+class DatabaseRegistry(Mapping):
+    """Mapping database name -> DatabaseEntry.
+
+    The entry points of the group entry_point_group are discovered the first time the registry is
+    searched or iterated.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._entry_points = {}
+        self._discovered = False
+
+    def register(self, name, column_info, load_db, source_file=None, key=None, merge_on="pl_name"):
+        """Register a database.
+
+        :param str name: Name of the database
+        :param str/ColumnInfo column_info: column_info of the database or "module:attribute" reference to it
+        :param str/function load_db: Function loading the database or "module:attribute" reference to it
+        :param str source_file: Path to the source file of the database (None if there is none) or
+            "module:attribute" reference to it
+        :param str key: Original name of the column whose values identify the rows of the database (None if
+            there is none)
+        :param str merge_on: Unified column on which the database is merged by default (see
+            ExoDataFrame.merge), for example "st_name" for a catalog of stars
+        """
+        self._entries[name] = DatabaseEntry(column_info=column_info, load_db=load_db, source_file=source_file,
+                                            key=key, merge_on=merge_on)
+
+    def unregister(self, name):
+        """Remove a database from the registry.
+
+        :param str name: Name of the database
+        """
+        self._entries.pop(name)
+
+    def names(self, discover=True):
+        """Return the names of the registered databases.
+
+        :param bool discover: If True, the databases provided by the entry points are included.
+        """
+        if discover:
+            self._discover()
+        return list(self._entries.keys()) + [name for name in self._entry_points if name not in self._entries]
+
+    def _discover(self):
+        """Discover the databases provided by the entry points of the group entry_point_group."""
+        if self._discovered:
+            return
+        self._discovered = True
+        from importlib.metadata import entry_points
+        try:
+            eps = entry_points(group=entry_point_group)
+        except TypeError:  # python < 3.10
+            eps = entry_points().get(entry_point_group, [])
+        for ep in eps:
+            self._entry_points.setdefault(ep.name, ep)
+
+    def __getitem__(self, name):
+        if name not in self._entries:
+            self._discover()
+            if name not in self._entry_points:
+                raise KeyError(name)
+            self.register(name, **self._entry_points.pop(name).load())
+        return self._entries[name]
+
+    def __contains__(self, name):
+        if name in self._entries:
+            return True
+        self._discover()
+        return name in self._entry_points
+
+    def __iter__(self):
+        return iter(self.names())
+
+    def __len__(self):
+        return len(self.names())
+
+
+dico_databases = DatabaseRegistry()
+dico_databases.register("exoplaneteu", column_info="exopandas.databases.exoplaneteu:column_info",
+                        load_db="exopandas.databases.exoplaneteu:load_db", key="name")
+dico_databases.register("exoplanetarchive", column_info="exopandas.databases.exoplanetarchive:column_info",
+                        load_db="exopandas.databases.exoplanetarchive:load_db",
+                        source_file="exopandas.databases.exoplanetarchive:database_file", key="pl_name")
+dico_databases.register("sweetcat", column_info="exopandas.databases.sweetcat:column_info",
+                        load_db="exopandas.databases.sweetcat:load_db", key="star", merge_on="st_name")
+for name, code, key in [("tepcat well-studied", "WS", "System"), ("tepcat planning", "Pl", "System"),
+                        ("tepcat little-studied", "LS", "System"), ("tepcat homogeneous-meas", "HM", None),
+                        ("tepcat homogeneous-phys", "HP", None), ("tepcat obliquity", "Ob", None)]:
+    dico_databases.register(name, column_info="exopandas.databases.tepcat:column_info_{}".format(code),
+                            load_db="exopandas.databases.tepcat:load_db_{}".format(code),
+                            source_file="exopandas.databases.tepcat:database_file_{}".format(code), key=key)
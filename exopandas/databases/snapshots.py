@@ -0,0 +1,348 @@
+"""Versioned store of the snapshots of the databases, to load a database as it was at a given date.
+
+Each snapshot of a database (the DataFrame returned by its load_db function) is stored in snapshot_folder
+as content-addressed objects, named by the hash of their content, so that what did not change between
+two snapshots is stored only once:
+- the columns are cut into blocks of rows. The boundaries of the blocks are defined by the values of
+  the key column of the database (a row ends a block when the hash of its key is a multiple of
+  block_rows), so that inserting or deleting a row only changes the block which contains it. The
+  databases without key are cut in blocks of block_rows rows. Each block of each column is stored in
+  a compressed (zstd) Arrow IPC file,
+- a column is stored as the list of the hashes of its blocks, and a version of the database as the
+  hashes of its Arrow schema (with the pandas metadata which restores the dtypes) and of its columns.
+The snapshot index of a database (a JSON file of snapshot_folder) lists the dates at which the version
+of the database changed. Saving a snapshot identical to the last one doesn't store anything, so the size
+of the store only depends on the amount of change, not on the number of snapshots.
+
+Snapshots are taken with take_snapshot (for example by a daily job) or automatically each time a
+database is read from its source through the cache if auto_snapshot is True.
+"""
+from datetime import date as date_type, datetime
+from hashlib import blake2b
+from json import dumps, loads
+from os import listdir, makedirs, remove, replace, walk
+from os.path import basename, dirname, expanduser, getsize, isdir, isfile, join
+from tempfile import mkstemp
+from threading import RLock
+
+from numpy import flatnonzero, uint64
+
+from .projection import select_columns
+
+
+snapshot_folder = expanduser("~/Data/exoplanet_database/snapshots")
+block_rows = 256  # Average number of rows of the blocks
+max_block_rows = 4 * block_rows
+auto_snapshot = False  # If True, a snapshot is saved each time a database is read from its source by the cache
+
+date_format = "%Y-%m-%dT%H:%M:%S.%f"
+
+# Serialise the modifications of the store between the threads
+_store_lock = RLock()
+
+
+def _get_objects_folder():
+    return join(snapshot_folder, "objects")
+
+
+def _get_object_path(digest, extension):
+    return join(_get_objects_folder(), digest[:2], "{}.{}".format(digest[2:], extension))
+
+
+def _get_index_path(database):
+    return join(snapshot_folder, "{}.json".format(blake2b(database.encode(), digest_size=8).hexdigest()))
+
+
+def _write_atomic(path, content):
+    """Write bytes in a file (through a temporary file, so that the file is never partially written)."""
+    makedirs(dirname(path), exist_ok=True)
+    # The temporary file is unique, several processes can write the same object at the same time
+    fd, tmp_path = mkstemp(dir=dirname(path), prefix=basename(path) + ".", suffix=".tmp")
+    with open(fd, "wb") as f:
+        f.write(content)
+    replace(tmp_path, path)
+
+
+def _put_bytes(content, extension):
+    """Store bytes in the store and return their hash."""
+    digest = blake2b(content, digest_size=16).hexdigest()
+    path = _get_object_path(digest, extension)
+    if not(isfile(path)):
+        _write_atomic(path, content)
+    return digest
+
+
+def _get_bytes(digest, extension):
+    with open(_get_object_path(digest, extension), "rb") as f:
+        return f.read()
+
+
+def _put_json(obj):
+    """Store a JSON object in the store and return its hash."""
+    return _put_bytes(dumps(obj, sort_keys=True).encode(), "json")
+
+
+def _get_json(digest):
+    return loads(_get_bytes(digest, "json"))
+
+
+def _put_block(array):
+    """Store a block of a column (Arrow array) in the store and return its hash."""
+    from pyarrow import BufferOutputStream, RecordBatch, ipc
+    batch = RecordBatch.from_arrays([array], names=["block"])
+    h = blake2b(str(array.type).encode(), digest_size=16)
+    h.update(batch.serialize())
+    digest = h.hexdigest()
+    path = _get_object_path(digest, "arrow")
+    if not(isfile(path)):
+        stream = BufferOutputStream()
+        with ipc.new_file(stream, batch.schema, options=ipc.IpcWriteOptions(compression="zstd")) as writer:
+            writer.write_batch(batch)
+        _write_atomic(path, stream.getvalue().to_pybytes())
+    return digest
+
+
+def _get_block(digest):
+    from pyarrow import ipc
+    with ipc.open_file(_get_object_path(digest, "arrow")) as reader:
+        return reader.get_batch(0).column(0)
+
+
+def get_block_boundaries(db, key=None):
+    """Return the starts of the blocks of rows of a DataFrame (see the module docstring).
+
+    :param DataFrame db: DataFrame
+    :param str key: Column whose values define the boundaries (None for blocks of block_rows rows)
+    :return list_of_int starts: First row of each block, followed by the number of rows
+    """
+    n_rows = len(db)
+    if (key is None) or (key not in db.columns):
+        return list(range(0, n_rows, block_rows)) + [n_rows, ]
+    from pandas.util import hash_pandas_object
+    hashes = hash_pandas_object(db[key], index=False).to_numpy()
+    ends = (flatnonzero(hashes % uint64(block_rows) == 0) + 1).tolist()
+    starts = [0, ]
+    for end in ends + [n_rows, ]:
+        # The blocks are cut to max_block_rows rows
+        while end - starts[-1] > max_block_rows:
+            starts.append(starts[-1] + max_block_rows)
+        if end > starts[-1]:
+            starts.append(end)
+    if starts[-1] != n_rows:
+        starts.append(n_rows)
+    return starts
+
+
+def get_timestamp(date=None, end_of_day=False):
+    """Return the UTC timestamp string of a date.
+
+    :param str/datetime/date date: Date (ISO string, datetime, date or pandas Timestamp). The dates
+        without time zone are in UTC. If None, the current time.
+    :param bool end_of_day: If True the dates without time (date or "YYYY-MM-DD" string) are taken at
+        the end of the day, otherwise at its beginning.
+    :return str timestamp: Timestamp (see date_format), which can be compared as strings
+    """
+    from pandas import Timedelta, Timestamp
+    if date is None:
+        return Timestamp.now(tz="UTC").strftime(date_format)
+    day_only = ((isinstance(date, date_type) and not(isinstance(date, datetime))) or
+                (isinstance(date, str) and (len(date.strip()) == 10)))
+    timestamp = Timestamp(date)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    timestamp = timestamp.tz_convert("UTC")
+    if day_only and end_of_day:
+        timestamp = timestamp + Timedelta(days=1) - Timedelta(microseconds=1)
+    return timestamp.strftime(date_format)
+
+
+def _read_index(database):
+    """Return the snapshot index of a database: list of [timestamp, version hash] sorted by timestamp."""
+    path = _get_index_path(database)
+    if not(isfile(path)):
+        return []
+    with open(path, "rb") as f:
+        return loads(f.read())["snapshots"]
+
+
+def _write_index(database, snapshots):
+    _write_atomic(_get_index_path(database), dumps({"database": database, "snapshots": snapshots},
+                                                   indent=1).encode())
+
+
+def save_snapshot(database, db, key=None, date=None):
+    """Store a version of a database in the snapshot store.
+
+    :param str database: Name of the database
+    :param DataFrame db: DataFrame returned by the load_db function of the database
+    :param str key: Column identifying the rows, used to cut the columns in blocks (see the key of the
+        database registry)
+    :param str/datetime/date date: Date of the version (see get_timestamp). If None, the current time.
+    :return str version: Hash of the version
+    """
+    from pyarrow import Table
+    table = Table.from_pandas(db, preserve_index=not(_has_default_index(db)))
+    starts = get_block_boundaries(db, key=key)
+    columns = []
+    with _store_lock:
+        for name, column in zip(table.column_names, table.columns):
+            array = column.combine_chunks()
+            blocks = [_put_block(array.slice(start, stop - start)) for start, stop in zip(starts[:-1], starts[1:])]
+            columns.append([name, _put_json(blocks)])
+        schema = _put_bytes(table.schema.serialize().to_pybytes(), "schema")
+        version = _put_json({"schema": schema, "columns": columns, "n_rows": len(db)})
+        timestamp = get_timestamp(date)
+        snapshots = _read_index(database)
+        position = len([snapshot for snapshot in snapshots if snapshot[0] <= timestamp])
+        previous = snapshots[position - 1][1] if position > 0 else None
+        following = snapshots[position][1] if position < len(snapshots) else None
+        if version != previous:
+            if version == following:
+                # The following snapshot is the same version, it starts earlier
+                snapshots[position][0] = timestamp
+            else:
+                snapshots.insert(position, [timestamp, version])
+            _write_index(database, snapshots)
+    return version
+
+
+def _has_default_index(db):
+    from pandas import RangeIndex
+    return isinstance(db.index, RangeIndex) and (db.index.start == 0) and (db.index.step == 1)
+
+
+def get_snapshots(database):
+    """Return the snapshots of a database.
+
+    :param str database: Name of the database
+    :return list_of_tuple snapshots: (timestamp, version hash) of the versions of the database, sorted by
+        timestamp. The version of a snapshot is valid until the timestamp of the following one.
+    """
+    with _store_lock:
+        return [tuple(snapshot) for snapshot in _read_index(database)]
+
+
+def get_version(database, as_of):
+    """Return the hash of the version of a database at a date (None if there is no older snapshot).
+
+    :param str database: Name of the database
+    :param str/datetime/date as_of: Date (see get_timestamp, the dates without time are taken at the
+        end of the day)
+    """
+    timestamp = get_timestamp(as_of, end_of_day=True)
+    version = None
+    for snapshot_timestamp, snapshot_version in get_snapshots(database):
+        if snapshot_timestamp > timestamp:
+            break
+        version = snapshot_version
+    return version
+
+
+def read_snapshot(database, as_of, columns=None):
+    """Return a database as it was at a date.
+
+    :param str database: Name of the database
+    :param str/datetime/date as_of: Date (see get_version)
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :return DataFrame db: Version of the database at the date
+    """
+    from pyarrow import Table, chunked_array, ipc, py_buffer, schema as make_schema
+    version = get_version(database, as_of)
+    if version is None:
+        raise ValueError("There is no snapshot of database {} older than {}.".format(database, as_of))
+    obj = _get_json(version)
+    schema = ipc.read_schema(py_buffer(_get_bytes(obj["schema"], "schema")))
+    pandas_columns = [name for name, _ in obj["columns"]
+                      if not(name.startswith("__index_level_"))]
+    if columns is not None:
+        selected = set(select_columns(pandas_columns, [str(col) for col in columns]))
+        selected |= {name for name, _ in obj["columns"] if name.startswith("__index_level_")}
+    else:
+        selected = None
+    arrays = []
+    fields = []
+    for name, column in obj["columns"]:
+        if (selected is not None) and (name not in selected):
+            continue
+        field = schema.field(name)
+        arrays.append(chunked_array([_get_block(digest) for digest in _get_json(column)], type=field.type))
+        fields.append(field)
+    table = Table.from_arrays(arrays, schema=make_schema(fields, metadata=schema.metadata))
+    return table.to_pandas()
+
+
+def take_snapshot(database, date=None):
+    """Load a database from its source and store it in the snapshot store.
+
+    :param str database: Name of the database
+    :param str/datetime/date date: Date of the snapshot (see get_timestamp). If None, the current time.
+    :return str version: Hash of the version
+    """
+    from .registry import dico_databases
+    entry = dico_databases[database]
+    return save_snapshot(database, entry["load_db"](), key=entry["key"], date=date)
+
+
+def _get_referenced_objects():
+    """Return the paths of the objects referenced by the snapshots of all the databases."""
+    referenced = set()
+    for path in _get_index_paths():
+        with open(path, "rb") as f:
+            snapshots = loads(f.read())["snapshots"]
+        for version in set([snapshot[1] for snapshot in snapshots]):
+            referenced.add(_get_object_path(version, "json"))
+            obj = _get_json(version)
+            referenced.add(_get_object_path(obj["schema"], "schema"))
+            for _, column in obj["columns"]:
+                referenced.add(_get_object_path(column, "json"))
+                referenced.update([_get_object_path(block, "arrow") for block in _get_json(column)])
+    return referenced
+
+
+def _get_index_paths():
+    """Return the paths of the snapshot indexes of all the databases."""
+    if not(isdir(snapshot_folder)):
+        return []
+    return [join(snapshot_folder, filename) for filename in listdir(snapshot_folder) if filename.endswith(".json")]
+
+
+def clear_snapshots(database=None, before=None):
+    """Remove the snapshots of a database (or of all the databases) and the objects no longer used.
+
+    :param str database: Name of the database. If None, the snapshots of all the databases are removed.
+    :param str/datetime/date before: If provided, only the versions which were replaced before this
+        date are removed (the version valid at this date is kept).
+    """
+    with _store_lock:
+        if database is None:
+            paths = _get_index_paths()
+        else:
+            paths = [_get_index_path(database), ] if isfile(_get_index_path(database)) else []
+        for path in paths:
+            if before is None:
+                remove(path)
+                continue
+            with open(path, "rb") as f:
+                index = loads(f.read())
+            snapshots = index["snapshots"]
+            timestamp = get_timestamp(before, end_of_day=True)
+            kept = [snapshot for i, snapshot in enumerate(snapshots)
+                    if (i == len(snapshots) - 1) or (snapshots[i + 1][0] > timestamp)]
+            _write_index(index["database"], kept)
+        # Garbage collection of the objects which are not referenced by the remaining snapshots
+        objects_folder = _get_objects_folder()
+        if not(isdir(objects_folder)):
+            return
+        referenced = _get_referenced_objects()
+        for subfolder in listdir(objects_folder):
+            for filename in listdir(join(objects_folder, subfolder)):
+                path = join(objects_folder, subfolder, filename)
+                if path not in referenced:
+                    remove(path)
+
+
+def get_store_size():
+    """Return the total size in bytes of the snapshot store."""
+    return sum([getsize(join(folder, filename)) for folder, _, filenames in walk(snapshot_folder)
+                for filename in filenames])
@@ -0,0 +1,82 @@
+"""Row filters and chunked loading of the databases.
+
+A filter is a tuple (column, operator, value), for example ("pl_per", "<", 10) or
+("pl_tranflag", "==", 1), and a list of filters keeps the rows which satisfy all of them (like the
+filters of pandas.read_parquet). The operators are the ones of comparison_operators. The rows for
+which the column is missing never satisfy a filter, except with "!=" and "not in".
+
+The databases can be read by chunks of rows, so that the rows are filtered chunk by chunk and the
+full database never needs to be in memory. The load_db functions which accept a chunksize argument
+return an iterator over the chunks of the database. For the others the full database is loaded and
+then split in chunks.
+"""
+from inspect import signature
+from operator import eq, ge, gt, le, lt, ne
+
+from numpy import ones
+
+
+comparison_operators = {"==": eq, "!=": ne, "<": lt, "<=": le, ">": gt, ">=": ge,
+                        "in": lambda serie, value: serie.isin(value),
+                        "not in": lambda serie, value: ~serie.isin(value),
+                        }
+
+
+def check_filters(filters):
+    """Check the filters and return them as a list of (column, operator, value) tuples.
+
+    :param list_of_tuple filters: Filters (a single filter tuple is also accepted)
+    :return list_of_tuple filters: Filters
+    """
+    if filters is None:
+        return []
+    if isinstance(filters, tuple):
+        filters = [filters, ]
+    filters = list(filters)
+    for filt in filters:
+        if not(isinstance(filt, tuple)) or (len(filt) != 3):
+            raise ValueError("A filter should be a tuple (column, operator, value), got {}.".format(filt))
+        if filt[1] not in comparison_operators:
+            raise ValueError("{} is not a valid filter operator, use one of {}."
+                             "".format(filt[1], list(comparison_operators)))
+    return filters
+
+
+def get_filter_columns(filters):
+    """Return the columns used by the filters."""
+    return list(dict.fromkeys([filt[0] for filt in check_filters(filters)]))
+
+
+def get_filter_mask(df, filters):
+    """Return the boolean mask of the rows of df which satisfy all the filters.
+
+    :param DataFrame df: DataFrame to filter
+    :param list_of_tuple filters: Filters
+    :return array mask: True for the rows to keep
+    """
+    mask = ones(len(df), dtype=bool)
+    for column, operator, value in check_filters(filters):
+        if column not in df.columns:
+            raise ValueError("Column {} used in a filter is not in the database.".format(column))
+        mask &= comparison_operators[operator](df[column], value).to_numpy(dtype=bool, na_value=False)
+    return mask
+
+
+def supports_chunks(load_db):
+    """Return True if the load_db function of a database accepts the chunksize argument."""
+    try:
+        return "chunksize" in signature(load_db).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def iter_chunks(db, chunksize):
+    """Split a DataFrame in chunks of chunksize rows.
+
+    :param DataFrame db: DataFrame to split
+    :param int chunksize: Number of rows of each chunk
+    :return generator chunks: Generator over the chunks (at least one, possibly empty)
+    """
+    yield db.iloc[:chunksize]
+    for start in range(chunksize, len(db), chunksize):
+        yield db.iloc[start: start + chunksize]
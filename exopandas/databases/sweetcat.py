@@ -1,7 +1,7 @@
 import astropy.units as uu
-from PyAstronomy.pyasl import SWEETCat
 
 from .column_info import create_empty_column_info, add_column_2_column_info, non_app, without_unit
+from .projection import select_columns
 
 
 column_info = create_empty_column_info()
@@ -25,7 +25,14 @@ column_info = add_column_2_column_info(column_info=column_info, original_column=
                                        description='', unit=uu.mas)
 
 
-def load_db():
+def load_db(columns=None):
     """Load the database exoplanet.et as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
     """
-    return SWEETCat().data
+    from PyAstronomy.pyasl import SWEETCat
+    db = SWEETCat().data
+    if columns is not None:
+        db = db[select_columns(db.columns, columns)]
+    return db
@@ -1,64 +1,278 @@
-from os.path import expanduser, join
-
-from pandas import read_table
+from io import StringIO
+from itertools import islice
+from os import stat
+from os.path import expanduser, isfile, join
+
+from numpy import where
+from pandas import read_csv
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_string_dtype
 import astropy.units as uu
 
+from ..profiling import stage
 from .column_info import create_empty_column_info, add_column_2_column_info, non_app, without_unit
+from .projection import select_columns
 
 
 database_main_folder = expanduser("~/Data/exoplanet_database/TEPCat")
+database_file_WS = join(database_main_folder, "well-studied/allplanets-csv.csv")
+database_file_Pl = join(database_main_folder, "obs_planning/observables.csv")
+database_file_LS = join(database_main_folder, "well-studied/kepplanets-csv.csv")
+database_file_HM = join(database_main_folder, "homogeneous/homogeneous-input-csv.csv")
+database_file_HP = join(database_main_folder, "homogeneous/homogeneous-par-csv.csv")
+database_file_Ob = join(database_main_folder, "obliquity/obliquity.csv")
+
+
+# Schemas of the TEPCat files already read {filename: (version, names, numerical columns, blanks)}
+_schemas = {}
+# TEPCat files whose numerical columns cannot be parsed as floats by Arrow (see _read_arrow)
+_untyped_files = set()
+# Names of columns already reported as different from the header of their file (see _check_names)
+_checked_names = set()
+# Number of rows used to find the numerical columns of a file
+n_rows_schema = 100
+
+
+def _strip_names(db):
+    """Remove the white spaces around the system names and references (in place) and return db."""
+    with stage("strip"):
+        for col in ["System", "Discovery_reference", "Recent_reference"]:
+            if (col in db.columns) and is_string_dtype(db[col]):
+                db[col] = db[col].str.strip()
+    return db
+
+
+def _get_unique_names(names):
+    """Return names where the duplicated names X are renamed X.1, X.2, ... (like pandas.read_csv)."""
+    unique_names = []
+    for name in names:
+        unique_name = name
+        i = 0
+        while unique_name in unique_names:
+            i += 1
+            unique_name = "{}.{}".format(name, i)
+        unique_names.append(unique_name)
+    return unique_names
+
+
+def get_schema(filename):
+    """Return the schema of a TEPCat csv file.
+
+    The header of the file is parsed and its first n_rows_schema rows are read to find the numerical
+    columns and the missing values written with white spaces. The schema is cached until the file is
+    modified.
+
+    :param str filename: Path to the file
+    :return list_of_str names: Names of the columns in the header of the file (duplicated names X are
+        renamed X.1, X.2, ...)
+    :return set_of_str numerical: Names of the numerical columns
+    :return list_of_str blanks: Values made of white spaces found in the first rows (the missing values
+        of the padded columns)
+    """
+    stat_file = stat(filename)
+    version = (stat_file.st_mtime_ns, stat_file.st_size)
+    if (filename in _schemas) and (_schemas[filename][0] == version):
+        return _schemas[filename][1:]
+    with open(filename) as f:
+        names = _get_unique_names([name.strip() for name in f.readline().rstrip("\r\n").split(",")])
+        sample = "".join(islice(f, n_rows_schema))
+    blanks = sorted({field for line in sample.splitlines() for field in line.split(",")
+                     if (field != "") and (field.strip() == "")})
+    sample = read_csv(StringIO(sample), header=None, names=names, sep=',', skipinitialspace=True)
+    numerical = {name for name, dtype in sample.dtypes.items() if is_numeric_dtype(dtype) and
+                 not(is_bool_dtype(dtype))}
+    _schemas[filename] = (version, names, numerical, blanks)
+    _untyped_files.discard(filename)
+    return names, numerical, blanks
+
+
+def _check_names(filename, names, header_names):
+    """Print a warning if the names of the columns of a file differ from the names of its header.
+
+    The columns are read by position, so a different header means that the file format may have
+    changed. The warning is only printed once for a file and its names.
+    """
+    if (list(names) == list(header_names)) or ((filename, tuple(names), tuple(header_names)) in _checked_names):
+        return
+    _checked_names.add((filename, tuple(names), tuple(header_names)))
+    if len(names) != len(header_names):
+        raise ValueError("The TEPCat file {} has {} columns, {} expected: {}".format(filename, len(header_names),
+                                                                                 len(names), header_names))
+    different = [(name, header) for name, header in zip(names, header_names) if name != header]
+    print("WARNING: The columns {} of the TEPCat file {} are read by position, their names in the header are {}."
+          "".format([name for name, _ in different], filename, [header for _, header in different]))
+
+
+def _convert_table(table, numerical):
+    """Return the DataFrame of an Arrow table read from a TEPCat file.
+
+    The CSV reader of Arrow cannot trim the values while tokenizing, so the white spaces around the text
+    values are removed afterwards, in one pass over the text columns only (the numerical columns are
+    parsed as floats with their white spaces). The empty values are missing and the numerical columns
+    read as text are converted into floats (they stay text if they contain a text value).
+    """
+    from pyarrow import ArrowInvalid, Table, float64, scalar, string
+    import pyarrow.compute as pc
+    with stage("strip"):
+        columns = []
+        for name, column in zip(table.column_names, table.columns):
+            if column.type == string():
+                column = pc.utf8_trim_whitespace(column)
+                column = pc.if_else(pc.equal(column, ""), scalar(None, column.type), column)
+                if name in numerical:
+                    try:
+                        column = column.cast(float64())
+                    except ArrowInvalid:
+                        print("WARNING: Column {} of a TEPCat file has text values, it is kept as text."
+                              "".format(name))
+            columns.append(column)
+        table = Table.from_arrays(columns, names=table.column_names)
+    return table.to_pandas()
+
+
+def _iter_tables(reader, chunksize):
+    """Return an iterator over the tables of chunksize rows of the record batches of reader."""
+    from pyarrow import Table
+    batches = []
+    n_rows = 0
+    for batch in reader:
+        batches.append(batch)
+        n_rows += batch.num_rows
+        while n_rows >= chunksize:
+            table = Table.from_batches(batches, schema=reader.schema)
+            yield table.slice(0, chunksize)
+            batches = table.slice(chunksize).to_batches()
+            n_rows -= chunksize
+    if n_rows > 0:
+        yield Table.from_batches(batches, schema=reader.schema)
+
+
+def _read_arrow(filename, names, usecols, numerical, blanks, chunksize=None):
+    """Return the tables (list or iterator) of a TEPCat file read by pyarrow (see _read_tepcat)."""
+    from pyarrow import ArrowInvalid, float64, string
+    import pyarrow.csv as csv
+
+    def get_options(typed):
+        # Arrow parses the numbers with white spaces around them, but the fields with only white spaces
+        # are missing values only if they are in null_values
+        column_types = {name: (float64() if typed and (name in numerical) else string()) for name in usecols}
+        return {"read_options": csv.ReadOptions(column_names=names, skip_rows=1),
+                "convert_options": csv.ConvertOptions(column_types=column_types, include_columns=usecols,
+                                                      null_values=[""] + blanks, quoted_strings_can_be_null=False)}
+
+    try:
+        if chunksize is not None:
+            return _iter_tables(csv.open_csv(filename, **get_options(typed=False)), chunksize)
+        if filename not in _untyped_files:
+            try:
+                return [csv.read_csv(filename, **get_options(typed=True)), ]
+            except ArrowInvalid:
+                # Missing values written with white spaces not seen in the schema (or text values) in the
+                # numerical columns
+                _untyped_files.add(filename)
+        return [csv.read_csv(filename, **get_options(typed=False)), ]
+    except ArrowInvalid as e:
+        raise ValueError("The TEPCat file {} cannot be read ({}).".format(filename, e))
+
+
+def _read_tepcat(filename, names, columns=None, chunksize=None, process=None, dtype=None):
+    """Read a TEPCat csv file.
+
+    The names of the columns and the numerical columns are given by the schema of the file (see
+    get_schema). With pyarrow, the numerical columns are parsed as floats and the white spaces around
+    the text values are removed after the parsing (see _convert_table). If some numerical values cannot be parsed (missing values
+    written with white spaces not seen in the schema), the file is read as text and the numerical
+    columns converted afterwards (like the chunks when chunksize is provided). Without pyarrow, the file
+    is read by pandas.read_csv and the white spaces around the names and references are removed
+    afterwards.
+
+    :param str filename: Path to the file
+    :param list_of_str names: Names of the columns of the file, in the order of the header (None to use
+        the names of the header)
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
+    :param function process: Function applied to the DataFrame (or to each chunk) after reading
+    :param dict dtype: Dictionary {column: str} of the numerical columns to read as text
+    """
+    header_names, numerical, blanks = get_schema(filename)
+    if names is None:
+        names = header_names
+    else:
+        # The columns of the file are named by names, the numerical columns are found by position
+        _check_names(filename, names, header_names)
+        numerical = {name for name, header_name in zip(names, header_names) if header_name in numerical}
+    if dtype is not None:
+        numerical = numerical - set(dtype)
+    usecols = names if columns is None else select_columns(names, columns)
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        dtypes = {name: ("float64" if name in numerical else str) for name in usecols}
+        db = read_csv(filename, header=0, names=names, sep=',', skipinitialspace=True, usecols=usecols,
+                      dtype=dtypes, chunksize=chunksize)
+        chunks = (_strip_names(chunk) for chunk in ([db, ] if chunksize is None else db))
+    else:
+        chunks = (_convert_table(table, numerical)
+                  for table in _read_arrow(filename, names, usecols, numerical, blanks, chunksize=chunksize))
+    if process is not None:
+        chunks = (process(chunk) for chunk in chunks)
+    if chunksize is None:
+        return next(chunks)
+    return chunks
+
+
+# Unified columns and units of the TEPCat columns, used to generate the column_info of the tables
+unified_columns = {'System': ('pl_name', non_app), 'Period': ('pl_per', uu.d), 'a(AU)': ('pl_a', uu.au),
+                   'R_b': ('pl_radj', uu.R_jup), 'M_b': ('pl_massj', uu.M_jup),
+                   'rho_b': ('pl_rhoj', uu.M_jup / uu.R_jup**3), 'g_b': ('pl_g', uu.m / uu.s**2),
+                   'Teq': ('pl_teq', uu.K), 'R_A': ('st_rad', uu.R_sun), 'M_A': ('st_mass', uu.M_sun),
+                   'loggA': ('st_logg', "dex"), 'Teff': ('st_teff', uu.K), '[Fe/H]': ('st_metal', "dex"),
+                   'rho_A': ('st_rho', uu.M_sun / uu.R_sun**3)}
+
+
+def get_column_info(names):
+    """Return the column_info of a TEPCat table with the unified columns of its columns in unified_columns.
+
+    Only the columns in names are in the column_info, so that the column_info of a table generated from
+    the header of its file matches its columns.
+
+    :param list_of_str names: Names of the columns of the table (see get_schema)
+    :return ColumnInfo column_info: column_info of the table
+    """
+    column_info = create_empty_column_info()
+    for name in names:
+        if name in unified_columns:
+            unified_column, unit = unified_columns[name]
+            column_info = add_column_2_column_info(column_info=column_info, original_column=name,
+                                                   unified_column=unified_column, description='', unit=unit)
+    return column_info
 
 
 ## TEPCat well-studied
-column_info_WS = create_empty_column_info()
-# TODO: Actually the System column is a mix of Star and planet name. Try to find a solution to this
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='System', unified_column='pl_name',
-                                          description='', unit=non_app)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='Period', unified_column='pl_per',
-                                          description='', unit=uu.d)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='semi_major_axis', unified_column='pl_a',
-                                          description='', unit=uu.au)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='R_b', unified_column='pl_radj',
-                                          description='', unit=uu.R_jup)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='M_b', unified_column='pl_massj',
-                                          description='', unit=uu.M_jup)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='rho_b', unified_column='pl_rhoj',
-                                          description='', unit=uu.M_jup / uu.R_jup**3)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='g_b', unified_column='pl_g',
-                                          description='', unit=uu.m * uu.s**2)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='dec', unified_column='dec',
-                                          description='', unit=uu.deg)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='Teq', unified_column='pl_teq',
-                                          description='', unit=uu.K)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='R_A', unified_column='st_rad',
-                                          description='', unit=uu.R_sun)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='M_A', unified_column='st_mass',
-                                          description='', unit=uu.M_sun)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='loggA', unified_column='st_logg',
-                                          description='', unit="dex")
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='Teff', unified_column='st_teff',
-                                          description='', unit=uu.K)
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='[Fe/H]', unified_column='st_metal',
-                                          description='', unit="dex")
-column_info_WS = add_column_2_column_info(column_info=column_info_WS, original_column='rho_A', unified_column='st_rho',
-                                          description='', unit=uu.M_sun / uu.R_sun**3)
-
-
-def load_db_WS():
+
+# Names of the columns of the file
+columns_WS = ['System', 'Teff', 'Teff_erru', 'Teff_errd', '[Fe/H]', '[Fe/H]_erru', '[Fe/H]_errd',
+              'M_A', 'M_A_erru', 'M_A_errd', 'R_A', 'R_A_erru', 'R_A_errd', 'loggA', 'loggA_erru',
+              'loggA_errd', 'rho_A', 'rho_A_erru', 'rho_A_errd', 'Period', 'Period_err', 'Period_erru',
+              'Period_errd', 'a(AU)', 'a(AU)_erru', 'a(AU)_errd', 'M_b', 'M_b_erru', 'M_b_errd',
+              'R_b', 'R_b_erru', 'R_b_errd', 'g_b', 'g_b_erru', 'g_b_errd', 'rho_b', 'rho_b_erru',
+              'rho_b_errd', 'Teq', 'Teq_erru', 'Teq_errd', 'Discovery_reference', 'Recent_reference']
+
+
+def load_db_WS(columns=None, chunksize=None):
     """Load the database TEPCat well-studied as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
     """
-    cols = ['System', 'Teff', 'Teff_erru', 'Teff_errd', '[Fe/H]', '[Fe/H]_erru', '[Fe/H]_errd',
-            'M_A', 'M_A_erru', 'M_A_errd', 'R_A', 'R_A_erru', 'R_A_errd', 'loggA', 'loggA_erru',
-            'loggA_errd', 'rho_A', 'rho_A_erru', 'rho_A_errd', 'Period', 'Period_err', 'Period_erru',
-            'Period_errd', 'a(AU)', 'a(AU)_erru', 'a(AU)_errd', 'M_b', 'M_b_erru', 'M_b_errd',
-            'R_b', 'R_b_erru', 'R_b_errd', 'g_b', 'g_b_erru', 'g_b_errd', 'rho_b', 'rho_b_erru',
-            'rho_b_errd', 'Teq', 'Teq_erru', 'Teq_errd', 'Discovery_reference', 'Recent_reference']
-    db = read_table(join(database_main_folder, "well-studied/allplanets-csv.csv"), header=None, skiprows=[0],
-                    names=cols, sep=',', skipinitialspace=True)
-    for col in ["System", "Discovery_reference", "Recent_reference"]:
-        if col in db.columns:
-            db[col] = db[col].str.strip()
-    return db
+    return _read_tepcat(database_file_WS, columns_WS, columns=columns, chunksize=chunksize)
+
+
+# TODO: Actually the System column is a mix of Star and planet name. Try to find a solution to this
+column_info_WS = get_column_info(columns_WS)
 
 
 ## TEPCat planning
@@ -66,99 +280,158 @@ column_info_Pl = create_empty_column_info()
 # TODO: Actually the System column is a mix of Star and planet name. Try to find a solution to this
 column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='System', unified_column='pl_name',
                                           description='', unit=non_app)
-column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='Period', unified_column='pl_per',
+column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='Period(day)', unified_column='pl_per',
+                                          description='', unit=uu.d)
+column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='Period_err', unified_column='pl_per_err',
                                           description='', unit=uu.d)
 column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='T0 (HJD or BJD)', unified_column='t_tr',
                                           description='', unit=uu.d)
+column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='T0_err', unified_column='t_tr_err',
+                                          description='', unit=uu.d)
 column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='length', unified_column='tr_dur',
                                           description='', unit=uu.d)
+column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='ra', unified_column='ra',
+                                          description='', unit=uu.deg)
+column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='dec', unified_column='dec',
+                                          description='', unit=uu.deg)
+column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='V_mag', unified_column='mag_v',
+                                          description='', unit=without_unit)
+column_info_Pl = add_column_2_column_info(column_info=column_info_Pl, original_column='K_mag', unified_column='mag_k',
+                                          description='', unit=without_unit)
+
+
+def sexagesimal_2_deg(ra_h, ra_m, ra_s, dec_d, dec_m, dec_s):
+    """Convert sexagesimal coordinates into degrees.
+
+    :param Series ra_h: Hours of the right ascension
+    :param Series ra_m: Minutes of the right ascension
+    :param Series ra_s: Seconds of the right ascension
+    :param Series dec_d: Degrees of the declination as strings, to keep the sign of -00
+    :param Series dec_m: Arcminutes of the declination
+    :param Series dec_s: Arcseconds of the declination
+    :return Series ra: Right ascension in degrees
+    :return Series dec: Declination in degrees
+    """
+    ra = (ra_h + ra_m / 60. + ra_s / 3600.) * 15.
+    dec_d = dec_d.str.strip()
+    sign = where(dec_d.str.startswith("-"), -1., 1.)
+    dec = sign * (dec_d.astype(float).abs() + dec_m / 60. + dec_s / 3600.)
+    return ra, dec
+
 
+# Names of the columns of the file
+columns_Pl = ['System', 'Type', 'RA_h', 'RA_m', 'RA_s', 'Dec_d', 'Dec_m', 'Dec_s', 'V_mag', 'K_mag',
+              'length', 'depth', 'T0 (HJD or BJD)', 'T0_err', 'Period(day)', 'Period_err', 'Ephemeris_reference']
 
-def load_db_Pl():
+
+def load_db_Pl(columns=None, chunksize=None):
     """Load the database TEPCat planning as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
     """
-    cols = ['System', 'Type', 'RA_h', 'RA_m', 'RA_s', 'Dec_d', 'Dec_m', 'Dec_s', 'V_mag', 'K_mag',
-            'length', 'depth', 'T0 (HJD or BJD)', 'T0_err', 'Period(day)', 'Period_err', 'Ephemeris_reference']
-    db = read_table(join(database_main_folder, "obs_planning/observables.csv"), header=None, skiprows=[0],
-                    names=cols, sep=',', skipinitialspace=True)
-    for col in ["System", "Discovery_reference", "Recent_reference"]:
-        if col in db.columns:
-            db[col] = db[col].str.strip()
-    return db
+    cols_radec = ['RA_h', 'RA_m', 'RA_s', 'Dec_d', 'Dec_m', 'Dec_s']
+    cols_drop = []
+    if (columns is not None) and (('ra' in columns) or ('dec' in columns)):
+        # The sexagesimal components are only read to compute ra and dec
+        cols_drop = [col for col in cols_radec if col not in columns]
+        columns = list(columns) + cols_drop
+
+    def process(db):
+        if all([col in db.columns for col in cols_radec]):
+            db['ra'], db['dec'] = sexagesimal_2_deg(*[db[col] for col in cols_radec])
+        if 'Dec_d' in db.columns:
+            db['Dec_d'] = db['Dec_d'].astype(float)
+        return db.drop(columns=cols_drop)
+
+    return _read_tepcat(database_file_Pl, columns_Pl, columns=columns, chunksize=chunksize, process=process,
+                        dtype={'Dec_d': str})
 
 
 ## TEPCat little-studied
 
-column_info_LS = create_empty_column_info()
+# Names of the columns of the file
+# TODO: Not Sure the this list of Columns is the good one.
+columns_LS = ['System', 'Teff', 'Teff_erru', 'Teff_errd', '[Fe/H]', '[Fe/H]_erru', '[Fe/H]_errd',
+              'M_A', 'M_A_erru', 'M_A_errd', 'R_A', 'R_A_erru', 'R_A_errd', 'loggA', 'loggA_erru',
+              'loggA_errd', 'rho_A', 'rho_A_erru', 'rho_A_errd', 'Period', 'Period_err', 'Period_erru',
+              'Period_errd', 'a(AU)', 'a(AU)_erru', 'a(AU)_errd', 'M_b', 'M_b_erru', 'M_b_errd',
+              'R_b', 'R_b_erru', 'R_b_errd', 'g_b', 'g_b_erru', 'g_b_errd', 'rho_b', 'rho_b_erru',
+              'rho_b_errd', 'Teq', 'Teq_erru', 'Teq_errd', 'Discovery_reference', 'Recent_reference']
 
 
-def load_db_LS():
+def load_db_LS(columns=None, chunksize=None):
     """Load the database TEPCat little-studied as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
     """
-    # TODO: Not Sure the this list of Columns is the good one.
-    cols = ['System', 'Teff', 'Teff_erru', 'Teff_errd', '[Fe/H]', '[Fe/H]_erru', '[Fe/H]_errd',
-            'M_A', 'M_A_erru', 'M_A_errd', 'R_A', 'R_A_erru', 'R_A_errd', 'loggA', 'loggA_erru',
-            'loggA_errd', 'rho_A', 'rho_A_erru', 'rho_A_errd', 'Period', 'Period_err', 'Period_erru',
-            'Period_errd', 'a(AU)', 'a(AU)_erru', 'a(AU)_errd', 'M_b', 'M_b_erru', 'M_b_errd',
-            'R_b', 'R_b_erru', 'R_b_errd', 'g_b', 'g_b_erru', 'g_b_errd', 'rho_b', 'rho_b_erru',
-            'rho_b_errd', 'Teq', 'Teq_erru', 'Teq_errd', 'Discovery_reference', 'Recent_reference']
-    db = read_table(join(database_main_folder, "well-studied/kepplanets-csv.csv"), header=None, skiprows=[0],
-                    names=cols, sep=',', skipinitialspace=True)
-    for col in ["System", "Discovery_reference", "Recent_reference"]:
-        if col in db.columns:
-            db[col] = db[col].str.strip()
-    return db
+    return _read_tepcat(database_file_LS, columns_LS, columns=columns, chunksize=chunksize)
 
 
-## TEPCat homogeneous-meas
+column_info_LS = get_column_info(columns_LS)
 
-column_info_HM = create_empty_column_info()
 
+## TEPCat homogeneous-meas
 
-def load_db_HM():
+def load_db_HM(columns=None, chunksize=None):
     """Load the database TEPCat homogeneous-meas as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
     """
-    # TODO: Do list of columns
-    cols = None
-    db = read_table(join(database_main_folder, "homogeneous/homogeneous-input-csv.csv"), header=None, skiprows=[0],
-                    names=cols, sep=',', skipinitialspace=True)
-    for col in ["System", "Discovery_reference", "Recent_reference"]:
-        if col in db.columns:
-            db[col] = db[col].str.strip()
-    return db
+    return _read_tepcat(database_file_HM, None, columns=columns, chunksize=chunksize)
 
 
 ## TEPCat homogeneous-phys
 
-column_info_HP = create_empty_column_info()
-
-
-def load_db_HP():
+def load_db_HP(columns=None, chunksize=None):
     """Load the database TEPCat homogeneous-phys as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
     """
-    # TODO: Do list of columns
-    cols = None
-    db = read_table(join(database_main_folder, "homogeneous/homogeneous-par-csv.csv"), header=None, skiprows=[0],
-                    names=cols, sep=',', skipinitialspace=True)
-    for col in ["System", "Discovery_reference", "Recent_reference"]:
-        if col in db.columns:
-            db[col] = db[col].str.strip()
-    return db
+    return _read_tepcat(database_file_HP, None, columns=columns, chunksize=chunksize)
 
 
 ## TEPCat obliquity
 
-column_info_Ob = create_empty_column_info()
+def load_db_Ob(columns=None, chunksize=None):
+    """Load the database TEPCat obliquity as a DataFrame and return it.
+
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param int chunksize: If provided, an iterator over chunks of chunksize rows is returned instead of
+        the DataFrame.
+    """
+    return _read_tepcat(database_file_Ob, None, columns=columns, chunksize=chunksize)
 
 
-def load_db_Ob():
-    """Load the database TEPCat obliquity as a DataFrame and return it.
+# The column_info of the tables without a list of columns are generated from the header of their file
+# when they are accessed (the registry only accesses them when the database is used)
+_header_tables = ("HM", "HP", "Ob")
+
+
+def __getattr__(name):
+    """Return the generated column_info_HM, column_info_HP and column_info_Ob (see _header_tables).
+
+    An AttributeError is raised if the file of the table does not exist, the column_info cannot be
+    generated (and it would be kept by the registry if it was empty), so that hasattr and getattr with a
+    default work on the module.
     """
-    # TODO: Do list of columns
-    cols = None
-    db = read_table(join(database_main_folder, "obliquity/obliquity.csv"), header=None, skiprows=[0],
-                    names=cols, sep=',', skipinitialspace=True)
-    for col in ["System", "Discovery_reference", "Recent_reference"]:
-        if col in db.columns:
-            db[col] = db[col].str.strip()
-    return db
+    code = name[len("column_info_"):]
+    if name.startswith("column_info_") and (code in _header_tables):
+        filename = globals()["database_file_{}".format(code)]
+        if not(isfile(filename)):
+            raise AttributeError("The TEPCat file {} does not exist, {} cannot be generated from its header"
+                                 "".format(filename, name))
+        return get_column_info(get_schema(filename)[0])
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,137 @@
+"""Conversion of the database columns to the units of the unified columns.
+
+The conversion factor (and offset, for temperatures) between two units is computed once with astropy
+and applied to a full column with one NumPy operation. The error bars (columns with the suffixes of
+error_suffixes) are only scaled, the offset does not apply to them.
+"""
+from numpy import asarray
+
+from pandas.api.types import is_numeric_dtype
+
+
+error_suffixes = ("_err_inf", "_err_sup", "_err")
+
+_conversions = {}
+_parsed_units = {}
+
+
+def is_astropy_unit(unit):
+    """Return True if unit is an astropy unit (and not one of the strings used for non physical units)."""
+    from astropy.units import UnitBase
+    return isinstance(unit, UnitBase)
+
+
+def unit_2_json(unit):
+    """Return a JSON serialisable representation of a unit (see json_2_unit).
+
+    :param str/astropy.Unit unit: Unit (astropy unit or one of the strings used for non physical units)
+    :return str/dict unit: The string itself or a dictionary {"astropy": string of the astropy unit}
+    """
+    if isinstance(unit, str):
+        return unit
+    return {"astropy": unit.to_string()}
+
+
+def json_2_unit(unit):
+    """Return the unit of a representation returned by unit_2_json."""
+    if isinstance(unit, str):
+        return unit
+    string = unit["astropy"]
+    if string not in _parsed_units:
+        from astropy.units import Unit
+        _parsed_units[string] = Unit(string)
+    return _parsed_units[string]
+
+
+def get_conversion(unit_from, unit_to):
+    """Return the scale and offset to convert values from unit_from to unit_to.
+
+    The converted values are value * scale + offset.
+
+    :param str/astropy.Unit unit_from: Unit of the values
+    :param str/astropy.Unit unit_to: Unit in which to convert the values
+    :return tuple conversion: (scale, offset) or None if the conversion is not possible
+    """
+    if isinstance(unit_from, str) or isinstance(unit_to, str):
+        # non_app, without_unit, "dex", ... are only compatible with themselves.
+        return (1., 0.) if (isinstance(unit_from, str) and isinstance(unit_to, str) and
+                            (unit_from == unit_to)) else None
+    key = (unit_from, unit_to)
+    if key not in _conversions:
+        from astropy.units import UnitConversionError, temperature
+        if unit_from == unit_to:
+            _conversions[key] = (1., 0.)
+        else:
+            try:
+                offset, value_1 = unit_from.to(unit_to, [0., 1.], equivalencies=temperature())
+            except UnitConversionError:
+                _conversions[key] = None
+            else:
+                _conversions[key] = (float(value_1 - offset), float(offset))
+    return _conversions[key]
+
+
+def is_error_column(column):
+    """Return True if the column name has one of the error_suffixes."""
+    return isinstance(column, str) and column.endswith(error_suffixes)
+
+
+def convert_column(df, column, conversion, error=False):
+    """Convert in place the values of a column of df.
+
+    :param DataFrame df: DataFrame containing the column
+    :param str column: Name of the column
+    :param tuple conversion: (scale, offset) as returned by get_conversion
+    :param bool error: If True the column contains error bars and only the scale is applied.
+    :return bool converted: True if the column has been converted (False for non numeric columns)
+    """
+    scale, offset = conversion
+    if (scale == 1.) and ((offset == 0.) or error):
+        return True
+    if not(is_numeric_dtype(df[column])):
+        print("WARNING: column {} is not numeric and cannot be converted.".format(column))
+        return False
+    values = asarray(df[column], dtype=float) * scale
+    if not(error) and (offset != 0.):
+        values += offset
+    df[column] = values
+    return True
+
+
+def convert_2_units(df, column_info, units):
+    """Convert in place the columns of df into new units and update the corresponding column_info.
+
+    The error bars of a column X (X_err_inf, X_err_sup, X_err) are converted with the scale of X.
+
+    :param DataFrame df: DataFrame containing the columns to convert
+    :param FrameColumnInfo column_info: Registry of the columns of df, with the current units
+    :param dict units: Dictionary {column name: new unit}
+    :return FrameColumnInfo column_info: Registry with the new units (a copy if it has been modified)
+    """
+    new_units = {}
+    for column, unit_to in units.items():
+        record = column_info.get(column)
+        if (record is None) or (column not in df.columns) or (record.unit is unit_to) or (record.unit == unit_to):
+            continue
+        error = is_error_column(column)
+        main_column = column.rsplit("_err", 1)[0] if error else None
+        if error and (main_column in units) and (main_column in df.columns):
+            # Error bars are converted together with their column
+            continue
+        conversion = get_conversion(record.unit, unit_to)
+        if conversion is None:
+            if is_astropy_unit(record.unit) and is_astropy_unit(unit_to):
+                print("WARNING: column {} cannot be converted from {} to {}.".format(column, record.unit, unit_to))
+            continue
+        if convert_column(df, column, conversion, error=error):
+            new_units[column] = unit_to
+            if not(error):
+                for suffix in error_suffixes:
+                    column_err = column + suffix
+                    if column_err in df.columns and convert_column(df, column_err, conversion, error=True):
+                        new_units[column_err] = unit_to
+    if len(new_units) == 0:
+        return column_info
+    column_info = column_info.copy()
+    column_info.set_units(new_units)
+    return column_info
@@ -0,0 +1,236 @@
+"""Derivation of quantities from the other columns, with the propagation of the error bars.
+
+Each derivation computes a column as a product of powers of other columns (a monomial):
+column = constant * input_1**exponent_1 * input_2**exponent_2 ... The unit conversion factor of the
+monomial (constant and units of the inputs to the unit of the column) is computed once with astropy,
+so that the derivation is a single NumPy expression over all the rows.
+
+The asymmetric error bars are propagated at first order: the relative error bar of the column is the
+quadratic sum of exponent_i * relative error bar of input_i, where the superior error bar of the
+column uses the superior error bars of the inputs with positive exponent and the inferior error bars
+of the inputs with negative exponent (and conversely). The error bars are positive and the values
+without error bar on one of the inputs have no error bar.
+
+A column can have several derivations, which are used in turn to fill the rows that the previous
+ones could not compute. The inputs which are not columns of the ExoDataFrame are themselves derived
+if possible (the dependency graph is only explored for the requested columns).
+"""
+from numpy import errstate, full, isfinite, nan, pi, sqrt, zeros
+
+from .databases.unit_conversion import is_astropy_unit
+
+
+class Derivation(object):
+    """Derivation of a column as constant * product of the inputs to the power of their exponent."""
+
+    __slots__ = ("column", "inputs", "constant")
+
+    def __init__(self, column, inputs, constant=1.):
+        """
+        :param str column: Name of the derived column
+        :param list_of_tuple inputs: (column, exponent) of each input
+        :param float/astropy.Quantity constant: Multiplicative constant
+        """
+        self.column = column
+        self.inputs = tuple(inputs)
+        self.constant = constant
+
+    def __repr__(self):
+        return "{} = {} * {}".format(self.column, self.constant,
+                                     " * ".join(["{}**{:g}".format(col, exp) for col, exp in self.inputs]))
+
+    def get_scale(self, units, unit):
+        """Return the factor converting the monomial of the input values into values in unit.
+
+        :param list_of_astropy.Unit units: Units of the inputs
+        :param astropy.Unit unit: Unit of the derived column
+        :return float scale: Conversion factor (None if the units are not compatible)
+        """
+        from astropy.units import Quantity, UnitConversionError
+        quantity = Quantity(self.constant)
+        for input_unit, (_, exponent) in zip(units, self.inputs):
+            quantity = quantity * input_unit**exponent
+        try:
+            return float(quantity.to_value(unit))
+        except UnitConversionError:
+            return None
+
+    def evaluate(self, values, scale):
+        """Return the values of the column.
+
+        :param list_of_array values: Values of the inputs (arrays of same shape)
+        :param float scale: Conversion factor (see get_scale)
+        :return array result: scale * product of the values to the power of their exponent
+        """
+        result = scale
+        for value, (_, exponent) in zip(values, self.inputs):
+            result = result * (value if exponent == 1 else value**exponent)
+        return result
+
+
+_derivations = None
+
+
+def get_derivations():
+    """Return the dictionary {column: list of Derivations} of the derivable columns.
+
+    The derivations are created at the first call (they need astropy.constants).
+    """
+    global _derivations
+    if _derivations is None:
+        from astropy.constants import G
+        # The densities are in solar and jovian densities, like in TEPCat: M / R**3 in M_sun / R_sun**3
+        # (M_jup / R_jup**3), the factor 3 / (4 pi) of the mean density being in the unit
+        derivations = [Derivation("st_rho", [("st_mass", 1), ("st_rad", -3)]),
+                       Derivation("pl_rhoj", [("pl_massj", 1), ("pl_radj", -3)]),
+                       Derivation("pl_g", [("pl_massj", 1), ("pl_radj", -2)], G),
+                       # Third Kepler law, neglecting the planetary mass
+                       Derivation("pl_a", [("st_mass", 1 / 3), ("pl_per", 2 / 3)], (G / (4 * pi**2))**(1 / 3)),
+                       Derivation("pl_aR", [("pl_a", 1), ("st_rad", -1)]),
+                       Derivation("pl_aR", [("st_rho", 1 / 3), ("pl_per", 2 / 3)], (G / (4 * pi**2))**(1 / 3)),
+                       Derivation("tr_depth", [("pl_radj", 2), ("st_rad", -2)]),
+                       # Zero albedo and full heat redistribution
+                       Derivation("pl_teq", [("st_teff", 1), ("pl_aR", -1 / 2)], 2**(-1 / 2)),
+                       ]
+        _derivations = {}
+        for derivation in derivations:
+            _derivations.setdefault(derivation.column, []).append(derivation)
+    return _derivations
+
+
+def to_astropy_unit(unit):
+    """Return the astropy unit corresponding to a unit of column_info (None if there is none)."""
+    if is_astropy_unit(unit):
+        return unit
+    from .databases.column_info import without_unit
+    if unit == without_unit:
+        from astropy.units import dimensionless_unscaled
+        return dimensionless_unscaled
+    return None
+
+
+def get_error_bars(df, column):
+    """Return the inferior and superior error bars of a column of df (positive, nan if there is none).
+
+    The error bars are taken from the columns column_err_inf and column_err_sup or column_err.
+    """
+    errors = []
+    for suffix in ("_err_inf", "_err_sup"):
+        for column_err in (column + suffix, column + "_err"):
+            if column_err in df.columns:
+                errors.append(abs(df[column_err].to_numpy(dtype=float, na_value=nan)))
+                break
+        else:
+            errors.append(full(len(df), nan))
+    return errors
+
+
+class DerivationEngine(object):
+    """Derive columns of a DataFrame (see the module documentation).
+
+    The state of the columns which are available or already derived is kept in a dictionary. For this
+    engine, which propagates the error bars analytically, the state of a column is the tuple (values,
+    inferior error bars, superior error bars, astropy unit). The other engines (like
+    exopandas.montecarlo.MonteCarloEngine) redefine the functions which create and fill the states.
+    """
+
+    def __init__(self, df, units, target_units):
+        """
+        :param DataFrame df: DataFrame with the input columns
+        :param dict units: Dictionary {column: unit} of the columns of df
+        :param dict target_units: Dictionary {column: unit} of the derived columns
+        """
+        self.df = df
+        self.units = units
+        self.target_units = target_units
+        self.states = {}
+
+    def get(self, column, visiting=()):
+        """Return the state of a column, derived if needed (None if it is not available).
+
+        :param str column: Name of the column
+        :param tuple_of_str visiting: Columns being derived (to avoid the cycles of the dependency graph)
+        """
+        if column in self.states:
+            return self.states[column]
+        state = None
+        if column in self.df.columns:
+            unit = to_astropy_unit(self.units.get(column, None))
+            if unit is not None:
+                state = self._read_state(column, unit)
+        if (column not in visiting) and (column in get_derivations()):
+            derived = self.derive(column, state=state, visiting=visiting + (column, ))
+            if derived is not None:
+                state = derived
+        self.states[column] = state
+        return state
+
+    def get_result(self, column):
+        """Return (values, err_inf, err_sup, unit) of a column (None if it cannot be derived)."""
+        return self.get(column)
+
+    def derive(self, column, state=None, visiting=()):
+        """Derive a column, filling the missing values of its state.
+
+        :param str column: Name of the column
+        :param tuple state: State of the column if it is available
+        :param tuple_of_str visiting: Columns being derived
+        :return tuple derived: State of the derived column or None if it cannot be derived
+        """
+        if state is None:
+            unit = to_astropy_unit(self.target_units.get(column, None))
+            if unit is None:
+                return None
+            derived = self._new_state(unit)
+        else:
+            derived = self._copy_state(state)
+        filled = False
+        for derivation in get_derivations()[column]:
+            missing = self._get_missing(derived)
+            if not(missing.any()):
+                break
+            inputs = [self.get(col, visiting=visiting) for col, _ in derivation.inputs]
+            if any([inp is None for inp in inputs]):
+                continue
+            scale = derivation.get_scale([inp[-1] for inp in inputs], derived[-1])
+            if scale is None:
+                print("WARNING: The units of the inputs of {} are not compatible with it.".format(derivation))
+                continue
+            with errstate(invalid="ignore", divide="ignore"):
+                self._evaluate(derivation, scale, inputs, derived, missing)
+            filled = True
+        if not(filled):
+            return state
+        return derived
+
+    def _read_state(self, column, unit):
+        values = self.df[column].to_numpy(dtype=float, na_value=nan)
+        return (values, ) + tuple(get_error_bars(self.df, column)) + (unit, )
+
+    def _new_state(self, unit):
+        return (full(len(self.df), nan), full(len(self.df), nan), full(len(self.df), nan), unit)
+
+    def _copy_state(self, state):
+        return tuple([array.copy() for array in state[:-1]]) + (state[-1], )
+
+    def _get_missing(self, state):
+        return ~isfinite(state[0])
+
+    def _evaluate(self, derivation, scale, inputs, state, missing):
+        """Fill the missing rows of the state with the values derived from the states of the inputs."""
+        values, err_inf, err_sup, _ = state
+        result = full(missing.sum(), scale)
+        rel_inf = zeros(missing.sum())
+        rel_sup = zeros(missing.sum())
+        for (value, inp_inf, inp_sup, _), (_, exponent) in zip(inputs, derivation.inputs):
+            value = value[missing]
+            result *= value**exponent
+            # Relative error bars of the input contributing to the inferior and superior ones
+            low, high = inp_inf[missing] / value, inp_sup[missing] / value
+            if exponent < 0:
+                low, high = high, low
+            rel_inf += (exponent * low)**2
+            rel_sup += (exponent * high)**2
+        values[missing] = result
+        err_inf[missing] = abs(result) * sqrt(rel_inf)
+        err_sup[missing] = abs(result) * sqrt(rel_sup)
@@ -0,0 +1,154 @@
+"""Memory-compact dtypes for the loaded databases.
+
+The dtype plan of a DataFrame gives for each column the smallest dtype which keeps its information:
+- text columns become categoricals when they have few distinct values (flags, references, spectral
+  types, ...) and Arrow-backed strings otherwise (names), when pyarrow is installed,
+- the integer columns and the columns without physical unit (see column_info) which only contain
+  integers (flags) become the smallest (nullable) integer dtype,
+- the float columns become float32 when their precision allows it: the float32 rounding of each value
+  should be smaller than error_fraction times its error bars, or, for the values without error bar,
+  the value should have at most significant_digits significant digits.
+"""
+from numpy import abs as np_abs, asarray, finfo, float32, float64, floor, fmin, full, iinfo, int8, int16, int32
+from numpy import isclose, isfinite, isinf, log10, nan, round as np_round, where
+from pandas import DataFrame, StringDtype
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype, is_numeric_dtype
+
+from .databases.projection import select_columns
+from .databases.unit_conversion import is_astropy_unit
+
+
+def has_significant_digits(values, significant_digits=6):
+    """Return True for the values which have at most significant_digits significant digits.
+
+    :param array values: Values (finite)
+    :param int significant_digits: Maximum number of significant digits
+    :return array ok: True for the values with at most significant_digits significant digits
+    """
+    values = asarray(values, dtype=float64)
+    nonzero = values != 0
+    exponent = floor(log10(np_abs(where(nonzero, values, 1.)))) + 1
+    scale = 10.**(significant_digits - exponent)
+    return ~nonzero | isclose(np_round(values * scale) / scale, values, rtol=1e-12, atol=0.)
+
+
+def allows_float32(values, errors=None, error_fraction=0.01, significant_digits=6):
+    """Return True if values can be stored in float32 without loss of precision.
+
+    :param array values: Values of the column
+    :param array errors: Smallest error bar of each value (nan if there is none). If None, no value
+        has an error bar.
+    :param float error_fraction: Maximum rounding error relative to the error bars
+    :param int significant_digits: Maximum number of significant digits of the values without error bar
+    :return bool allowed: True if the column can be stored in float32
+    """
+    values = asarray(values, dtype=float64)
+    finite = isfinite(values)
+    if (np_abs(values[finite]) > finfo(float32).max).any():
+        return False
+    rounding = np_abs(values - values.astype(float32).astype(float64))
+    tolerance = full(len(values), nan) if errors is None else error_fraction * asarray(errors, dtype=float64)
+    with_error = finite & isfinite(tolerance) & (tolerance > 0)
+    if (rounding[with_error] > tolerance[with_error]).any():
+        return False
+    return bool(has_significant_digits(values[finite & ~with_error], significant_digits).all())
+
+
+def get_smallest_integer_dtype(values, nullable=False):
+    """Return the smallest integer dtype which can hold values (finite integers).
+
+    :param array values: Values of the column
+    :param bool nullable: If True a pandas nullable integer dtype is returned
+    :return str dtype: Name of the dtype
+    """
+    values = asarray(values, dtype=float64)
+    low, high = (values.min(), values.max()) if len(values) > 0 else (0, 0)
+    for dtype in (int8, int16, int32):
+        if (iinfo(dtype).min <= low) and (high <= iinfo(dtype).max):
+            break
+    else:
+        dtype = None
+    name = "int64" if dtype is None else dtype.__name__
+    return name.capitalize() if nullable else name
+
+
+def _get_error_bars(df, column):
+    """Return the smallest error bar (absolute value) of each row of a column (nan if there is none)."""
+    errors = None
+    for column_err in select_columns(df.columns, [column, ]):
+        if (column_err == column) or not(is_numeric_dtype(df[column_err])):
+            continue
+        err = np_abs(asarray(df[column_err], dtype=float64))
+        err[err == 0] = nan
+        errors = err if errors is None else fmin(errors, err)
+    return errors
+
+
+def get_dtype_plan(df, column_info=None, category_ratio=0.5, error_fraction=0.01, significant_digits=6):
+    """Return the compact dtype of each column of df which can be compacted.
+
+    :param DataFrame df: DataFrame to compact
+    :param FrameColumnInfo column_info: Registry of the columns of df (used to know which columns have
+        a physical unit). If None, all the columns are considered to have one.
+    :param float category_ratio: Text columns are converted to categoricals if their number of distinct
+        values is at most category_ratio times their number of non missing values.
+    :param float error_fraction: Maximum float32 rounding error relative to the error bars
+    :param int significant_digits: Maximum number of significant digits of the values without error bar
+        stored in float32
+    :return dict plan: Dictionary {column: dtype}
+    """
+    try:
+        import pyarrow  # noqa: F401
+        string_dtype = "string[pyarrow]"
+    except ImportError:
+        string_dtype = None
+    plan = {}
+    for column in df.columns:
+        serie = df[column]
+        record = None if column_info is None else column_info.get(column)
+        physical = (record is None) or is_astropy_unit(record.unit)
+        if is_bool_dtype(serie) or (serie.dtype.name == "category"):
+            continue
+        elif is_integer_dtype(serie):
+            dtype = get_smallest_integer_dtype(serie.dropna(), nullable=serie.hasnans)
+        elif is_float_dtype(serie):
+            values = serie.to_numpy(dtype=float64, na_value=nan)
+            finite = values[isfinite(values)]
+            if not(physical) and not(isinf(values).any()) and (finite == np_round(finite)).all():
+                dtype = get_smallest_integer_dtype(finite, nullable=True)
+            elif allows_float32(values, _get_error_bars(df, column), error_fraction=error_fraction,
+                                significant_digits=significant_digits):
+                dtype = "float32"
+            else:
+                dtype = serie.dtype.name
+        elif not(is_numeric_dtype(serie)):
+            n_values = serie.notna().sum()
+            if (n_values > 0) and (serie.nunique() <= category_ratio * n_values):
+                dtype = "category"
+            elif (string_dtype is not None) and not(isinstance(serie.dtype, StringDtype)):
+                dtype = string_dtype
+            else:
+                continue
+        else:
+            continue
+        if dtype != serie.dtype.name:
+            plan[column] = dtype
+    return plan
+
+
+def get_memory_report(before, after):
+    """Return the memory used by each column of two versions of a DataFrame.
+
+    :param DataFrame before: DataFrame before compaction
+    :param DataFrame after: DataFrame after compaction
+    :return DataFrame report: dtypes and memory (in bytes) of each column before and after, and the
+        ratio between them. The last row is the total.
+    """
+    report = DataFrame({"dtype_before": before.dtypes.astype(str),
+                        "dtype_after": after.dtypes.astype(str).reindex(before.columns),
+                        "memory_before": before.memory_usage(index=False, deep=True),
+                        "memory_after": after.memory_usage(index=False, deep=True).reindex(before.columns),
+                        })
+    report.loc["Total"] = ["", "", report["memory_before"].sum(), report["memory_after"].sum()]
+    report["ratio"] = report["memory_before"] / report["memory_after"]
+    return report
@@ -0,0 +1,79 @@
+"""Transits of planets with a linear ephemeris in a time window.
+
+The transits of all the planets are computed at once: the first and last epochs (integer numbers of
+periods since the reference transit time t0) of each planet in the window are obtained with one NumPy
+expression, then the transits are listed in flat arrays (one element per transit) built with repeat and
+cumulative sums, without loop over the planets.
+
+The uncertainty on the mid-transit time of epoch n is sqrt(t0_err**2 + (n * per_err)**2). The inferior
+error bar of the period contributes to the inferior error bar of the transits after t0 and to the
+superior error bar of the transits before t0 (and conversely).
+"""
+from numpy import arange, asarray, ceil, cumsum, floor, isfinite, maximum, repeat, sqrt, where
+
+
+def get_epoch_ranges(t0, per, start, end, dur=None):
+    """Return the first epoch and the number of transits of each planet in a time window.
+
+    :param array t0: Reference transit times
+    :param array per: Orbital periods
+    :param float start: Start of the window (same unit and time reference as t0)
+    :param float end: End of the window
+    :param array dur: Transit durations. If provided, the transits which are partially in the window are
+        included, otherwise only the transits whose mid-transit time is in the window.
+    :return array first: First epoch of each planet in the window
+    :return array count: Number of transits of each planet in the window (0 for the planets without t0
+        or valid period)
+    """
+    t0 = asarray(t0, dtype=float)
+    per = asarray(per, dtype=float)
+    half_dur = 0. if dur is None else where(isfinite(dur), asarray(dur, dtype=float) / 2, 0.)
+    valid = isfinite(t0) & isfinite(per) & (per > 0)
+    t0 = where(valid, t0, 0.)
+    per = where(valid, per, 1.)
+    first = ceil((start - half_dur - t0) / per)
+    last = floor((end + half_dur - t0) / per)
+    count = where(valid, maximum(last - first + 1, 0), 0).astype(int)
+    return where(valid, first, 0).astype(int), count
+
+
+def get_transits(t0, per, start, end, dur=None, t0_err=None, per_err=None):
+    """Return all the transits of several planets in a time window, as flat arrays.
+
+    :param array t0: Reference transit times
+    :param array per: Orbital periods
+    :param float start: Start of the window (same unit and time reference as t0)
+    :param float end: End of the window
+    :param array dur: Transit durations (see get_epoch_ranges)
+    :param tuple_of_array t0_err: Inferior and superior error bars (positive) of the reference transit
+        times
+    :param tuple_of_array per_err: Inferior and superior error bars (positive) of the periods
+    :return dict transits: Dictionary of arrays with one element per transit, ordered by planet then
+        epoch:
+        - "row": Position of the planet in the inputs,
+        - "epoch": Number of periods since t0,
+        - "t_tr": Mid-transit time,
+        - "t_tr_err_inf" and "t_tr_err_sup": Error bars of the mid-transit time (if t0_err and per_err
+          are provided),
+        - "t_start" and "t_end": Start and end of the transit (if dur is provided)
+    """
+    first, count = get_epoch_ranges(t0, per, start, end, dur=dur)
+    n_planets = len(count)
+    row = repeat(arange(n_planets), count)
+    # Position of each transit among the transits of its planet
+    offsets = cumsum(count) - count
+    epoch = first[row] + (arange(len(row)) - offsets[row])
+    t0 = asarray(t0, dtype=float)[row]
+    per = asarray(per, dtype=float)[row]
+    transits = {"row": row, "epoch": epoch, "t_tr": t0 + epoch * per}
+    if (t0_err is not None) and (per_err is not None):
+        t0_inf, t0_sup = [asarray(err, dtype=float)[row] for err in t0_err]
+        per_inf, per_sup = [asarray(err, dtype=float)[row] for err in per_err]
+        after = epoch >= 0
+        transits["t_tr_err_inf"] = sqrt(t0_inf**2 + (epoch * where(after, per_inf, per_sup))**2)
+        transits["t_tr_err_sup"] = sqrt(t0_sup**2 + (epoch * where(after, per_sup, per_inf))**2)
+    if dur is not None:
+        half_dur = asarray(dur, dtype=float)[row] / 2
+        transits["t_start"] = transits["t_tr"] - half_dur
+        transits["t_end"] = transits["t_tr"] + half_dur
+    return transits
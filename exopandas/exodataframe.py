@@ -1,29 +1,198 @@
-from numpy import where
-from pandas import DataFrame
-from pandas.api.types import is_list_like
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from numpy import full, int8, isfinite, isnan, nan, ndarray, shares_memory, where
+from pandas import DataFrame, Index, RangeIndex, Series, concat
+from pandas.api.types import is_integer_dtype, is_list_like
 
 from formated_docstring import _formatDostring
 
-from .databases.exoplaneteu import column_info as column_info_EU
-from .databases.exoplaneteu import load_db as load_db_EU
-from .databases.exoplanetarchive import column_info as column_info_EA
-from .databases.exoplanetarchive import load_db as load_db_EA
-from .databases.sweetcat import column_info as column_info_SC
-from .databases.sweetcat import load_db as load_db_SC
-from .databases.tepcat import column_info_WS, column_info_Pl, column_info_LS, column_info_HM, column_info_HP, column_info_Ob
-from .databases.tepcat import load_db_WS, load_db_Pl, load_db_LS, load_db_HM, load_db_HP, load_db_Ob
+from .databases.registry import dico_databases
+from .databases.cache import get_loading_fingerprint, is_cache_valid, iter_cache, load_db_cached, read_cache, write_cache
+from .databases.projection import get_original_columns, select_columns, supports_projection
+from .databases.streaming import check_filters, get_filter_columns, get_filter_mask, iter_chunks, supports_chunks
+from .databases.column_registry import FrameColumn, FrameColumnInfo, empty_frame_column_info
+from .databases.refresh import DatabaseDiff, diff_databases
+from .databases.snapshots import read_snapshot
+from .databases.unit_conversion import convert_2_units, error_suffixes, get_conversion
+from .conflicts import get_error_bar_columns, provenance_suffix, resolve_overlapping_columns
+from .crossmatch import get_sky_match_keys
+from .derived import DerivationEngine, get_derivations, get_error_bars
+from .dtypes import get_dtype_plan, get_memory_report
+from .ephemeris import get_transits
+from .montecarlo import derive_montecarlo
+from .names import NameIndex, get_fuzzy_match_keys, planet_2_star_names
+from .observability import get_observable
+from .profiling import collect, get_report, iter_stage, stage
+from .query import Query
+from .sharing import attach, publish
+
+
+_match_key = "_match_key"  # Name of the temporary column used to merge on a cross-match
+
+
+def _read_database(database, use_cache=True, columns=None, as_of=None):
+    """Return the DataFrame of a database as returned by its load_db function.
+
+    :param str database: Name of the database
+    :param bool use_cache: If True the database is read from the on-disk cache when possible
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param str/datetime/date as_of: If provided, the version of the database at this date is read from
+        the snapshot store (see exopandas.databases.snapshots)
+    """
+    load_db = dico_databases[database]["load_db"]
+    with stage("read", database):
+        if as_of is not None:
+            return read_snapshot(database, as_of, columns=columns)
+        elif use_cache:
+            return load_db_cached(database, load_db=load_db, source_file=dico_databases[database]["source_file"],
+                                  columns=columns)
+        elif columns is None:
+            return load_db()
+        elif supports_projection(load_db):
+            return load_db(columns=columns)
+        else:
+            db = load_db()
+            return db[select_columns(db.columns, columns)]
+
+
+def _iter_database(database, chunksize, use_cache=True, columns=None, as_of=None):
+    """Return an iterator over the chunks of the DataFrame of a database.
+
+    The chunks are read from the cache if it is valid, otherwise from the source of the database
+    (directly by chunks if its load_db function supports it).
+
+    :param str database: Name of the database
+    :param int chunksize: Number of rows of each chunk
+    :param bool use_cache: If True the database is read from the on-disk cache when it is valid
+    :param list_of_str columns: Original names of the columns to read (with their error bars). If None,
+        all the columns are read.
+    :param str/datetime/date as_of: If provided, the version of the database at this date is read from
+        the snapshot store
+    """
+    if as_of is not None:
+        return iter_chunks(read_snapshot(database, as_of, columns=columns), chunksize)
+    load_db = dico_databases[database]["load_db"]
+    if use_cache:
+        chunks = iter_cache(database, chunksize, source_file=dico_databases[database]["source_file"],
+                            columns=columns)
+        if chunks is not None:
+            return chunks
+    if supports_chunks(load_db):
+        if columns is None:
+            return load_db(chunksize=chunksize)
+        elif supports_projection(load_db):
+            return load_db(columns=columns, chunksize=chunksize)
+        else:
+            return (chunk[select_columns(chunk.columns, columns)] for chunk in load_db(chunksize=chunksize))
+    return iter_chunks(_read_database(database, use_cache=False, columns=columns), chunksize)
+
+
+def _load_database(database, unify=True, use_cache=True, columns=None, as_of=None):
+    """Load a database in a new ExoDataFrame and return it (used by ExoDataFrame.load_many).
+    """
+    db = ExoDataFrame()
+    db.load(database, unify=unify, use_cache=use_cache, columns=columns, as_of=as_of)
+    return db
+
+
+def _share_values(serie1, serie2):
+    """Return True if two Series are views of the same values."""
+    values1, values2 = serie1._values, serie2._values
+    if isinstance(values1, ndarray) and isinstance(values2, ndarray):
+        return shares_memory(values1, values2)
+    return values1 is values2
+
+
+def _get_merge_on(db):
+    """Return the column on which an ExoDataFrame loaded from a database is merged by default.
+
+    :param ExoDataFrame db: ExoDataFrame (the merge_on of the registry of its first database is used)
+    :return str merge_on: Column name ("pl_name" if the database is unknown)
+    """
+    if (len(db._databases_included) > 0) and (db._databases_included[0] in dico_databases):
+        return dico_databases[db._databases_included[0]]["merge_on"]
+    return "pl_name"
+
 
+def _add_match_columns(columns, match_on="name", kwargs_match={}, kwargs_merge_db={}, merge_on="pl_name"):
+    """Return the list of columns to load completed by the columns needed to match the databases.
 
-dico_databases = {"exoplaneteu": {"column_info": column_info_EU, "load_db": load_db_EU},
-                  "exoplanetarchive": {"column_info": column_info_EA, "load_db": load_db_EA},
-                  "sweetcat": {"column_info": column_info_SC, "load_db": load_db_SC},
-                  "tepcat well-studied": {"column_info": column_info_WS, "load_db": load_db_WS},
-                  "tepcat planning": {"column_info": column_info_Pl, "load_db": load_db_Pl},
-                  "tepcat little-studied": {"column_info": column_info_LS, "load_db": load_db_LS},
-                  "tepcat homogeneous-meas": {"column_info": column_info_HM, "load_db": load_db_HM},
-                  "tepcat homogeneous-phys": {"column_info": column_info_HP, "load_db": load_db_HP},
-                  "tepcat obliquity": {"column_info": column_info_Ob, "load_db": load_db_Ob},
-                  }
+    :param list_of_str columns: Columns to load (None for all the columns)
+    :param str match_on: How the rows of the databases are matched (see ExoDataFrame.merge)
+    :param dict kwargs_match: Dictionary of keyword arguments for the matching (see ExoDataFrame.merge)
+    :param dict kwargs_merge_db: Dictionary of keyword arguments passed to the pandas.merge function
+    :param str merge_on: Column used to match on the names if kwargs_merge_db does not provide one
+    """
+    if columns is None:
+        return None
+    if match_on == "sky":
+        match_columns = ["ra", "dec"]
+    elif match_on == "fuzzy":
+        match_columns = [kwargs_match.get("column", "pl_name")]
+    else:
+        match_columns = []
+    for key in ("on", "left_on", "right_on"):
+        on = kwargs_merge_db.get(key, None)
+        if on is not None:
+            match_columns += list(on) if is_list_like(on) else [on, ]
+    if (match_on == "name") and (len(match_columns) == 0):
+        match_columns = [merge_on]
+    return list(dict.fromkeys(list(columns) + match_columns))
+
+
+def _get_merge_keys(kwargs_merge_db, match_on="name", right=True, merge_on="pl_name"):
+    """Return the columns needed by pandas.merge in one of the merged DataFrames.
+
+    :param dict kwargs_merge_db: Dictionary of keyword arguments passed to the pandas.merge function
+    :param str match_on: How the rows of the databases are matched (see ExoDataFrame.merge)
+    :param bool right: If True, the columns of the right DataFrame, otherwise the ones of the left one
+    :param str merge_on: Column used to match on the names if kwargs_merge_db does not provide one
+    :return list_of_str keys: Columns
+    """
+    keys = []
+    for key in ("on", "right_on" if right else "left_on"):
+        on = kwargs_merge_db.get(key, None)
+        if on is not None:
+            keys += list(on) if is_list_like(on) else [on, ]
+    if ((match_on == "name") and (kwargs_merge_db.get("on", None) is None) and
+       (kwargs_merge_db.get("left_on", None) is None) and not(kwargs_merge_db.get("left_index", False))):
+        keys.append(merge_on)
+    return keys
+
+
+def _get_missing_keys(database, keys, unify=True):
+    """Return the unified columns among keys that a database cannot provide.
+
+    Only the unified columns are checked (the other columns of a database are only known once it is
+    loaded).
+
+    :param str database: Name of the database
+    :param list_of_str keys: Column names
+    :param bool unify: If True the columns of the database are unified
+    :return list_of_str missing: Columns of keys which are not provided by the database
+    """
+    from .databases.column_info import unified_cols
+    column_info = dico_databases[database]["column_info"]
+    missing = []
+    for key in keys:
+        if (unified_cols.get(key) is not None) and (column_info.get_original(key) is None):
+            if not(unify) or (column_info.get_unified(key) is None):
+                missing.append(key)
+    return missing
+
+
+def _check_merge_keys(database, keys, unify=True):
+    """Raise a ValueError if a database cannot provide some unified columns used to merge it.
+
+    :param str database: Name of the database
+    :param list_of_str keys: Columns used to merge the database
+    :param bool unify: If True the columns of the database are unified
+    """
+    missing = _get_missing_keys(database, keys, unify=unify)
+    if len(missing) > 0:
+        raise ValueError("Database {} has no column {} to be merged on. Provide other columns for this "
+                         "database with kwargs_merge_db={{{!r}: {{...}}}}.".format(database, missing, database))
 
 
 class ExoDataFrame(DataFrame):
@@ -33,37 +202,91 @@ class ExoDataFrame(DataFrame):
     and inspired by https://github.com/geopandas/geopandas
     """
 
-    _metadata = ['_column_info', '_databases_included']
+    _metadata = ['_column_info', '_databases_included', '_profile']
+    # Attributes which are not propagated to the ExoDataFrames derived from this one
+    _internal_names = DataFrame._internal_names + ['_name_indexes']
+    _internal_names_set = set(_internal_names)
+
+    # Default values of the metadata. The metadata are shared (not copied) by the ExoDataFrames derived
+    # from this one, so they are never modified in place: the column_info registries are frozen or
+    # copied before being modified (see FrameColumnInfo) and databases_included is a tuple. Like this
+    # creating an ExoDataFrame (what pandas does for every slice, copy, operation...) doesn't create
+    # any object.
+    _column_info = empty_frame_column_info
+    _databases_included = ()
+    _profile = ()  # Records of the profiled stages which created the ExoDataFrame (see exopandas.profiling)
+    _name_indexes = None
 
-    def __init__(self, *args, **kwargs):
-        self._init_column_info()
-        self._databases_included = []
-        super(ExoDataFrame, self).__init__(*args, **kwargs)
+    def __setitem__(self, key, value):
+        self.invalidate_name_indexes()
+        super(ExoDataFrame, self).__setitem__(key, value)
+
+    def _update_inplace(self, *args, **kwargs):
+        self.invalidate_name_indexes()
+        super(ExoDataFrame, self)._update_inplace(*args, **kwargs)
 
     @property
     def _constructor(self):
         return ExoDataFrame
 
+    def _constructor_from_mgr(self, mgr, axes):
+        # Like for a DataFrame, the ExoDataFrames derived from this one are created directly from their
+        # data manager, without going through __init__ (pandas calls __finalize__ afterwards to propagate
+        # the metadata).
+        return ExoDataFrame._from_mgr(mgr, axes=axes)
+
+    def _constructor_sliced_from_mgr(self, mgr, axes):
+        ser = Series._from_mgr(mgr, axes)
+        ser._name = None  # caller is responsible for setting real name
+        return ser
+
+    def __finalize__(self, other, method=None, **kwargs):
+        """Propagate the metadata from other to self (see pandas.DataFrame.__finalize__).
+
+        The metadata of the ExoDataFrames concatenated with pandas.concat are combined: the column
+        information of a column is the one of the first ExoDataFrame which has it. The column information
+        of a selection of columns only has the records of these columns.
+        """
+        self = super(ExoDataFrame, self).__finalize__(other, method=method, **kwargs)
+        if isinstance(other, ExoDataFrame) and (len(self._column_info) > len(self.columns)):
+            # Selection of columns: the records of the columns which are not kept are removed
+            object.__setattr__(self, "_column_info", self._column_info.subset(self.columns).freeze())
+        if (method == "concat") and hasattr(other, "input_objs"):
+            objs = [obj for obj in other.input_objs if isinstance(obj, ExoDataFrame)]
+            if len(objs) > 0:
+                column_info = objs[0]._column_info
+                if any([obj._column_info is not column_info for obj in objs[1:]]):
+                    records = {}
+                    for obj in objs:
+                        for record in obj._column_info:
+                            records.setdefault(record.column, record)
+                    column_info = FrameColumnInfo(records.values()).freeze()
+                object.__setattr__(self, "_column_info", column_info)
+                object.__setattr__(self, "_databases_included",
+                                   tuple(dict.fromkeys([database for obj in objs
+                                                        for database in obj._databases_included])))
+        return self
+
     @property
     def column_info(self):
         """Dataframe storing the information about the columns"""
-        return self._column_info
+        column_info = self._column_info.dataframe
+        if len(column_info) > len(self.columns):
+            # The registry can have records of columns dropped in place
+            column_info = column_info[column_info["column"].isin(self.columns)]
+        return column_info
 
     @property
     def databases_included(self):
         """List of all database included in this ExoDataFrame"""
-        return self._databases_included
+        return list(self._databases_included)
 
     def _init_column_info(self):
-        """Initialise the DataFrame used for column name conversion and description.
+        """Initialise the registry used for column description.
         """
-        # Initialise with unified columns
-        self._column_info = DataFrame({"column": [],
-                                       "description": [],
-                                       "unit": [],
-                                       "unified": []})
+        self._column_info = empty_frame_column_info
 
-    def add_column_info(self, column, description, unit, unified):
+    def add_column_info(self, column, description, unit, unified, database="", overwrite=False):
         """Add the information regarding of a column
 
         TODO: Check that the types of the unit, description, unified
@@ -72,116 +295,535 @@ class ExoDataFrame(DataFrame):
         :param string description: Corresponding column name in the database
         :param string/astropy.Unit unit: Description of the column content
         :param bool unified: If True the column is a unified column
+        :param str database: Name of the database the values of the column come from
+        :param bool overwrite: If True the information of a column which already has one is replaced,
+            otherwise a ValueError is raised.
         """
         if column not in self.columns:
             raise ValueError("{} is not an existing column !".format(column))
-        if column in self.column_info["column"].unique():
-            raise ValueError("{} is already in column_info !".format(column))
-        self._column_info = self.column_info.append({'column': column, 'description': description, 'unit': unit,
-                                                     'unified': unified}, ignore_index=True)
+        # The registry can be shared with other ExoDataFrames (slices, copies), so it is copied before
+        # being modified.
+        column_info = self._column_info.copy()
+        column_info.add(column=column, description=description, unit=unit, unified=unified, database=database,
+                        overwrite=overwrite)
+        self._column_info = column_info.freeze()
 
-    def _get_index_in_column_info(self, val, col):
-        """Return the index of the row where the value of the column col is val in column_info.
+    def rename(self, *args, **kwargs):
+        """Rename columns or index labels and keep the column information in sync.
 
-        :param val: Value to look for
-        :param string col: Column name where to look for val
-        :return list_indexes l_idx: list of indexes where val can be found in column col of
-            column_info
+        See pandas.DataFrame.rename for the parameters.
         """
-        return self.column_info.index[self.column_info[col] == val].tolist()
-
-    def _get_index_colname_in_column_info(self, colname):
-        idx = self._get_index_in_column_info(colname, "column")
-        if len(idx) == 0:
-            return None
-        else:
-            return idx[0]
+        old_columns = self.columns
+        res = super(ExoDataFrame, self).rename(*args, **kwargs)
+        target = self if res is None else res
+        mapping = {old: new for old, new in zip(old_columns, target.columns) if old != new}
+        if len(mapping) > 0:
+            target._column_info = self._column_info.renamed(mapping).freeze()
+        return res
 
-    @_formatDostring(__list__=list(dico_databases.keys()))
-    def load(self, database, unify=True):
+    @_formatDostring(__list__=dico_databases.names(discover=False))
+    def load(self, database, unify=True, use_cache=True, columns=None, filters=None, chunksize=None, as_of=None):
         """Load a database in the current exopandas.
 
         :param str database: Name of the database you want to load ({__list__})
         :param bool unify: If True the name of the column which can be unified are changed and the
             values are convert in the correct units if necessary/possible
+        :param bool use_cache: If True the database is read from the on-disk cache when its source
+            did not change since it was cached (see exopandas.databases.cache)
+        :param list_of_str columns: Columns to load (unified or original names). Only these columns and
+            their error bars are read from the database. If None, all the columns are loaded.
+        :param list_of_tuple filters: Filters (column, operator, value) that the rows have to satisfy to be
+            loaded, for example [("pl_per", "<", 10)] (see exopandas.databases.streaming). The columns
+            and values are the unified ones if unify is True. The filter columns are always loaded.
+        :param int chunksize: If provided, the database is read and filtered by chunks of chunksize rows,
+            which bounds the memory needed to load a large database with filters (see iter_load).
+        :param str/datetime/date as_of: If provided, the database is loaded as it was at this date (a
+            datetime, a date or an ISO string, in UTC if there is no time zone, a date alone meaning the
+            end of the day), from the snapshot store (see exopandas.databases.snapshots), instead of its
+            current source. The snapshots are saved with exopandas.databases.snapshots.take_snapshot.
         """
         if len(self) > 0:
             raise ValueError("The instance is not empty, you cannot use the load function. "
                              "Use merge.")
-        if database in dico_databases:
-            super(ExoDataFrame, self).__init__(dico_databases[database]["load_db"]())
-            column_info_db = dico_databases[database]["column_info"]
-            array_column_w_info = column_info_db["original_column"].values
-            if unify:
-                idx = where(column_info_db["unified_column"] != "")[0]
-                l_original = list(column_info_db.iloc[idx]["original_column"])
-                l_new = list(column_info_db.iloc[idx]["unified_column"])
-                if len(idx) > 0:
-                    self.rename(columns=dict(zip(l_original, l_new)), inplace=True)
-                    array_column_w_info[idx] = l_new
+        if database not in dico_databases:
+            raise ValueError("{} is not an existing database.".format(database))
+        with collect() as records, stage("load", database):
+            if (filters is None) and (chunksize is None):
+                column_info_db = dico_databases[database]["column_info"]
+                original_columns = None if columns is None else get_original_columns(column_info_db, columns)
+                self._set_database(_read_database(database, use_cache=use_cache, columns=original_columns,
+                                                  as_of=as_of), database, unify=unify)
+            else:
+                l_chunk = list(self._iter_chunks(database, unify=unify, use_cache=use_cache, columns=columns,
+                                                 filters=filters, chunksize=chunksize, as_of=as_of))
+                db = l_chunk[0] if len(l_chunk) == 1 else concat(l_chunk, ignore_index=True)
+                super(ExoDataFrame, self).__init__(db)
+                self._column_info = l_chunk[0]._column_info
+                self._databases_included = self._databases_included + (database, )
+        if records is not None:
+            self._profile = tuple(records)
+
+    @_formatDostring(__list__=dico_databases.names(discover=False))
+    def lazy(self, database=None, unify=True, use_cache=True, chunksize=None):
+        """Return a lazily evaluated query on this ExoDataFrame or on a database (see exopandas.query).
+
+        The filters and projections of the query are only executed by its collect method, after being
+        optimised. Use explain to see the plan of the query.
+
+        :param str database: Name of the database to query ({__list__}). It is loaded by collect (in a
+            new ExoDataFrame) with the filters and columns of the query pushed down into load. If None,
+            the query is on this ExoDataFrame.
+        :param bool unify: If True the database is unified (see load)
+        :param bool use_cache: If True the database is read from the on-disk cache when possible
+        :param int chunksize: If provided, the database is read and filtered by chunks of chunksize rows
+        :return Query query: Query without filter nor projection
+        """
+        if database is not None:
+            if len(self) > 0:
+                raise ValueError("The instance is not empty, you cannot query a database from it.")
+            if database not in dico_databases:
+                raise ValueError("{} is not an existing database.".format(database))
+        return Query(self, database=database, unify=unify, use_cache=use_cache, chunksize=chunksize)
+
+    @_formatDostring(__list__=dico_databases.names(discover=False))
+    def iter_load(self, database, chunksize=100000, unify=True, use_cache=True, columns=None, filters=None,
+                  as_of=None):
+        """Load a database by chunks of rows and return an iterator over them.
+
+        The chunks are ExoDataFrames, unified and filtered like with load. Only one chunk of the
+        database at a time is in memory. The chunks which are empty after filtering are skipped.
+
+        :param str database: Name of the database you want to load ({__list__})
+        :param int chunksize: Number of rows read at a time
+        :param bool unify: If True the name of the column which can be unified are changed and the
+            values are convert in the correct units if necessary/possible
+        :param bool use_cache: If True the database is read from the on-disk cache when it is valid. The
+            cache is not populated by iter_load.
+        :param list_of_str columns: Columns to load (see load)
+        :param list_of_tuple filters: Filters that the rows have to satisfy (see load)
+        :param str/datetime/date as_of: If provided, the version of the database at this date is loaded
+            (see load)
+        :return generator chunks: Generator over the chunks (ExoDataFrames)
+        """
+        if len(self) > 0:
+            raise ValueError("The instance is not empty, you cannot use the iter_load function.")
+        if database not in dico_databases:
+            raise ValueError("{} is not an existing database.".format(database))
+        for chunk in self._iter_chunks(database, unify=unify, use_cache=use_cache, columns=columns,
+                                       filters=filters, chunksize=chunksize, as_of=as_of):
+            if len(chunk) > 0:
+                yield chunk
+
+    def _iter_chunks(self, database, unify=True, use_cache=True, columns=None, filters=None, chunksize=None,
+                     as_of=None):
+        """Return an iterator over the unified and filtered chunks of a database (at least one chunk).
+
+        If chunksize is None the database is read in one chunk.
+        """
+        filters = check_filters(filters)
+        column_info_db = dico_databases[database]["column_info"]
+        if columns is not None:
+            columns = list(dict.fromkeys(list(columns) + get_filter_columns(filters)))
+        original_columns = None if columns is None else get_original_columns(column_info_db, columns)
+        if chunksize is None:
+            l_raw = [_read_database(database, use_cache=use_cache, columns=original_columns, as_of=as_of), ]
+        else:
+            l_raw = iter_stage(_iter_database(database, chunksize, use_cache=use_cache, columns=original_columns,
+                                              as_of=as_of), "read", database)
+        empty = True
+        for raw in l_raw:
+            chunk = ExoDataFrame()
+            chunk._set_database(raw, database, unify=unify)
+            if len(filters) > 0:
+                with stage("filter", database):
+                    chunk = chunk[get_filter_mask(chunk, filters)]
+            empty = False
+            yield chunk
+        if empty:
+            # The reader of an empty file doesn't return any chunk
+            for chunk in self._iter_chunks(database, unify=unify, use_cache=use_cache, columns=columns,
+                                           filters=filters, chunksize=None, as_of=as_of):
+                yield chunk
+
+    def _set_database(self, db, database, unify=True):
+        """Initialise the instance with the DataFrame db of a database and unify it.
+
+        :param DataFrame db: DataFrame returned by the load_db function of the database
+        :param str database: Name of the database
+        :param bool unify: If True the columns which can be unified are renamed and converted
+        """
+        column_info_db = dico_databases[database]["column_info"]
+        super(ExoDataFrame, self).__init__(db)
+        if unify:
+            with stage("rename", database):
+                renaming = column_info_db.get_renaming()
+                if len(renaming) > 0:
+                    super(ExoDataFrame, self).rename(columns=renaming, inplace=True)
+        with stage("column_info", database):
+            column_info = FrameColumnInfo()
             for column in self.columns:
-                if column not in array_column_w_info:
-                    self.add_column_info(column=column, description="", unit="", unified=False)
+                record = column_info_db.get_unified(column) if unify else None
+                unified = record is not None
+                if not(unified):
+                    record = column_info_db.get_original(column)
+                if record is None:
+                    column_info.add(column=column, description="", unit="", unified=False, database=database)
                 else:
-                    if unify and (column in column_info_db["unified_column"].unique()):
-                        idx = column_info_db.index[column_info_db["unified_column"] == column].tolist()[0]
-                        unified = True
-                    else:
-                        idx = column_info_db.index[column_info_db["original_column"] == column].tolist()[0]
-                        unified = False
-                    self.add_column_info(column=column, description=column_info_db.loc[idx, "description"],
-                                         unit=column_info_db.loc[idx, "unit"], unified=unified)
-        else:
-            raise ValueError("{} is not an existing database.".format(database))
-        self._databases_included.append(database)
+                    column_info.add(column=column, description=record.description, unit=record.unit,
+                                    unified=unified, database=database)
+        if unify:
+            # Convert the unified columns into the units of the unified columns. column_info is
+            # already imported by the database module, so this does not slow down the import.
+            from .databases.column_info import unified_cols
+            with stage("convert_units", database):
+                units = {column: unified_cols.get(column).unit for column in self.columns
+                         if column_info.get(column).unified}
+                column_info = convert_2_units(self, column_info, units)
+        self._column_info = column_info.freeze()
+        self._databases_included = self._databases_included + (database, )
 
-    def merge(self, database, unify=True, kwargs_merge_db={}, kwargs_merge_col={}):
+    def merge(self, database, unify=True, use_cache=True, columns=None, match_on="name", kwargs_match={},
+              kwargs_merge_db={}, kwargs_merge_col={}, as_of=None):
         """Include the data from another database.
 
         :param str database: Name of the database you want to add
         :param bool unify: If True the name of the column which can be unified are changed and the
             values are convert in the correct units if necessary/possible
+        :param bool use_cache: If True the database is read from the on-disk cache when possible
+        :param list_of_str columns: Columns to load from the database (see load). The columns needed to
+            match the rows are added automatically.
+        :param str match_on: How the rows of the two databases are matched:
+            - "name": on the columns given by kwargs_merge_db (by default the merge_on column of the
+            database in the registry: "pl_name", or "st_name" for the catalogs of stars like sweetcat),
+            - "sky": on the sky position of the host star (unified columns "ra" and "dec"). The positions
+            of the two databases within kwargs_match["tolerance"] (in arcsec, default 2.) of each other
+            are grouped in systems and the planets of each system are paired by letter (from "pl_name"),
+            then by period ("pl_per", within the relative tolerance kwargs_match["period_rtol"], default
+            0.01). The separation of the pairs is stored in the column "match_sep". If you provide the
+            columns which identify the planets in kwargs_merge_db["on"] (or kwargs_match["pair_planets"]
+            is False), all the planets of the matched systems are matched together instead,
+            - "fuzzy": on similar names in the column kwargs_match["column"] (default "pl_name"). The
+            names are normalised and compared within blocks of names sharing a prefix or a number (see
+            exopandas.names.get_fuzzy_match_keys). The pairs whose similarity score is at least
+            kwargs_match["threshold"] (default 0.8) are matched and the score is stored in the column
+            "match_confidence".
+        :param dict kwargs_match: Dictionary of keyword arguments for the matching (see match_on)
         :param dict kwargs_merge_db: Dictionary of keyword arguments passed to the pandas.merge function
         :param dict kwargs_merge_col: Dictionary of keyword which define the behavior of the overlapping
-            column merging
+            column merging (see exopandas.conflicts):
+            - "rule": How the overlapping columns are resolved: "keep_both" (default, the two suffixed
+            columns are kept), "left", "right", "min_error" (the value with the smallest error bar) or
+            "keep_both_if_differ",
+            - "rules": Dictionary {column: rule} for the columns with another rule than "rule",
+            - "provenance": If True (default), the index in databases_included of the database of each
+            value of a resolved column X is stored in the column X_src,
+            - "rtol": Relative tolerance used to compare the values with "keep_both_if_differ".
+        :param str/datetime/date as_of: If provided, the database is loaded as it was at this date (see
+            load)
         """
-        # Provide some default values for some of the kwargs_merge_db arguments.
-        if ((kwargs_merge_db.get("on", None) is None) and (kwargs_merge_db.get("left_on", None) is None) and
-           not(kwargs_merge_db.get("left_index", False))):
-            kwargs_merge_db["on"] = 'pl_name'
-        kwargs_merge_db["how"] = kwargs_merge_db.get("how", "outer")
         # Check that you are not trying to include a database which is already there.
         if database in self.databases_included:
             raise ValueError("database {} is already included in the ExoDataFrame.".format(database))
         # Load the other database
+        if database not in dico_databases:
+            raise ValueError("{} is not an existing database.".format(database))
         db = ExoDataFrame()
-        db.load(database, unify=unify)
-        # Merge the two databases
-        res = super(ExoDataFrame, self).merge(db, **kwargs_merge_db)
-        # Merge the two column_info
-        suffixes = kwargs_merge_db.get("suffixes", ('_x', '_y'))
-        res._column_info = self.column_info.merge(db.column_info, on="column", how="outer", suffixes=suffixes)
+        db.load(database, unify=unify, use_cache=use_cache,
+                columns=_add_match_columns(columns, match_on, kwargs_match, kwargs_merge_db,
+                                           merge_on=dico_databases[database]["merge_on"]), as_of=as_of)
+        return self._merge_exodataframe(db, match_on=match_on, kwargs_match=kwargs_match,
+                                        kwargs_merge_db=kwargs_merge_db, kwargs_merge_col=kwargs_merge_col)
+
+    def _merge_exodataframe(self, db, match_on="name", kwargs_match={}, kwargs_merge_db={}, kwargs_merge_col={}):
+        """Merge another, already loaded, ExoDataFrame with this one.
+
+        :param ExoDataFrame db: ExoDataFrame to merge with this one
+        :param str match_on: How the rows of the two databases are matched (see merge)
+        :param dict kwargs_match: Dictionary of keyword arguments for the matching (see merge)
+        :param dict kwargs_merge_db: Dictionary of keyword arguments passed to the pandas.merge function
+        :param dict kwargs_merge_col: Dictionary of keyword which define the behavior of the overlapping
+            column merging (see merge)
+        """
+        # Provide some default values for some of the kwargs_merge_db arguments.
+        kwargs_merge_db = dict(kwargs_merge_db)
+        if ((kwargs_merge_db.get("on", None) is None) and (kwargs_merge_db.get("left_on", None) is None) and
+           not(kwargs_merge_db.get("left_index", False)) and (match_on == "name")):
+            kwargs_merge_db["on"] = _get_merge_on(db)
+        kwargs_merge_db["how"] = kwargs_merge_db.get("how", "outer")
+        for database in db.databases_included:
+            if database in self.databases_included:
+                raise ValueError("database {} is already included in the ExoDataFrame.".format(database))
+        # The stages of the merge are attributed to the merged database(s)
+        with collect() as profile_records, stage("merge", "+".join(db._databases_included)):
+            left = self
+            if match_on in ("sky", "fuzzy"):
+                with stage("match"):
+                    on = kwargs_merge_db.get("on", None)
+                    on = [] if on is None else ([on, ] if not(is_list_like(on)) else list(on))
+                    if match_on == "sky":
+                        # The planets are paired by the columns of kwargs_merge_db["on"] if there are some
+                        kwargs_sky = dict({"pair_planets": len(on) == 0}, **kwargs_match)
+                        left, db = self._add_sky_match_key(db, **kwargs_sky)
+                    else:
+                        left, db = self._add_fuzzy_match_key(db, **kwargs_match)
+                kwargs_merge_db["on"] = [_match_key, ] + on
+            elif match_on != "name":
+                raise ValueError("match_on should be 'name', 'sky' or 'fuzzy', got {}".format(match_on))
+            # Convert the overlapping columns of db in the units of this ExoDataFrame
+            with stage("convert_units"):
+                units = {column: self._column_info.get(column).unit for column in db.columns
+                         if (column in self._column_info) and (column in db._column_info)}
+                if len(units) > 0:
+                    db = db.copy(deep=False)
+                    db._column_info = convert_2_units(db, db._column_info, units)
+            # Merge the two databases
+            with stage("pandas_merge"):
+                res = super(ExoDataFrame, left).merge(db, **kwargs_merge_db)
+                if match_on != "name":
+                    res = res.drop(columns=_match_key)
+            # Resolve the overlapping columns (converted above in the units of this ExoDataFrame)
+            suffixes = kwargs_merge_db.get("suffixes", ('_x', '_y'))
+            with stage("conflicts"):
+                common = [column for column in self.columns if column in db.columns]
+                # Error bars which are only in one of the ExoDataFrames (like the Xerr1 of the exoplanet archive)
+                companions = tuple({column: edf._get_error_bar_columns(column, exclude=common) for column in common}
+                                   for edf in (self, db))
+                res, take_left, resolved = resolve_overlapping_columns(res, common, kwargs_merge_col,
+                                                                       suffixes=suffixes, companions=companions)
+                provenance = {}
+                if kwargs_merge_col.get("provenance", True):
+                    for column, take_left_column in take_left.items():
+                        codes = where(take_left_column, self._get_provenance(res, column, suffixes[0]),
+                                      db._get_provenance(res, column, suffixes[1],
+                                                         offset=len(self._databases_included)))
+                        codes[res[column].isna().to_numpy()] = -1
+                        provenance[column + provenance_suffix] = codes.astype(int8)
+                    old = [column + suffix for column in provenance for suffix in ("", ) + tuple(suffixes)]
+                    res = res.drop(columns=[column for column in old if column in res.columns])
+                    if len(provenance) > 0:
+                        res = concat([res, DataFrame(provenance, index=res.index)], axis=1)
+            # Merge the two column_info. The values of the resolved columns come from both databases.
+            with stage("column_info"):
+                records = []
+                for record in self._column_info.merged(db._column_info, res.columns, suffixes=suffixes):
+                    if record.column in provenance:
+                        record = FrameColumn(record.column, "Index in databases_included of the database of the values "
+                                             "of {}".format(record.column[:-len(provenance_suffix)]), "w/o unit", False,
+                                             "")
+                    elif record.column in resolved:
+                        record = record.replace(database="")
+                    records.append(record)
+                res._column_info = FrameColumnInfo(records).freeze()
         res._databases_included = self._databases_included + db._databases_included
-        # TODO:
-        # Merge columns of the column_info and the databases
-        # The merging process of the column_info should tell you if you can merge the column of the
-        # database. For example if pl_radj exist in both database and unit has the same value, then
-        # then can safely be merged in one column. Otherwise you should create two lines column_info
-        # with the two different suffixes.
-        # If think that you only need to compare the unit, because if the name is the same, the descriptions
-        # should be the same. So don't check and use the description of the current database.
-        # If pl_radj exist but with different units then you should merge them is you can performe
-        # the unit convertion.
-        # If pl_radj exist only in one database, then the merging trivialself.
-        # Once you know which column can be merge, you need to define what the rules of the database
-        # column merging. 1. If you need a unit conversion: do you want to perform the conversion, or
-        # keep the two columns with their different unit. If you which to perform the unit conversion,
-        # which unit to use: You can decise to use the left or right database unit or specify it on a case by case.
-        # Then when a mergin of columns should be made and the two columns have at least one row with
-        # two different values, what do you do ?: keep the two columns  from the two databases or use
-        # one database over the other.
+        if profile_records is not None:
+            res._profile = self._profile + db._profile + tuple(profile_records)
         return res
 
+    def _get_error_bar_columns(self, column, exclude=()):
+        """Return the error bar columns of a column, named after it or after its original names in the
+        databases included (see exopandas.conflicts.get_error_bar_columns).
+        """
+        originals = []
+        for database in self._databases_included:
+            if database in dico_databases:
+                record = dico_databases[database]["column_info"].get_unified(column)
+                if record is not None:
+                    originals.append(record.original_column)
+        return get_error_bar_columns(self.columns, column, originals=originals, exclude=exclude)
+
+    def _get_provenance(self, res, column, suffix, offset=0):
+        """Return the provenance code of the values of a column of this ExoDataFrame in a merge result.
+
+        The codes are the indexes in databases_included of the database of each value (see
+        exopandas.conflicts), shifted by offset.
+        """
+        column_src = column + provenance_suffix
+        if column_src in self.columns:
+            column_src = column_src + suffix if column_src + suffix in res.columns else column_src
+            codes = res[column_src].to_numpy(dtype=float, na_value=nan)
+            return where(codes >= 0, codes + offset, -1).astype(int)
+        record = self._column_info.get(column)
+        if (record is None) or (record.database not in self._databases_included):
+            return full(len(res), -1)
+        return full(len(res), self._databases_included.index(record.database) + offset)
+
+    def _add_sky_match_key(self, db, tolerance=2., pair_planets=True, period_rtol=0.01):
+        """Return copies of this ExoDataFrame and db with a column allowing to merge them on the sky position.
+
+        :param ExoDataFrame db: ExoDataFrame to match with this one
+        :param float tolerance: Maximum separation of a match in arcsec
+        :param bool pair_planets: If True, the planets of the matched systems are paired by letter (from
+            "pl_name") or by period ("pl_per"), otherwise all the planets of a system share the same key
+            (see crossmatch.get_sky_match_keys)
+        :param float period_rtol: Maximum relative difference of the periods of two paired planets
+        :return ExoDataFrame left: Copy of this ExoDataFrame with the column _match_key
+        :return ExoDataFrame right: Copy of db with the columns _match_key and "match_sep"
+        """
+        for df in (self, db):
+            for column in ("ra", "dec"):
+                if column not in df.columns:
+                    raise ValueError("Column {} is needed to match on the sky position, it is not in {}"
+                                     "".format(column, df.databases_included))
+        kwargs_pair = {}
+        for column, arguments in (("pl_name", ("names1", "names2")), ("pl_per", ("periods1", "periods2"))):
+            if (column in self.columns) and (column in db.columns):
+                kwargs_pair.update({arguments[0]: self[column].to_numpy(), arguments[1]: db[column].to_numpy()})
+        key_left, key_right, sep = get_sky_match_keys(self["ra"], self["dec"], db["ra"], db["dec"],
+                                                      tolerance=tolerance, pair_planets=pair_planets,
+                                                      period_rtol=period_rtol, **kwargs_pair)
+        left = self.copy(deep=False)
+        left[_match_key] = key_left
+        right = db.copy(deep=False)
+        right[_match_key] = key_right
+        right["match_sep"] = sep
+        from astropy.units import arcsec
+        right.add_column_info(column="match_sep", description="Separation of the sky cross-match", unit=arcsec,
+                              unified=False)
+        return left, right
+
+    def _add_fuzzy_match_key(self, db, column="pl_name", threshold=0.8):
+        """Return copies of this ExoDataFrame and db with a column allowing to merge them on similar names.
+
+        :param ExoDataFrame db: ExoDataFrame to match with this one
+        :param str column: Column containing the names in both ExoDataFrames
+        :param float threshold: Minimum similarity score of a match (see names.get_fuzzy_match_keys)
+        :return ExoDataFrame left: Copy of this ExoDataFrame with the column _match_key
+        :return ExoDataFrame right: Copy of db with the columns _match_key and "match_confidence"
+        """
+        for df in (self, db):
+            if column not in df.columns:
+                raise ValueError("Column {} is needed to match on the names, it is not in {}"
+                                 "".format(column, df.databases_included))
+        key_left, key_right, score = get_fuzzy_match_keys(self[column], db[column], threshold=threshold)
+        left = self.copy(deep=False)
+        left[_match_key] = key_left
+        right = db.copy(deep=False)
+        right[_match_key] = key_right
+        right["match_confidence"] = score
+        right.add_column_info(column="match_confidence", description="Similarity score of the {} fuzzy match"
+                              "".format(column), unit="w/o unit", unified=False)
+        return left, right
+
+    def load_many(self, databases, unify=True, use_cache=True, columns=None, max_workers=None, use_processes=False,
+                  sort_by_size=True, match_on="name", kwargs_match={}, kwargs_merge_db={}, kwargs_merge_col=None,
+                  as_of=None):
+        """Load several databases concurrently and merge them in the current exopandas.
+
+        The databases are loaded (and unified) in a pool of threads or processes and then merged.
+        Processes allow to parallelise the CPU bound parts of the loading, but only the databases
+        registered at import time are available in the worker processes (spawn start method).
+
+        :param list_of_str databases: Names of the databases you want to load
+        :param bool unify: If True the name of the column which can be unified are changed and the
+            values are convert in the correct units if necessary/possible
+        :param bool use_cache: If True the databases are read from the on-disk cache when possible
+        :param list_of_str columns: Columns to load from the databases (see merge)
+        :param int max_workers: Maximum number of workers. If None, one worker per database.
+        :param bool use_processes: If True, the databases are loaded in a pool of processes instead of a
+            pool of threads.
+        :param bool sort_by_size: If True, the databases are merged by increasing number of rows, which
+            keeps the intermediate merges small. Otherwise they are merged in the order of databases.
+        :param str match_on: How the rows of the databases are matched (see merge)
+        :param dict kwargs_match: Dictionary of keyword arguments for the matching (see merge)
+        :param dict kwargs_merge_db: Dictionary of keyword arguments passed to the pandas.merge function,
+            or dictionary {database: keyword arguments} to merge each database with different arguments
+            (the databases which are not in the dictionary are merged with the default arguments). The
+            databases with their own arguments, or whose default merge column is not "pl_name" (see the
+            merge_on of exopandas.databases.registry, "st_name" for sweetcat), are merged after the other
+            ones. The unified columns used to merge each database are checked before loading the databases.
+        :param dict kwargs_merge_col: Dictionary of keyword which define the behavior of the overlapping
+            column merging (see merge). By default the overlapping columns are resolved with the rule
+            "min_error" (with "keep_both" the suffixed columns of a third database collide).
+        :param str/datetime/date as_of: If provided, the databases are loaded as they were at this date
+            (see load)
+        """
+        if len(self) > 0:
+            raise ValueError("The instance is not empty, you cannot use the load_many function. "
+                             "Use merge.")
+        if len(databases) == 0:
+            raise ValueError("No database provided.")
+        if len(set(databases)) != len(databases):
+            raise ValueError("Some databases are provided several times: {}".format(databases))
+        for database in databases:
+            if database not in dico_databases:
+                raise ValueError("{} is not an existing database.".format(database))
+        if any([database in kwargs_merge_db for database in databases]):
+            for key in kwargs_merge_db:
+                if key not in databases:
+                    raise ValueError("{} is not one of the databases loaded.".format(key))
+            l_kwargs_merge_db = [kwargs_merge_db.get(database, {}) for database in databases]
+        else:
+            l_kwargs_merge_db = [kwargs_merge_db] * len(databases)
+        if kwargs_merge_col is None:
+            kwargs_merge_col = {"rule": "min_error"}
+        # The databases with their own merge arguments or merge_on column (like sweetcat merged on st_name)
+        # are merged after the others
+        merge_ons = [dico_databases[database]["merge_on"] for database in databases]
+        own = {database: (database in kwargs_merge_db) or (merge_on != "pl_name")
+               for database, merge_on in zip(databases, merge_ons)}
+        # The order of the merges is only known once the databases are loaded, so the columns of each
+        # database as the right DataFrame of its merge are checked (on and right_on), and the columns of
+        # the left DataFrame (on and left_on) of the databases merged last must be provided by another one
+        for database, kwargs_merge, merge_on in zip(databases, l_kwargs_merge_db, merge_ons):
+            _check_merge_keys(database, _get_merge_keys(kwargs_merge, match_on, right=True, merge_on=merge_on),
+                              unify=unify)
+            if own[database]:
+                keys = _get_merge_keys(kwargs_merge, match_on, right=False, merge_on=merge_on)
+                missing = [key for key in keys
+                           if all([key in _get_missing_keys(other, [key, ], unify=unify)
+                                   for other in databases if other != database])]
+                if len(missing) > 0:
+                    raise ValueError("Database {} is merged on {} but none of the other databases provides {}."
+                                     "".format(database, keys, missing))
+        load_columns = columns
+        for kwargs_merge, merge_on in zip(l_kwargs_merge_db, merge_ons):
+            load_columns = _add_match_columns(load_columns, match_on, kwargs_match, kwargs_merge, merge_on=merge_on)
+        if max_workers is None:
+            max_workers = len(databases)
+        Executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with Executor(max_workers=max_workers) as executor:
+            l_db = list(executor.map(_load_database, databases, [unify] * len(databases),
+                                     [use_cache] * len(databases), [load_columns] * len(databases),
+                                     [as_of] * len(databases)))
+        kwargs_merge_dbs = {database: kwargs_merge for database, kwargs_merge in zip(databases, l_kwargs_merge_db)}
+        if sort_by_size:
+            l_db.sort(key=len)
+        if not(all(own.values())):
+            # The first DataFrame is never merged with its arguments
+            l_db.sort(key=lambda db: own[db._databases_included[0]])
+        res = l_db[0]
+        for db in l_db[1:]:
+            res = res._merge_exodataframe(db, match_on=match_on, kwargs_match=kwargs_match,
+                                          kwargs_merge_db=kwargs_merge_dbs[db._databases_included[0]],
+                                          kwargs_merge_col=kwargs_merge_col)
+        super(ExoDataFrame, self).__init__(res)
+        self._column_info = res._column_info
+        self._databases_included = res._databases_included
+        self._profile = res._profile
+
+    def _get_column_info_field(self, col, field, squeeze=True, noneifcolnotfound=True):
+        """Return the value of a field of column_info for one or several columns.
+
+        :param str/list_of_col col: Database column name(s)
+        :param str field: Name of the field ("description", "unit" or "unified")
+        :param bool squeeze: If true do not return a list if only one element.
+        :param bool noneifcolnotfound: If True, when col is not an available column name, the
+            function return None, otherwise it raise a ValueError.
+        """
+        if not(is_list_like(col)):
+            col = [col, ]
+        # The registry can have records of columns dropped in place
+        columns = self.columns
+        values = [value if cl in columns else None for cl, value in zip(col, self._column_info.get_field(col, field))]
+        if not(noneifcolnotfound):
+            for cl in col:
+                if (cl not in self._column_info) or (cl not in columns):
+                    raise ValueError("{} is not an available column name".format(cl))
+        if len(values) == 1 and squeeze:
+            return values[0]
+        else:
+            return values
+
     def get_unit(self, col, squeeze=True, noneifcolnotfound=True):
         """Return the unit corresponding to the columnself.
 
@@ -193,24 +835,7 @@ class ExoDataFrame(DataFrame):
             col is not an available column name then return None or raise an error depending on
             noneifcolnotfound.
         """
-        if not(is_list_like(col)):
-            col = [col, ]
-        # Initialise output
-        db_u = []
-        # For each column name provided as input
-        for cl in col:
-            idx = self._get_index_colname_in_column_info(cl)
-            if idx is None:
-                if noneifcolnotfound:
-                    db_u.append(idx)
-                else:
-                    raise ValueError("{} is not an available column name".format(cl))
-            else:
-                db_u.append(self.column_info.loc[idx, "unit"])
-        if len(db_u) == 1 and squeeze:
-            return db_u[0]
-        else:
-            return db_u
+        return self._get_column_info_field(col, "unit", squeeze=squeeze, noneifcolnotfound=noneifcolnotfound)
 
     def get_description(self, col, squeeze=True, noneifcolnotfound=True):
         """Return the unit corresponding to the columnself.
@@ -223,47 +848,538 @@ class ExoDataFrame(DataFrame):
             col is not an available column name then return None or raise an error depending on
             noneifcolnotfound.
         """
-        if not(is_list_like(col)):
-            col = [col, ]
-        # Initialise output
-        db_descr = []
-        # For each column name provided as input
-        for cl in col:
-            idx = self._get_index_colname_in_column_info(cl)
-            if idx is None:
-                if noneifcolnotfound:
-                    db_descr.append(idx)
-                else:
-                    raise ValueError("{} is not an available column name".format(cl))
-            else:
-                db_descr.append(self.column_info.loc[idx, "description"])
-        if len(db_descr) == 1 and squeeze:
-            return db_descr[0]
+        return self._get_column_info_field(col, "description", squeeze=squeeze,
+                                           noneifcolnotfound=noneifcolnotfound)
+
+    def get_units(self, cols=None, noneifcolnotfound=True):
+        """Return the units corresponding to several columns in one Series.
+
+        :param list_of_str cols: Database column names. If None, all the columns of the ExoDataFrame
+        :param bool noneifcolnotfound: If True, the unit of the columns which are not available
+            is None, otherwise a ValueError is raised.
+        :return Series units: Units indexed by column name
+        """
+        if cols is None:
+            cols = list(self.columns)
+        return Series(self._get_column_info_field(cols, "unit", squeeze=False,
+                                                  noneifcolnotfound=noneifcolnotfound),
+                      index=cols, dtype=object, name="unit")
+
+    def get_descriptions(self, cols=None, noneifcolnotfound=True):
+        """Return the descriptions corresponding to several columns in one Series.
+
+        :param list_of_str cols: Database column names. If None, all the columns of the ExoDataFrame
+        :param bool noneifcolnotfound: If True, the description of the columns which are not available
+            is None, otherwise a ValueError is raised.
+        :return Series descriptions: Descriptions indexed by column name
+        """
+        if cols is None:
+            cols = list(self.columns)
+        return Series(self._get_column_info_field(cols, "description", squeeze=False,
+                                                  noneifcolnotfound=noneifcolnotfound),
+                      index=cols, dtype=object, name="description")
+
+    def get_profile_report(self, summary=False):
+        """Return the timings (and memory) of the stages of the loads and merges which created the ExoDataFrame.
+
+        The stages are only recorded when the profiling is enabled (see exopandas.profiling), for
+        example:
+            from exopandas import profiling
+            with profiling.profile(memory=True):
+                edf.load_many(["exoplanetarchive", "tepcat well-studied"])
+            edf.get_profile_report(summary=True)
+
+        :param bool summary: If True, the stages are summed by database and stage (see
+            exopandas.profiling.get_report)
+        :return DataFrame report: One row per stage (or per database and stage if summary) with its time
+            in s and its peak memory in bytes. Empty if the profiling was disabled.
+        """
+        return get_report(self._profile, summary=summary)
+
+    def refresh(self, database, unify=True):
+        """Update in place the rows coming from a database with the changes of its source.
+
+        The new version of the database is loaded from its source and compared row by row with the
+        version in the cache (see exopandas.databases.refresh), and only the inserted, updated and
+        deleted rows are patched in the ExoDataFrame, which can have been merged with other databases:
+        - the columns coming from the database are updated for the rows with an inserted or updated key,
+        - these columns are cleared for the rows with a deleted key, and the rows which only had values
+          from the database are dropped,
+        - the rows with a new key are appended.
+        The columns resolved from several databases by the merge rules (see exopandas.conflicts) are only
+        patched where they had no value: if the values of the database changed elsewhere in these columns,
+        a ValueError is raised and the ExoDataFrame and the cache are not modified.
+        The rows are identified by the key of the database (see the key of dico_databases). The filters
+        used to load the database are not applied to the new rows. If the source of the database did
+        not change since it was cached, nothing is done.
+
+        :param str database: Name of the database to refresh (must be included in the ExoDataFrame)
+        :param bool unify: Must be the value used to load the database
+        :return DatabaseDiff diff: Inserted, updated and deleted rows (in the original database format)
+        """
+        if database not in self._databases_included:
+            raise ValueError("database {} is not included in the ExoDataFrame.".format(database))
+        entry = dico_databases[database]
+        key = entry["key"]
+        if key is None:
+            raise ValueError("database {} has no key column to identify its rows, it cannot be refreshed."
+                             "".format(database))
+        source_file = entry["source_file"]
+        previous = read_cache(database, source_file=source_file, validate=False)
+        if previous is None:
+            raise ValueError("There is no cached version of database {} to compare with.".format(database))
+        if (source_file is not None) and is_cache_valid(database, source_file=source_file):
+            return DatabaseDiff(key=key, inserted=previous.iloc[:0], updated=previous.iloc[:0],
+                                deleted=previous[key].iloc[:0])
+        fingerprint = get_loading_fingerprint(database, source_file)
+        new = entry["load_db"]()
+        diff = diff_databases(previous, new, key)
+        if len(diff) > 0:
+            self._apply_diff(database, diff, unify=unify, previous=previous)
+        write_cache(database, new, source_file=source_file, fingerprint=fingerprint)
+        return diff
+
+    def _apply_diff(self, database, diff, unify=True, previous=None):
+        """Patch in place the columns coming from a database with the difference between two versions
+        of this database (see refresh).
+
+        The columns resolved from several databases during a merge (see exopandas.conflicts) are only
+        patched on the rows where they had no value, as the values of the other databases which were
+        not used are not kept. A ValueError is raised, before any change, if the values of the database
+        changed on other rows of these columns.
+
+        :param str database: Name of the database
+        :param DatabaseDiff diff: Difference between the previous and the new version of the database
+        :param bool unify: Must be the value used to load the database
+        :param DataFrame previous: Previous version of the database (used to find the changed values of
+            the resolved columns)
+        """
+        record = dico_databases[database]["column_info"].get_original(diff.key)
+        key = record.unified_column if unify and (record is not None) and record.unified_column else diff.key
+        changed = ExoDataFrame()
+        changed._set_database(concat([diff.inserted, diff.updated]), database, unify=unify)
+        # Columns coming from the database and corresponding column of changed (the overlapping
+        # columns of a merge have a suffix)
+        owned = {}
+        for column in self.columns:
+            if self._column_info.get(column).database != database:
+                continue
+            sources = [col for col in changed.columns if isinstance(column, str) and column.startswith(str(col))]
+            if len(sources) > 0:
+                owned[column] = max(sources, key=len) if column not in changed.columns else column
+        key_columns = [column for column, source in owned.items() if source == key]
+        if len(key_columns) > 0:
+            key_column = key_columns[0]
+        elif key in self.columns:
+            key_column = key
+        else:
+            raise ValueError("The key column {} of database {} is not in the ExoDataFrame.".format(key, database))
+        # Resolved columns which have values in the database {column or error bar: resolved column}
+        provenances = [column for column in self.columns
+                       if isinstance(column, str) and (column + provenance_suffix in self.columns)]
+        resolved = {}
+        for column in provenances:
+            if column in owned:
+                continue
+            # The error bars only coming from the database (like the Xerr1 of the exoplanet archive) are
+            # resolved with the column
+            for col in [column, ] + self._get_error_bar_columns(column):
+                if col in changed.columns:
+                    resolved[col] = column
+                    owned.pop(col, None)
+        codes = [i for i, db in enumerate(self._databases_included) if db == database]
+        # Convert the new values in the units of the ExoDataFrame (see _merge_exodataframe)
+        units = {source: self._column_info.get(column).unit for column, source in owned.items()}
+        units.update({col: self._column_info.get(col).unit for col in resolved})
+        changed._column_info = convert_2_units(changed, changed._column_info, units)
+        deleted = self[key_column].isin(diff.deleted).to_numpy()
+        idx = Index(changed[key]).get_indexer(self[key_column])
+        positions = (idx >= 0).nonzero()[0]
+        # Rows of the resolved columns without value (the new values are used) and check of the others
+        unset = {}
+        if len(resolved) > 0:
+            old = ExoDataFrame()
+            if previous is not None:
+                old._set_database(previous[previous[diff.key].isin(diff.updated[diff.key])], database, unify=unify)
+                old._column_info = convert_2_units(old, old._column_info, units)
+            old_idx = Index(old[key]).get_indexer(self[key_column].iloc[positions]) if key in old.columns else \
+                full(len(positions), -1)
+            ambiguous = []
+            for column in provenances:
+                columns = [col for col, main in resolved.items() if main == column]
+                if len(columns) == 0:
+                    continue
+                src = self[column + provenance_suffix].to_numpy()
+                unset[column] = src < 0
+                modified = full(len(positions), False)
+                for col in columns:
+                    new_values = Series(changed[col].to_numpy()[idx[positions]])
+                    old_values = Series(old[col].to_numpy()[old_idx]).where(old_idx >= 0) \
+                        if (col in old.columns) and (len(old) > 0) else Series(nan, index=new_values.index)
+                    modified |= (new_values.ne(old_values) & ~(new_values.isna() & old_values.isna())).to_numpy()
+                if (modified & ~unset[column][positions]).any() or Series(src[deleted]).isin(codes).any():
+                    ambiguous.append(column)
+            if len(ambiguous) > 0:
+                raise ValueError("The columns {} were resolved from several databases (see the columns {}) and "
+                                 "the values of database {} changed, they cannot be refreshed. Load and merge "
+                                 "the databases again.".format(ambiguous, [column + provenance_suffix
+                                                                           for column in ambiguous], database))
+        # Deleted rows
+        if deleted.any():
+            positions_deleted = deleted.nonzero()[0]
+            for column in owned:
+                if column != key_column:
+                    self._set_values(positions_deleted, column, nan)
+            others = [column for column in self.columns if (column not in owned) and (column != key_column) and
+                      (column not in [col + provenance_suffix for col in provenances])]
+            empty = deleted & self[others].isna().all(axis=1).to_numpy()
+            if empty.any():
+                self._update_inplace(self[~empty])
+                unset = {column: rows_unset[~empty] for column, rows_unset in unset.items()}
+            idx = Index(changed[key]).get_indexer(self[key_column])
+            positions = (idx >= 0).nonzero()[0]
+        # Updated and inserted rows
+        if len(positions) > 0:
+            for column, source in owned.items():
+                if column != key_column:
+                    self._set_values(positions, column, changed[source].to_numpy()[idx[positions]])
+            for column, rows_unset in unset.items():
+                positions_unset = positions[rows_unset[positions]]
+                if len(positions_unset) == 0:
+                    continue
+                for col in [col for col, main in resolved.items() if main == column]:
+                    self._set_values(positions_unset, col, changed[col].to_numpy()[idx[positions_unset]])
+                self._set_values(positions_unset, column + provenance_suffix,
+                                 where(self[column].iloc[positions_unset].notna().to_numpy(), codes[0],
+                                       -1).astype(self[column + provenance_suffix].dtype))
+        new = ~Index(changed[key]).isin(self[key_column])
+        if new.any():
+            rows = DataFrame({column: changed[source].to_numpy()[new] for column, source in owned.items()})
+            for col in resolved:
+                rows[col] = changed[col].to_numpy()[new]
+            for column in provenances:
+                codes_new = where(rows[column].notna().to_numpy(), codes[0], -1) if column in rows.columns else -1
+                rows[column + provenance_suffix] = full(len(rows), codes_new, dtype=self[column + provenance_suffix].dtype)
+            rows[key_column] = changed[key].to_numpy()[new]
+            if is_integer_dtype(self.index) and (len(self) > 0):
+                rows.index = RangeIndex(self.index.max() + 1, self.index.max() + 1 + len(rows))
+            self._update_inplace(concat([self, rows], ignore_index=not(is_integer_dtype(self.index)))[self.columns])
+        self.invalidate_name_indexes()
+
+    def _set_values(self, positions, column, values):
+        """Set the values of a column at some row positions, changing its dtype if necessary."""
+        j = self.columns.get_loc(column)
+        try:
+            self.iloc[positions, j] = values
+        except (TypeError, ValueError):
+            serie = self[column].astype(object)
+            serie.iloc[positions] = values
+            super(ExoDataFrame, self).__setitem__(column, serie.infer_objects())
+
+    def compact(self, category_ratio=0.5, error_fraction=0.01, significant_digits=6, report=False):
+        """Return a copy of the ExoDataFrame with memory-compact dtypes (see exopandas.dtypes).
+
+        :param float category_ratio: Text columns are converted to categoricals if their number of
+            distinct values is at most category_ratio times their number of non missing values.
+        :param float error_fraction: Maximum float32 rounding error relative to the error bars
+        :param int significant_digits: Maximum number of significant digits of the values without error
+            bar stored in float32
+        :param bool report: If True the memory used by each column before and after is printed
+        :return ExoDataFrame compacted: Compacted copy
+        """
+        plan = get_dtype_plan(self, column_info=self._column_info, category_ratio=category_ratio,
+                              error_fraction=error_fraction, significant_digits=significant_digits)
+        compacted = self.astype(plan) if len(plan) > 0 else self.copy()
+        if report:
+            print(get_memory_report(self, compacted).to_string())
+        return compacted
+
+    def publish(self, name=None):
+        """Publish the ExoDataFrame in shared memory, to be attached by other processes (see exopandas.sharing).
+
+        The values are written once, with the column information and the databases included, and the
+        processes attach them without copy with attach(name), in a time independent of the number of
+        rows.
+
+        :param str name: Name of the publication. If None, a random name is used.
+        :return str name: Name of the publication
+        """
+        return publish(self, name=name)
+
+    def attach(self, name):
+        """Attach an ExoDataFrame published in shared memory (see publish) in the current exopandas.
+
+        The columns are read-only views on the shared memory (copy the ExoDataFrame to modify them).
+
+        :param str name: Name of the publication
+        """
+        if len(self) > 0:
+            raise ValueError("The instance is not empty, you cannot use the attach function.")
+        df, column_info, databases_included = attach(name)
+        super(ExoDataFrame, self).__init__(df)
+        self._column_info = column_info
+        self._databases_included = databases_included
+
+    def derive(self, columns, overwrite=False, errors=True, method="analytic", kwargs_montecarlo=None):
+        """Return a copy of the ExoDataFrame with derived columns (see exopandas.derived).
+
+        The values are computed for all the rows at once from the other columns (which are themselves
+        derived if needed), only the requested columns are added. The missing values of an existing
+        column are filled, the others are kept unless overwrite is True. The derived values are in the
+        unit of the existing column, or in the unit of the unified column.
+
+        :param str/list_of_str columns: Columns to derive (st_rho, pl_rhoj, pl_g, pl_a, pl_aR, tr_depth
+            or pl_teq)
+        :param bool overwrite: If True the existing values are replaced by the derived ones (when they
+            can be derived)
+        :param bool errors: If True the inferior and superior error bars (column_err_inf and
+            column_err_sup) are also derived
+        :param str method: "analytic" for a first order propagation of the error bars, "montecarlo" for
+            a Monte Carlo propagation (see exopandas.montecarlo), where the value and the error bars are
+            given by percentiles of the samples.
+        :param dict kwargs_montecarlo: Dictionary of keyword arguments of the Monte Carlo propagation
+            (n_samples, percentiles, chunksize, max_workers, use_processes and random_state, see
+            exopandas.montecarlo.derive_montecarlo)
+        :return ExoDataFrame res: Copy with the derived columns
+        """
+        from .databases.column_info import unified_cols
+        if isinstance(columns, str):
+            columns = [columns, ]
+        for column in columns:
+            if column not in get_derivations():
+                raise ValueError("{} cannot be derived, use one of {}.".format(column, list(get_derivations())))
+        if method not in ("analytic", "montecarlo"):
+            raise ValueError("method should be 'analytic' or 'montecarlo', got {}".format(method))
+        if overwrite:
+            # The existing values are not used to derive the requested columns
+            source = self.drop(columns=[col for col in columns if col in self.columns])
         else:
-            return db_descr
+            source = self
+        units = source.get_units().to_dict()
+        target_units = {col: self.get_unit(col) if col in self.columns else unified_cols.get(col).unit
+                        for col in get_derivations()}
+        if method == "analytic":
+            engine = DerivationEngine(DataFrame(source, copy=False), units=units, target_units=target_units)
+            results = {column: engine.get_result(column) for column in columns}
+        else:
+            results = derive_montecarlo(DataFrame(source, copy=False), columns, units=units,
+                                        target_units=target_units, **(kwargs_montecarlo or {}))
+        res = self.copy(deep=False)
+        for column in columns:
+            derived = results[column]
+            if derived is None:
+                print("WARNING: {} cannot be derived, some of the columns it depends on are missing."
+                      "".format(column))
+                continue
+            values, err_inf, err_sup, unit = derived
+            # Rows whose value is derived, the other values and error bars of the existing columns are kept
+            # The infinite values (like a density with a radius of 0) are not written
+            filled = isfinite(values)
+            if (column in self.columns) and not(overwrite):
+                filled &= self[column].isna().to_numpy()
+            description = unified_cols.get(column).description
+            new_columns = [(column, values, description)]
+            if errors:
+                description = description[0].lower() + description[1:]
+                new_columns += [(column + "_err_inf", err_inf, "Inferior error bar on the " + description),
+                                (column + "_err_sup", err_sup, "Superior error bar on the " + description)]
+            for new_column, new_values, description in new_columns:
+                if new_column in res.columns:
+                    res[new_column] = where(filled, new_values, res[new_column].to_numpy(dtype=float, na_value=nan))
+                else:
+                    res[new_column] = where(filled, new_values, nan)
+                    if new_column in unified_cols:
+                        description = unified_cols.get(new_column).description
+                    # The column can have a record left by a column dropped in place
+                    res.add_column_info(column=new_column, description=description, unit=unit, unified=True,
+                                        overwrite=True)
+        return res
 
-    def select_opt_mag(self):
+    def get_transits(self, start, end, t0="t_tr", per="pl_per", dur="tr_dur", columns=None):
+        """Return all the transits of the planets in a time window (see exopandas.ephemeris).
+
+        The transits are computed for all the planets at once from their linear ephemeris. The error
+        bars of the mid-transit times are propagated from the error bars of t0 and per (t0_err_inf and
+        t0_err_sup or t0_err, same for per) when the ExoDataFrame has them.
+
+        :param float/astropy.time.Time start: Start of the window, in the unit and time reference of the
+            column t0 (a Time is converted to a julian date)
+        :param float/astropy.time.Time end: End of the window
+        :param str t0: Column of the reference transit times
+        :param str per: Column of the orbital periods
+        :param str dur: Column of the transit durations. If it is in the ExoDataFrame, the transits which
+            are partially in the window are included and their start and end times are given.
+        :param list_of_str columns: Columns of the ExoDataFrame to add to the transits (by default
+            pl_name if it exists)
+        :return DataFrame transits: One row per transit, with the index of the planet, ordered by planet
+            then epoch, with the columns, the epoch (number of periods since t0), the mid-transit time
+            t_tr (and its error bars t_tr_err_inf and t_tr_err_sup), the start and end times (t_start and
+            t_end)
+        """
+        start = getattr(start, "jd", start)
+        end = getattr(end, "jd", end)
+        for col in (t0, per):
+            if col not in self.columns:
+                raise ValueError("{} is not an existing column !".format(col))
+        if columns is None:
+            columns = ["pl_name", ] if "pl_name" in self.columns else []
+        unit = self.get_unit(t0)
+        values = {}
+        for col in [per, ] + ([dur, ] if dur in self.columns else []):
+            # The periods and durations are converted to the unit of t0
+            conversion = None if unit is None else get_conversion(self.get_unit(col), unit)
+            if conversion is None:
+                conversion = (1., 0.)
+                if unit is not None:
+                    print("WARNING: The unit of {} is not compatible with the one of {}, it is not converted."
+                          "".format(col, t0))
+            errors = get_error_bars(self, col)
+            values[col] = [self[col].to_numpy(dtype=float, na_value=nan) * conversion[0], ] + \
+                [err * conversion[0] for err in errors]
+        has_errors = any([col in self.columns for col in [t0 + suffix for suffix in error_suffixes]])
+        transits = get_transits(self[t0].to_numpy(dtype=float, na_value=nan), values[per][0], start, end,
+                                dur=values[dur][0] if dur in values else None,
+                                t0_err=get_error_bars(self, t0) if has_errors else None,
+                                per_err=values[per][1:] if has_errors else None)
+        row = transits.pop("row")
+        res = DataFrame({col: self[col].to_numpy()[row] for col in columns}, index=self.index[row])
+        for col, col_values in transits.items():
+            res[col] = col_values
+        return res
+
+    def select_opt_mag(self, max_mag=None, min_mag=None, band="v", keep_missing=False):
         """Select according to star magnitude in the optical bands.
+
+        :param float max_mag: Maximum magnitude (faintest star). If None, no maximum.
+        :param float min_mag: Minimum magnitude (brightest star). If None, no minimum.
+        :param str band: Band of the magnitude (the magnitudes are in the column mag_<band>)
+        :param bool keep_missing: If True the rows without magnitude are kept
+        :return ExoDataFrame res: Selected rows
+        """
+        return self[self._get_mag_mask({"mag_{}".format(band): (min_mag, max_mag)}, keep_missing=keep_missing)]
+
+    def _get_mag_mask(self, mag_limits, keep_missing=False):
+        """Return True for the rows within the magnitude limits.
+
+        :param dict mag_limits: Dictionary {column: (min_mag, max_mag)}, with None for no limit
+        :param bool keep_missing: If True the rows without magnitude are selected
+        :return array mask: True for the selected rows
+        """
+        mask = full(len(self), True)
+        for column, (min_mag, max_mag) in mag_limits.items():
+            if column not in self.columns:
+                raise ValueError("{} is not an existing column !".format(column))
+            mag = self[column].to_numpy(dtype=float, na_value=nan)
+            selected = full(len(self), True)
+            if max_mag is not None:
+                selected &= mag <= max_mag
+            if min_mag is not None:
+                selected &= mag >= min_mag
+            mask &= selected | (isnan(mag) if keep_missing else False)
+        return mask
+
+    def select_observable(self, times, location, max_airmass=2., sun_altitude=-12., min_moon_separation=None,
+                          min_observable=1, max_mags=None):
+        """Select the targets observable from an observatory during a grid of times.
+
+        The observability of all the targets at all the times is computed at once from the columns ra
+        and dec (see exopandas.observability). The magnitude cuts are applied first.
+
+        :param astropy.time.Time/array times: Times of the grid (astropy Time or julian dates)
+        :param astropy.coordinates.EarthLocation/tuple location: Observatory (EarthLocation or tuple
+            (longitude, latitude) in degrees, longitude East positive)
+        :param float max_airmass: Maximum airmass
+        :param float sun_altitude: Maximum altitude of the Sun in degrees (-12 for the nautical
+            twilight). If None, the day times are not excluded.
+        :param float min_moon_separation: Minimum separation to the Moon in degrees. If None, the Moon
+            is not considered.
+        :param int min_observable: Minimum number of times of the grid where the target is observable
+        :param dict max_mags: Dictionary {column: maximum magnitude}, for example {"mag_v": 12,
+            "mag_k": 10}. The rows without magnitude are removed.
+        :return ExoDataFrame res: Observable rows
+        """
+        for col in ("ra", "dec"):
+            if col not in self.columns:
+                raise ValueError("{} is not an existing column !".format(col))
+        res = self
+        if max_mags:
+            res = res[res._get_mag_mask({column: (None, max_mag) for column, max_mag in max_mags.items()})]
+        observable = get_observable(res["ra"].to_numpy(dtype=float, na_value=nan),
+                                    res["dec"].to_numpy(dtype=float, na_value=nan), times, location,
+                                    max_airmass=max_airmass, sun_altitude=sun_altitude,
+                                    min_moon_separation=min_moon_separation)
+        return res[observable.sum(axis=1) >= min_observable]
+
+    def invalidate_name_indexes(self):
+        """Drop the name indexes used by is_star_in, get_star_rows and get_planet_rows.
+
+        The indexes are dropped automatically when columns are set (edf[col] = ...) or when the
+        ExoDataFrame is modified by an inplace operation, and they are rebuilt when the names change
+        (modified through .loc, .iloc or .values for example).
+        """
+        self._name_indexes = {}
+
+    def _get_name_index(self, kind):
+        """Return the NameIndex of the star ("star") or planet ("planet") names, built if needed.
+
+        The star names are taken from the column st_name or, if it doesn't exist, from pl_name
+        without the planet letter.
+
+        :param str kind: "star" or "planet"
+        :return NameIndex name_index: Index of the rows by normalised name
         """
-        raise NotImplementedError()
+        name_indexes = getattr(self, "_name_indexes", None)
+        if name_indexes is None:
+            name_indexes = self._name_indexes = {}
+        if kind == "star" and "st_name" in self.columns:
+            column = "st_name"
+        elif "pl_name" in self.columns:
+            column = "pl_name"
+        else:
+            raise ValueError("There is no column allowing to identify the {}s (st_name or pl_name)".format(kind))
+        names = self[column]
+        cached = name_indexes.get(kind, None)
+        # The index of the rows is replaced by all the operations which add or remove rows. The cached
+        # index keeps the names it was built from, so a modification of the names in place (.loc,
+        # .iloc...) copies the column (pandas Copy-on-Write) and is detected.
+        if ((cached is not None) and (cached[0] is self.index) and (cached[1] == column) and
+           _share_values(cached[2], names)):
+            return cached[3]
+        name_index = NameIndex(planet_2_star_names(names) if (kind == "star") and (column == "pl_name") else names)
+        name_indexes[kind] = (self.index, column, names, name_index)
+        return name_index
 
     def is_star_in(self, star):
         """Return True if star is in the database.
 
-        :param string star: Star name
+        :param string/list_of_str star: Star name(s)
+        :return bool/array_of_bool: True for the stars in the database
+        """
+        found = self._get_name_index("star").contains(star if is_list_like(star) else [star, ])
+        return found if is_list_like(star) else bool(found[0])
+
+    def is_planet_in(self, planet):
+        """Return True if planet is in the database.
+
+        :param string/list_of_str planet: Planet name(s)
+        :return bool/array_of_bool: True for the planets in the database
         """
-        raise NotImplementedError("You should implement this function in your child class !")
+        found = self._get_name_index("planet").contains(planet if is_list_like(planet) else [planet, ])
+        return found if is_list_like(planet) else bool(found[0])
 
     def get_star_rows(self, star):
         """Return rows for which the host star is star.
 
-        :param string star: Star name
+        :param string/list_of_str star: Star name(s)
+        :return ExoDataFrame rows: Rows of the star(s), in the order of the stars provided
         """
-        raise NotImplementedError("You should implement this function in your child class !")
+        return self.iloc[self._get_name_index("star").get_positions(star if is_list_like(star) else [star, ])]
 
     def get_planet_rows(self, planet):
         """Return the row corresponding to the planet
 
-        :param string planet: Planet name
+        :param string/list_of_str planet: Planet name(s)
+        :return ExoDataFrame rows: Rows of the planet(s), in the order of the planets provided
         """
-        raise NotImplementedError("You should implement this function in your child class !")
+        return self.iloc[self._get_name_index("planet").get_positions(planet if is_list_like(planet)
+                                                                      else [planet, ])]
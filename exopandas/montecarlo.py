@@ -0,0 +1,189 @@
+"""Monte Carlo propagation of the error bars of the derived quantities.
+
+The first order propagation of exopandas.derived is not accurate for the large or very asymmetric error
+bars of the non linear derivations. Here, samples of each input are drawn for all the rows at once, in a
+2-D array (n_rows x n_samples), from the split normal distribution defined by its value and its
+inferior and superior error bars. The derivations are evaluated on the samples and the value and error
+bars of a derived column are given by percentiles of its samples (by default the median and the
+1 sigma interval around it).
+
+The rows are processed by chunks to cap the memory used (each input and derived column of a chunk
+uses chunksize x n_samples x 8 bytes), possibly in parallel. Each chunk has its own random generator
+spawned from random_state, so that the result does not depend on the number of workers.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from numpy import (abs as np_abs, concatenate, errstate, full, isfinite, logical_and, multiply, nan,
+                   nanpercentile, percentile, where, zeros)
+from numpy.random import SeedSequence, default_rng
+
+from .derived import DerivationEngine, get_error_bars
+
+
+# Median and 1 sigma interval of a normal distribution
+default_percentiles = (15.865525393145708, 50., 84.13447460685429)
+
+# Default maximum number of samples of a column in a chunk (chunksize x n_samples)
+max_chunk_samples = 2**20
+
+
+def draw_split_normal(values, err_inf, err_sup, n_samples, rng):
+    """Draw samples from split normal distributions.
+
+    The split normal distribution of a row has its mode at the value, its lower half is the one of a
+    normal distribution of standard deviation err_inf and its upper half the one of a normal
+    distribution of standard deviation err_sup. The missing error bars are considered null.
+
+    :param array values: Values of the rows
+    :param array err_inf: Inferior error bars of the rows (positive)
+    :param array err_sup: Superior error bars of the rows (positive)
+    :param int n_samples: Number of samples per row
+    :param numpy.random.Generator rng: Random generator
+    :return array samples: Samples (n_rows x n_samples)
+    """
+    err_inf = where(isfinite(err_inf), err_inf, 0.)[:, None]
+    err_sup = where(isfinite(err_sup), err_sup, 0.)[:, None]
+    total = err_inf + err_sup
+    with errstate(invalid="ignore", divide="ignore"):
+        # Probability of the lower half, proportional to its standard deviation for a continuous density
+        p_inf = where(total > 0, err_inf / total, 0.5)
+        # The samples are scaled by err_sup, then the ones of the lower half by -err_inf / err_sup (by err_inf
+        # and -1 if err_sup is null), which is faster than building the array of the scale of each sample.
+        scale = where(err_sup > 0, err_sup, err_inf)
+        ratio = where(err_sup > 0, -err_inf / err_sup, -1.)
+    lower = rng.random((len(values), n_samples)) < p_inf
+    samples = rng.standard_normal((len(values), n_samples))
+    np_abs(samples, out=samples)
+    samples *= scale
+    multiply(samples, ratio, out=samples, where=lower)
+    samples += values[:, None]
+    return samples
+
+
+def get_percentiles(samples, percentiles=default_percentiles):
+    """Return the percentiles of the samples of each row, ignoring the non finite samples.
+
+    :param array samples: Samples (n_rows x n_samples)
+    :param tuple_of_float percentiles: Percentiles to compute (between 0 and 100)
+    :return array res: Percentiles (len(percentiles) x n_rows)
+    """
+    # nanpercentile is much slower than percentile, it is only used for the rows with non finite samples
+    finite = isfinite(samples)
+    complete = finite.all(axis=1)
+    res = full((len(percentiles), len(samples)), nan)
+    if complete.any():
+        res[:, complete] = percentile(samples[complete], percentiles, axis=1)
+    partial = ~complete & finite.any(axis=1)
+    if partial.any():
+        res[:, partial] = nanpercentile(where(finite[partial], samples[partial], nan), percentiles, axis=1)
+    return res
+
+
+class MonteCarloEngine(DerivationEngine):
+    """Derive columns of a DataFrame by Monte Carlo (see the module documentation).
+
+    The state of a column is the tuple (samples, defined, has_errors, astropy unit), where defined is
+    True for the rows with a value and has_errors True for the rows whose value and all the values it
+    is derived from have error bars (the error bars of the other rows are missing, like with the
+    analytic propagation).
+    """
+
+    def __init__(self, df, units, target_units, n_samples=10000, percentiles=default_percentiles, rng=None):
+        """
+        :param DataFrame df: DataFrame with the input columns
+        :param dict units: Dictionary {column: unit} of the columns of df
+        :param dict target_units: Dictionary {column: unit} of the derived columns
+        :param int n_samples: Number of samples per row
+        :param tuple_of_float percentiles: Percentiles giving the inferior error bar, the value and the
+            superior error bar
+        :param numpy.random.Generator rng: Random generator
+        """
+        super(MonteCarloEngine, self).__init__(df, units=units, target_units=target_units)
+        self.n_samples = n_samples
+        self.percentiles = percentiles
+        self.rng = default_rng() if rng is None else rng
+
+    def get_result(self, column):
+        """Return (values, err_inf, err_sup, unit) of a column (None if it cannot be derived)."""
+        state = self.get(column)
+        if state is None:
+            return None
+        samples, defined, has_errors, unit = state
+        low, values, high = get_percentiles(samples, self.percentiles)
+        values[~defined] = nan
+        err_inf = values - low
+        err_sup = high - values
+        err_inf[~has_errors] = nan
+        err_sup[~has_errors] = nan
+        return values, err_inf, err_sup, unit
+
+    def _read_state(self, column, unit):
+        values = self.df[column].to_numpy(dtype=float, na_value=nan)
+        err_inf, err_sup = get_error_bars(self.df, column)
+        samples = draw_split_normal(values, err_inf, err_sup, self.n_samples, self.rng)
+        return samples, isfinite(values), isfinite(err_inf) & isfinite(err_sup), unit
+
+    def _new_state(self, unit):
+        return (full((len(self.df), self.n_samples), nan), zeros(len(self.df), dtype=bool),
+                zeros(len(self.df), dtype=bool), unit)
+
+    def _get_missing(self, state):
+        return ~state[1]
+
+    def _evaluate(self, derivation, scale, inputs, state, missing):
+        samples, defined, has_errors, _ = state
+        samples[missing] = derivation.evaluate([inp[0][missing] for inp in inputs], scale)
+        defined[missing] = logical_and.reduce([inp[1][missing] for inp in inputs])
+        has_errors[missing] = logical_and.reduce([inp[2][missing] for inp in inputs])
+
+
+def _derive_chunk(df, columns, units, target_units, n_samples, percentiles, seed):
+    """Return the dictionary {column: (values, err_inf, err_sup, unit)} of a chunk of rows."""
+    engine = MonteCarloEngine(df, units=units, target_units=target_units, n_samples=n_samples,
+                              percentiles=percentiles, rng=default_rng(seed))
+    return {column: engine.get_result(column) for column in columns}
+
+
+def derive_montecarlo(df, columns, units, target_units, n_samples=10000, percentiles=default_percentiles,
+                      chunksize=None, max_workers=None, use_processes=True, random_state=None):
+    """Derive columns by Monte Carlo.
+
+    :param DataFrame df: DataFrame with the input columns
+    :param list_of_str columns: Columns to derive
+    :param dict units: Dictionary {column: unit} of the columns of df
+    :param dict target_units: Dictionary {column: unit} of the derived columns
+    :param int n_samples: Number of samples per row
+    :param tuple_of_float percentiles: Percentiles giving the inferior error bar, the value and the
+        superior error bar
+    :param int chunksize: Number of rows processed at once. If None, max_chunk_samples // n_samples.
+    :param int max_workers: Number of workers processing the chunks in parallel. If None, the chunks
+        are processed one after the other in the current process.
+    :param bool use_processes: If True the workers are processes, otherwise threads
+    :param int random_state: Seed of the random generators, for reproducible results
+    :return dict res: Dictionary {column: (values, err_inf, err_sup, unit)}, None for the columns which
+        cannot be derived
+    """
+    if len(percentiles) != 3:
+        raise ValueError("percentiles should give the inferior error bar, the value and the superior error bar "
+                         "(3 percentiles), got {}".format(percentiles))
+    if chunksize is None:
+        chunksize = max(max_chunk_samples // n_samples, 1)
+    starts = list(range(0, len(df), chunksize)) or [0, ]
+    chunks = [df.iloc[start:start + chunksize] for start in starts]
+    seeds = SeedSequence(random_state).spawn(len(chunks))
+    args = [[columns] * len(chunks), [units] * len(chunks), [target_units] * len(chunks),
+            [n_samples] * len(chunks), [percentiles] * len(chunks), seeds]
+    if max_workers is None:
+        l_res = list(map(_derive_chunk, chunks, *args))
+    else:
+        Executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with Executor(max_workers=max_workers) as executor:
+            l_res = list(executor.map(_derive_chunk, chunks, *args))
+    res = {}
+    for column in columns:
+        if l_res[0][column] is None:
+            res[column] = None
+        else:
+            res[column] = tuple([concatenate([chunk_res[column][i] for chunk_res in l_res]) for i in range(3)] +
+                                [l_res[0][column][3], ])
+    return res
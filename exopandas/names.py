@@ -0,0 +1,226 @@
+"""Normalisation of star and planet names and index of the rows of a catalog by normalised name.
+
+The normalisation makes the names of the different catalogs comparable: case, white spaces, dashes
+and underscores are ignored ("WASP-12 b", "WASP 12b" and "wasp12b" are the same), the leading zeros of
+the numbers are removed ("WASP-012" is "WASP-12") and the common aliases of the catalog prefixes are
+replaced by a single prefix ("Gliese 436" and "Gl 436" are "GJ 436").
+"""
+from numpy import (arange, argsort, asarray, bincount, concatenate, cumsum, empty, empty_like, full, maximum,
+                   minimum, nan, repeat, tile, uint32, where)
+from numpy.char import str_len as char_str_len
+from pandas import DataFrame, Index, Series, concat, factorize
+from pandas.api.types import is_list_like
+
+
+# (regular expression, replacement) applied to the lower case names, before the removal of the spaces
+name_aliases = [(r"^(gliese|gl)(?=[\s\-_]*\d)", "gj"),
+                (r"^hip(parcos)?(?=[\s\-_]*\d)", "hip"),
+                (r"^henry[\s\-_]*draper(?=[\s\-_]*\d)", "hd"),
+                (r"^kepler[\s\-_]*object[\s\-_]*of[\s\-_]*interest", "koi"),
+                ]
+
+# Trailing planet letter, used to get the host star name from a planet name
+planet_letter_pattern = r"([\s\-_]+|(?<=\d))[b-i]$"
+
+
+def normalize_names(names):
+    """Return the normalised version of star or planet names.
+
+    :param str/list_of_str names: Name(s) to normalise
+    :return str/Series norm: Normalised name(s) (missing names are normalised as "")
+    """
+    scalar = not(is_list_like(names))
+    s = Series([names, ] if scalar else list(names), dtype=object)
+    s = s.where(s.notna(), "").astype(str).str.strip().str.lower()
+    for pattern, replacement in name_aliases:
+        s = s.str.replace(pattern, replacement, regex=True)
+    s = s.str.replace(r"[\s\-_]+", "", regex=True)
+    s = s.str.replace(r"(?<!\d)0+(?=\d)", "", regex=True)
+    return s.iloc[0] if scalar else s
+
+
+def planet_2_star_names(names):
+    """Return the host star names corresponding to planet names (the trailing planet letter is removed).
+
+    :param Series names: Planet names
+    :return Series star_names: Host star names
+    """
+    names = Series(names, dtype=object)
+    return names.where(names.isna(), names.astype(str).str.strip().str.replace(planet_letter_pattern, "",
+                                                                                regex=True))
+
+
+class NameIndex(object):
+    """Index of the row positions of a catalog by normalised name.
+
+    The row positions are stored grouped by name (CSR-like layout): the rows with the name of code c
+    are order[starts[c]: starts[c] + counts[c]].
+    """
+
+    def __init__(self, names):
+        """
+        :param list_of_str names: Name of each row of the catalog
+        """
+        names = Series(list(names), dtype=object)
+        codes, uniques = factorize(normalize_names(names))
+        valid = codes >= 0
+        # The names as they are written in the catalog are also indexed, so that looking for them
+        # doesn't require their normalisation.
+        first = (~names.duplicated()).values & names.notna().values
+        self.raw_names = Index(names[first].values)
+        self.raw_codes = codes[first]
+        self.names = Index(uniques)
+        self.counts = bincount(codes[valid], minlength=len(uniques))
+        self.starts = concatenate([[0], cumsum(self.counts)[:-1]]).astype(int)
+        self.order = arange(len(codes))[valid][argsort(codes[valid], kind="stable")]
+        self._empty = "" in self.names
+        self._empty_code = self.names.get_loc("") if self._empty else -1
+
+    def get_codes(self, names):
+        """Return the code of each name (-1 if the name is not in the index).
+
+        :param list_of_str names: Names to look for
+        :return array codes: Codes of the names
+        """
+        names = asarray(list(names), dtype=object)
+        idx = self.raw_names.get_indexer(names)
+        codes = where(idx >= 0, self.raw_codes[idx], -1)
+        not_raw = idx < 0
+        if not_raw.any():
+            codes[not_raw] = self.names.get_indexer(normalize_names(names[not_raw]))
+        if self._empty:
+            codes[codes == self._empty_code] = -1
+        return codes
+
+    def contains(self, names):
+        """Return for each name True if it is in the index.
+
+        :param list_of_str names: Names to look for
+        :return array found: True for the names which are in the index
+        """
+        return self.get_codes(names) >= 0
+
+    def get_positions(self, names):
+        """Return the positions of the rows with one of the names.
+
+        :param list_of_str names: Names to look for
+        :return array positions: Positions of the rows, in the order of the names
+        """
+        codes = self.get_codes(names)
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return empty(0, dtype=int)
+        counts = self.counts[codes]
+        # Position of each row in self.order: start of its name + rank of the row among the name rows
+        offsets = repeat(self.starts[codes] - cumsum(concatenate([[0], counts[:-1]])), counts)
+        return asarray(self.order[offsets + arange(counts.sum())])
+
+
+def get_blocking_keys(norm_names):
+    """Return the blocking keys of normalised names.
+
+    Two names are only compared by the fuzzy matching if they share one of their blocking keys:
+    - the alphabetic prefix followed by the first two digits ("wasp12b" -> "wasp12"),
+    - all the digits followed by the last character ("wasp12b" -> "12b").
+
+    :param Series norm_names: Normalised names
+    :return list_of_Series keys: The blocking keys of each name, one Series per blocking
+    """
+    prefix = norm_names.str.extract(r"^([^\d]*\d{0,2})", expand=False).fillna("")
+    digits = norm_names.str.replace(r"[^\d]", "", regex=True) + norm_names.str[-1:]
+    return [prefix, digits.where(digits.str.len() > 1, "")]
+
+
+def levenshtein_distances(names1, names2):
+    """Return the Levenshtein distance between each pair (names1[i], names2[i]).
+
+    The dynamic programming is vectorised over the pairs: the loops are only over the characters.
+
+    :param array_of_str names1: First name of each pair
+    :param array_of_str names2: Second name of each pair
+    :return array dist: Levenshtein distance of each pair
+    """
+    names1 = asarray(names1, dtype=str)
+    names2 = asarray(names2, dtype=str)
+    n_pairs = len(names1)
+    len1 = char_str_len(names1)
+    len2 = char_str_len(names2)
+    l1 = int(len1.max()) if n_pairs > 0 else 0
+    l2 = int(len2.max()) if n_pairs > 0 else 0
+    # Unicode code points of each character, shape (n_pairs, length)
+    chars1 = names1.astype("U{}".format(max(l1, 1))).view(uint32).reshape(n_pairs, max(l1, 1))
+    chars2 = names2.astype("U{}".format(max(l2, 1))).view(uint32).reshape(n_pairs, max(l2, 1))
+    prev = tile(arange(l2 + 1), (n_pairs, 1))
+    dist = prev[arange(n_pairs), len2].copy()  # Distances of the pairs with an empty first name
+    for i in range(1, l1 + 1):
+        cur = empty_like(prev)
+        cur[:, 0] = i
+        substitution = prev[:, :-1] + (chars1[:, i - 1:i] != chars2[:, :l2])
+        deletion = prev[:, 1:] + 1
+        best = minimum(substitution, deletion)
+        for j in range(1, l2 + 1):
+            cur[:, j] = minimum(best[:, j - 1], cur[:, j - 1] + 1)
+        done = len1 == i
+        dist[done] = cur[done, len2[done]]
+        prev = cur
+    return dist
+
+
+def get_fuzzy_match_keys(names1, names2, threshold=0.8):
+    """Return integer keys allowing to merge two catalogs on similar names.
+
+    The names are normalised and the names which are identical once normalised are matched (score 1).
+    The others are matched to the most similar name of the other catalog among the ones which share a
+    blocking key with it (see get_blocking_keys), the similarity score being
+    1 - levenshtein distance / length of the longest name. Each normalised name is matched at most
+    once and only if its score is at least threshold.
+
+    :param list_of_str names1: Names of the rows of catalog 1
+    :param list_of_str names2: Names of the rows of catalog 2
+    :param float threshold: Minimum score of a match
+    :return array key1: Keys of the rows of catalog 1
+    :return array key2: Keys of the rows of catalog 2
+    :return array score: Score of the match for the rows of catalog 2 (nan if there is no match)
+    """
+    norm1 = normalize_names(names1)
+    norm2 = normalize_names(names2)
+    codes1, uniq1 = factorize(norm1)
+    codes2, uniq2 = factorize(norm2)
+    uniq1 = Series(uniq1, dtype=object)
+    uniq2 = Series(uniq2, dtype=object)
+    # Match of each unique name of catalog 2: index in uniq1 and score
+    match = full(len(uniq2), -1, dtype=int)
+    score = full(len(uniq2), nan)
+    exact = Index(uniq1).get_indexer(uniq2)
+    exact[(uniq2 == "").values] = -1
+    match[exact >= 0] = exact[exact >= 0]
+    score[exact >= 0] = 1.
+    # Candidate pairs among the names which are not matched exactly
+    left = DataFrame({"i1": arange(len(uniq1)), "name1": uniq1})
+    left = left[~left["i1"].isin(exact) & (left["name1"] != "")]
+    right = DataFrame({"i2": arange(len(uniq2)), "name2": uniq2})
+    right = right[(exact < 0) & (right["name2"] != "").values]
+    l_pairs = []
+    for key1, key2 in zip(get_blocking_keys(left["name1"]), get_blocking_keys(right["name2"])):
+        l_pairs.append(left.assign(key=key1)[key1 != ""].merge(right.assign(key=key2)[key2 != ""], on="key"))
+    pairs = concat(l_pairs, ignore_index=True).drop_duplicates(["i1", "i2"])
+    if len(pairs) > 0:
+        dist = levenshtein_distances(pairs["name1"].values, pairs["name2"].values)
+        length = maximum(pairs["name1"].str.len().values, pairs["name2"].str.len().values)
+        pairs["score"] = 1 - dist / length
+        pairs = pairs[pairs["score"] >= threshold].sort_values("score", ascending=False, kind="stable")
+        # Keep the best match of each name, on both sides
+        pairs = pairs.drop_duplicates("i2").drop_duplicates("i1")
+        match[pairs["i2"].values] = pairs["i1"].values
+        score[pairs["i2"].values] = pairs["score"].values
+    # Keys of the rows
+    key1 = asarray(codes1).copy()
+    key1[key1 < 0] = len(uniq1) + arange((key1 < 0).sum())
+    key1[(norm1 == "").values] = len(uniq1) + len(key1) + arange((norm1 == "").sum())
+    match_rows = match[codes2]
+    score_rows = score[codes2]
+    key2 = match_rows.copy()
+    not_found = (match_rows < 0) | (norm2 == "").values
+    key2[not_found] = 2 * len(key1) + len(uniq1) + arange(not_found.sum())
+    score_rows[not_found] = nan
+    return key1, key2, score_rows
@@ -0,0 +1,185 @@
+"""Observability of the targets of a catalog from an observatory over a grid of times.
+
+The altitude of all the targets at all the times is computed at once as a (n_targets x n_times) NumPy
+array, from the local sidereal time of each time and the ra/dec of each target, instead of one astropy
+AltAz transformation per target. The positions of the Sun (for the night) and of the Moon (for the
+separation to the targets) are computed with the low precision formulae of the Astronomical Almanac.
+
+The precision (a fraction of degree: no precession of the J2000 coordinates, no nutation, refraction or
+lunar parallax) is sufficient to select the observable targets with airmass, twilight and Moon
+separation limits, not to point a telescope.
+
+The targets are processed by chunks to cap the memory used by the (n_targets x n_times) arrays.
+"""
+from numpy import (arccos, arcsin, arctan2, asarray, atleast_1d, clip, cos, degrees, empty, ones, radians, sin,
+                   tan, where, zeros)
+
+
+# Default maximum number of elements of the (n_targets x n_times) arrays of a chunk
+max_chunk_elements = 2**22
+
+j2000 = 2451545.0
+
+
+def get_julian_dates(times):
+    """Return the julian dates of times (astropy Time or julian dates) as an array."""
+    return atleast_1d(asarray(getattr(times, "jd", times), dtype=float))
+
+
+def get_longitude_latitude(location):
+    """Return the longitude (East positive) and latitude in degrees of a location.
+
+    :param astropy.coordinates.EarthLocation/tuple location: EarthLocation or tuple (longitude,
+        latitude) in degrees
+    """
+    if hasattr(location, "lon") and hasattr(location, "lat"):
+        return float(location.lon.to_value("deg")), float(location.lat.to_value("deg"))
+    longitude, latitude = location
+    return float(longitude), float(latitude)
+
+
+def get_local_sidereal_time(jd, longitude):
+    """Return the local mean sidereal time in degrees.
+
+    :param array jd: Julian dates (UT)
+    :param float longitude: Longitude (East positive) in degrees
+    """
+    return (280.46061837 + 360.98564736629 * (jd - j2000) + longitude) % 360.
+
+
+def ecliptic_2_equatorial(lon, lat, jd):
+    """Return the right ascension and declination (degrees) of ecliptic coordinates (degrees)."""
+    eps = radians(23.439 - 4e-7 * (jd - j2000))
+    lon, lat = radians(lon), radians(lat)
+    ra = arctan2(sin(lon) * cos(eps) - tan(lat) * sin(eps), cos(lon))
+    dec = arcsin(sin(lat) * cos(eps) + cos(lat) * sin(eps) * sin(lon))
+    return degrees(ra) % 360., degrees(dec)
+
+
+def get_sun_radec(jd):
+    """Return the right ascension and declination (degrees) of the Sun (precision ~0.01 degree)."""
+    n = jd - j2000
+    mean_lon = 280.460 + 0.9856474 * n
+    anomaly = radians(357.528 + 0.9856003 * n)
+    lon = mean_lon + 1.915 * sin(anomaly) + 0.020 * sin(2 * anomaly)
+    return ecliptic_2_equatorial(lon, zeros(len(jd)), jd)
+
+
+def get_moon_radec(jd):
+    """Return the geocentric right ascension and declination (degrees) of the Moon (precision ~0.3
+    degree)."""
+    t = (jd - j2000) / 36525.
+
+    def sind(angle):
+        return sin(radians(angle))
+
+    lon = (218.32 + 481267.881 * t + 6.29 * sind(135.0 + 477198.87 * t) - 1.27 * sind(259.3 - 413335.36 * t) +
+           0.66 * sind(235.7 + 890534.22 * t) + 0.21 * sind(269.9 + 954397.74 * t) -
+           0.19 * sind(357.5 + 35999.05 * t) - 0.11 * sind(186.5 + 966404.03 * t))
+    lat = (5.13 * sind(93.3 + 483202.02 * t) + 0.28 * sind(228.2 + 960400.89 * t) -
+           0.28 * sind(318.3 + 6003.15 * t) - 0.17 * sind(217.6 - 407332.21 * t))
+    return ecliptic_2_equatorial(lon, lat, jd)
+
+
+def get_altitude(ra, dec, lst, latitude, grid=True):
+    """Return the altitude (degrees) of targets at several local sidereal times.
+
+    :param array ra: Right ascensions of the targets (degrees)
+    :param array dec: Declinations of the targets (degrees)
+    :param array lst: Local sidereal times (degrees)
+    :param float latitude: Latitude of the observatory (degrees)
+    :param bool grid: If True the altitude of each target is computed at each time, otherwise ra, dec
+        and lst have the same length and the altitude of the i-th target is computed at the i-th time.
+    :return array altitude: Altitudes (n_targets x n_times if grid)
+    """
+    ra = asarray(ra, dtype=float)
+    dec = radians(asarray(dec, dtype=float))
+    lst = asarray(lst, dtype=float)
+    if grid:
+        ra, dec, lst = ra[:, None], dec[:, None], lst[None, :]
+    lat = radians(latitude)
+    return degrees(arcsin(clip(sin(dec) * sin(lat) + cos(dec) * cos(lat) * cos(radians(lst - ra)), -1., 1.)))
+
+
+def get_airmass(altitude):
+    """Return the airmass at altitudes in degrees (Kasten & Young 1989, inf below the horizon)."""
+    altitude = asarray(altitude, dtype=float)
+    with_horizon = where(altitude > 0, altitude, 90.)
+    airmass = 1. / (sin(radians(with_horizon)) + 0.50572 * (with_horizon + 6.07995)**-1.6364)
+    return where(altitude > 0, airmass, float("inf"))
+
+
+def get_separation(ra1, dec1, ra2, dec2):
+    """Return the angular separation (degrees) between targets and positions at several times.
+
+    :param array ra1: Right ascensions of the targets (degrees)
+    :param array dec1: Declinations of the targets (degrees)
+    :param array ra2: Right ascensions at each time (degrees)
+    :param array dec2: Declinations at each time (degrees)
+    :return array separation: Separations (n_targets x n_times)
+    """
+    dec1 = radians(asarray(dec1, dtype=float))[:, None]
+    dec2 = radians(asarray(dec2, dtype=float))[None, :]
+    delta_ra = radians(asarray(ra2, dtype=float)[None, :] - asarray(ra1, dtype=float)[:, None])
+    return degrees(arccos(clip(sin(dec1) * sin(dec2) + cos(dec1) * cos(dec2) * cos(delta_ra), -1., 1.)))
+
+
+def get_observable(ra, dec, times, location, max_airmass=2., sun_altitude=-12., min_moon_separation=None,
+                   chunksize=None):
+    """Return for each target and each time True if the target is observable.
+
+    A target is observable at a time if its airmass is at most max_airmass, the Sun is below
+    sun_altitude and the target is at least min_moon_separation from the Moon.
+
+    :param array ra: Right ascensions of the targets (degrees, J2000)
+    :param array dec: Declinations of the targets (degrees, J2000)
+    :param astropy.time.Time/array times: Times (astropy Time or julian dates)
+    :param astropy.coordinates.EarthLocation/tuple location: Observatory (EarthLocation or tuple
+        (longitude, latitude) in degrees, longitude East positive)
+    :param float max_airmass: Maximum airmass
+    :param float sun_altitude: Maximum altitude of the Sun (degrees, -12 for the nautical twilight).
+        If None, the day times are not excluded.
+    :param float min_moon_separation: Minimum separation to the Moon (degrees). If None, the Moon is
+        not considered.
+    :param int chunksize: Number of targets processed at once. If None, max_chunk_elements // n_times.
+    :return array observable: Booleans (n_targets x n_times), False for the targets without ra or dec
+    """
+    jd = get_julian_dates(times)
+    longitude, latitude = get_longitude_latitude(location)
+    ra = asarray(ra, dtype=float)
+    dec = asarray(dec, dtype=float)
+    lst = get_local_sidereal_time(jd, longitude)
+    night = ones(len(jd), dtype=bool)
+    if sun_altitude is not None:
+        sun_ra, sun_dec = get_sun_radec(jd)
+        night = get_altitude(sun_ra, sun_dec, lst, latitude, grid=False) < sun_altitude
+    if min_moon_separation is not None:
+        moon_ra, moon_dec = get_moon_radec(jd)
+    # The airmass limit is converted once to an altitude limit (the airmass decreases with the altitude)
+    min_altitude = get_min_altitude(max_airmass)
+    if chunksize is None:
+        chunksize = max(max_chunk_elements // max(len(jd), 1), 1)
+    observable = empty((len(ra), len(jd)), dtype=bool)
+    for start in range(0, len(ra), chunksize):
+        chunk = slice(start, start + chunksize)
+        res = get_altitude(ra[chunk], dec[chunk], lst, latitude) >= min_altitude
+        res &= night[None, :]
+        if min_moon_separation is not None:
+            res &= get_separation(ra[chunk], dec[chunk], moon_ra, moon_dec) >= min_moon_separation
+        observable[chunk] = res
+    return observable
+
+
+def get_min_altitude(max_airmass):
+    """Return the altitude (degrees) at which the airmass is max_airmass."""
+    # Bisection on the monotonic airmass function, precise to ~1e-10 degree
+    low, high = 0., 90.
+    if max_airmass <= 1.:
+        return 90.
+    for _ in range(40):
+        middle = (low + high) / 2
+        if get_airmass(middle) > max_airmass:
+            low = middle
+        else:
+            high = middle
+    return high
@@ -0,0 +1,288 @@
+"""Opt-in instrumentation of the stages of the loading and merging of the databases.
+
+The hot paths of exopandas are divided in stages (see stages), each one run in a stage context:
+
+    with stage("rename", database):
+        ...
+
+When the profiling is disabled (default) stage returns a shared context which does nothing, so the
+instrumentation only costs a function call per stage. When it is enabled (see enable or profile), each
+stage produces a record (dictionary) with:
+- "stage": Name of the stage,
+- "database": Database processed by the stage (by default the one of the enclosing stage),
+- "parent": Name of the enclosing stage (None for the outermost stages). The stages are nested (for
+  example "strip" within "read" within "load"), so the time of a stage includes the time of its
+  children,
+- "time": Duration in s,
+- "peak_memory": Peak of the memory allocated during the stage in bytes (None if the memory is not
+  traced). The memory is traced with tracemalloc, which slows down the execution, and it includes the
+  allocations of the other threads.
+- "thread": Name of the thread which run the stage.
+
+The records are sent to the callbacks (see add_callback, for example log_record which logs them with
+the logging module) and to the collectors open in the thread, like the one of ExoDataFrame.load. The
+records of the loads and merges which created an ExoDataFrame are available with
+ExoDataFrame.get_profile_report. The stages run in the worker processes of ExoDataFrame.load_many (with
+use_processes) are not recorded.
+"""
+import logging
+from contextlib import contextmanager, nullcontext
+from threading import Lock, current_thread, local
+from time import perf_counter
+import tracemalloc
+
+from pandas import DataFrame
+
+
+# Stages of the instrumented code
+stages = {"load": "ExoDataFrame.load of a database (all the stages below for this database)",
+          "read": "Read of the database from its source or from the on-disk cache",
+          "read_cache": "Read of the on-disk cache",
+          "write_cache": "Write of the on-disk cache",
+          "strip": "Removal of the white spaces and conversion of the values read by the TEPCat loaders",
+          "rename": "Renaming of the columns into the unified names",
+          "column_info": "Construction of the column information",
+          "convert_units": "Conversion of the unified columns into their units",
+          "filter": "Filtering of the rows (filters of ExoDataFrame.load)",
+          "merge": "ExoDataFrame merge with a database (all the stages below)",
+          "match": "Computation of the sky or fuzzy match keys",
+          "pandas_merge": "pandas.merge of the two DataFrames",
+          "conflicts": "Resolution of the overlapping columns and provenance",
+          }
+
+record_keys = ("stage", "database", "parent", "time", "peak_memory", "thread")
+
+logger = logging.getLogger(__name__)
+
+enabled = False
+_trace_memory = False
+_started_tracemalloc = False
+_callbacks = []
+_global_collectors = []
+_lock = Lock()
+_local = local()  # stack of the open stages and collectors of each thread
+
+_null_context = nullcontext()
+_end = object()  # Marks the end of the iterators of iter_stage
+
+
+def _get_thread_state():
+    if not(hasattr(_local, "stages")):
+        _local.stages = []
+        _local.collectors = []
+    return _local
+
+
+class _Stage(object):
+    """Context recording the time and memory of a stage."""
+
+    __slots__ = ("name", "database", "start", "start_memory", "child_peak")
+
+    def __init__(self, name, database=None):
+        self.name = name
+        self.database = database
+        self.child_peak = 0
+
+    def __enter__(self):
+        state = _get_thread_state()
+        if (self.database is None) and (len(state.stages) > 0):
+            self.database = state.stages[-1].database
+        state.stages.append(self)
+        self.start_memory = None
+        if _trace_memory and tracemalloc.is_tracing():
+            self.start_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = perf_counter() - self.start
+        state = _get_thread_state()
+        state.stages.pop()
+        parent = state.stages[-1] if len(state.stages) > 0 else None
+        peak_memory = None
+        if (self.start_memory is not None) and tracemalloc.is_tracing():
+            # The peak was reset by the children of the stage, their peaks are kept in child_peak
+            peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            peak_memory = max(peak - self.start_memory, 0)
+            if parent is not None:
+                parent.child_peak = max(parent.child_peak, peak)
+        record = {"stage": self.name, "database": self.database, "parent": None if parent is None else parent.name,
+                  "time": duration, "peak_memory": peak_memory, "thread": current_thread().name}
+        _send(record, state)
+        return False
+
+
+def _send(record, state):
+    """Send a record to the collectors and the callbacks."""
+    for collector in state.collectors:
+        collector.append(record)
+    if (len(_global_collectors) > 0) or (len(_callbacks) > 0):
+        with _lock:
+            for collector in _global_collectors:
+                collector.append(record)
+            callbacks = list(_callbacks)
+        for callback in callbacks:
+            callback(record)
+
+
+def _remove(collectors, records):
+    """Remove the list records from the list collectors (compared by identity, not by value)."""
+    for i in range(len(collectors) - 1, -1, -1):
+        if collectors[i] is records:
+            del collectors[i]
+            return
+
+
+def stage(name, database=None):
+    """Return the context of a stage (which does nothing if the profiling is disabled).
+
+    :param str name: Name of the stage (see stages)
+    :param str database: Database processed by the stage. If None, the one of the enclosing stage.
+    """
+    if not(enabled):
+        return _null_context
+    return _Stage(name, database)
+
+
+def iter_stage(iterable, name, database=None):
+    """Return an iterator over iterable, the production of each element being a stage.
+
+    :param iterable iterable: Iterable, for example an iterator over the chunks of a file
+    :param str name: Name of the stage
+    :param str database: Database processed by the stage (see stage)
+    """
+    iterator = iter(iterable)
+    while True:
+        with stage(name, database):
+            element = next(iterator, _end)
+        if element is _end:
+            return
+        yield element
+
+
+class collect(object):
+    """Context collecting the records of the stages run in the current thread.
+
+    The records are in the list returned by __enter__ (None if the profiling is disabled).
+    """
+
+    __slots__ = ("records", )
+
+    def __enter__(self):
+        if not(enabled):
+            self.records = None
+            return None
+        self.records = []
+        _get_thread_state().collectors.append(self.records)
+        return self.records
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.records is not None:
+            _remove(_get_thread_state().collectors, self.records)
+        return False
+
+
+def enable(memory=False):
+    """Enable the profiling.
+
+    :param bool memory: If True, the peak memory of the stages is measured with tracemalloc (which is
+        started if needed and slows down the execution)
+    """
+    global enabled, _trace_memory, _started_tracemalloc
+    if memory and not(tracemalloc.is_tracing()):
+        tracemalloc.start()
+        _started_tracemalloc = True
+    _trace_memory = memory
+    enabled = True
+
+
+def disable():
+    """Disable the profiling (and stop tracemalloc if it was started by enable)."""
+    global enabled, _trace_memory, _started_tracemalloc
+    enabled = False
+    _trace_memory = False
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+
+def is_enabled():
+    """Return True if the profiling is enabled."""
+    return enabled
+
+
+def add_callback(callback):
+    """Add a function called with each record (in the thread which run the stage).
+
+    :param function callback: Function taking a record (dictionary, see the module docstring)
+    """
+    with _lock:
+        _callbacks.append(callback)
+
+
+def remove_callback(callback):
+    """Remove a callback added with add_callback."""
+    with _lock:
+        if callback in _callbacks:
+            _callbacks.remove(callback)
+
+
+def log_record(record, level=logging.INFO):
+    """Callback logging a record with the logger exopandas.profiling."""
+    if logger.isEnabledFor(level):
+        memory = "" if record["peak_memory"] is None else ", peak memory {:.1f} MiB".format(record["peak_memory"] /
+                                                                                         2**20)
+        logger.log(level, "%s[%s]: %.4f s%s", record["stage"], record["database"], record["time"], memory)
+
+
+@contextmanager
+def profile(memory=False, callbacks=()):
+    """Context enabling the profiling and collecting the records of all the threads.
+
+    Usage:
+        with profile() as records:
+            edf.load_many([...])
+        print(get_report(records, summary=True))
+
+    :param bool memory: If True, the peak memory of the stages is measured (see enable)
+    :param list_of_function callbacks: Callbacks added during the profiling (see add_callback)
+    :return list_of_dict records: Records of the stages, filled during the profiling
+    """
+    records = []
+    previous = (enabled, _trace_memory)
+    enable(memory=memory or previous[1])
+    with _lock:
+        _global_collectors.append(records)
+    for callback in callbacks:
+        add_callback(callback)
+    try:
+        yield records
+    finally:
+        for callback in callbacks:
+            remove_callback(callback)
+        with _lock:
+            _remove(_global_collectors, records)
+        if not(previous[0]) or not(previous[1]):
+            disable()
+        if previous[0]:
+            enable(memory=previous[1])
+
+
+def get_report(records, summary=False):
+    """Return the report of records.
+
+    :param list_of_dict records: Records of the stages
+    :param bool summary: If True, the records are summed by database and stage (columns database,
+        stage, count, time and peak_memory, the maximum), ordered by decreasing time. Otherwise the
+        records are returned in the order in which the stages ended.
+    :return DataFrame report: Report
+    """
+    report = DataFrame(list(records), columns=list(record_keys))
+    report["peak_memory"] = report["peak_memory"].astype(float)
+    if not(summary):
+        return report
+    report["database"] = report["database"].fillna("")
+    report = report.groupby(["database", "stage"], sort=False).agg(count=("time", "size"), time=("time", "sum"),
+                                                                     peak_memory=("peak_memory", "max"))
+    return report.sort_values("time", ascending=False).reset_index()
@@ -0,0 +1,175 @@
+"""Lazily evaluated queries on an ExoDataFrame or on a database.
+
+A query records the row filters (column, operator, value), like the filters of
+exopandas.databases.streaming, and the column projections, and only executes them when collect is
+called, so that the selections can be chained without creating an intermediate ExoDataFrame for each
+of them. Each method returns a new query, the queries can be reused to build other ones.
+
+The plan of a query (see explain) is optimised before its execution:
+- the projections are combined in the final columns, the columns only used by the filters are not
+  kept in the result,
+- on a database which is not loaded yet, the filters and the columns are pushed down into the loader
+  (ExoDataFrame.load), which only reads the needed columns and filters the rows while reading them,
+- on a loaded ExoDataFrame, the filters are applied by increasing selectivity (fraction of the rows
+  which satisfy them, estimated on a sample of the rows), each filter being evaluated only on the rows
+  which satisfy the previous ones, and the result is extracted at once.
+"""
+from numpy import arange
+from numpy.random import default_rng
+
+from .databases.streaming import check_filters, comparison_operators, get_filter_mask
+
+
+# Maximum number of rows used to estimate the selectivity of the filters
+selectivity_sample_size = 1000
+
+
+class Query(object):
+    """Lazily evaluated selection of the rows and columns of an ExoDataFrame or of a database."""
+
+    def __init__(self, source, database=None, unify=True, use_cache=True, chunksize=None):
+        """
+        :param ExoDataFrame source: ExoDataFrame to query. If database is provided, it is the empty
+            ExoDataFrame in which the database is loaded.
+        :param str database: Name of the database to query (it is loaded by collect)
+        :param bool unify: If True the database is unified (see ExoDataFrame.load)
+        :param bool use_cache: If True the database is read from the on-disk cache when possible
+        :param int chunksize: If provided, the database is read and filtered by chunks of chunksize rows
+        """
+        self._source = source
+        self._database = database
+        self._unify = unify
+        self._use_cache = use_cache
+        self._chunksize = chunksize
+        self._filters = []
+        self._columns = None
+
+    def __repr__(self):
+        return self.explain()
+
+    def _copy(self):
+        query = Query(self._source, database=self._database, unify=self._unify, use_cache=self._use_cache,
+                      chunksize=self._chunksize)
+        query._filters = list(self._filters)
+        query._columns = None if self._columns is None else list(self._columns)
+        return query
+
+    def _check_column(self, column):
+        if (self._columns is not None) and (column not in self._columns):
+            raise ValueError("{} is not one of the columns selected by the query {}.".format(column, self._columns))
+        if (self._database is None) and (column not in self._source.columns):
+            raise ValueError("{} is not an existing column !".format(column))
+
+    def where(self, column, operator, value):
+        """Return a query which also keeps only the rows satisfying a filter.
+
+        :param str column: Column of the filter
+        :param str operator: Operator (see exopandas.databases.streaming.comparison_operators)
+        :param value: Value compared to the column
+        :return Query query: New query
+        """
+        filt = check_filters([(column, operator, value), ])[0]
+        self._check_column(column)
+        query = self._copy()
+        query._filters.append(filt)
+        return query
+
+    def between(self, column, low=None, high=None):
+        """Return a query which also keeps only the rows with low <= column <= high.
+
+        :param str column: Column of the filter
+        :param low: Minimum value (None for no minimum)
+        :param high: Maximum value (None for no maximum)
+        :return Query query: New query
+        """
+        query = self
+        if low is not None:
+            query = query.where(column, ">=", low)
+        if high is not None:
+            query = query.where(column, "<=", high)
+        return query
+
+    def select(self, columns):
+        """Return a query which also keeps only some columns.
+
+        :param str/list_of_str columns: Columns to keep, among the ones selected by the query
+        :return Query query: New query
+        """
+        if isinstance(columns, str):
+            columns = [columns, ]
+        for column in columns:
+            self._check_column(column)
+        query = self._copy()
+        query._columns = list(dict.fromkeys(columns))
+        return query
+
+    def get_plan(self):
+        """Return the optimised plan of the query.
+
+        :return dict plan: Dictionary with the keys:
+            - "database": Name of the database to load (None for a loaded ExoDataFrame),
+            - "pushed_columns": Columns read by the loader (None for all the columns),
+            - "pushed_filters": Filters applied by the loader,
+            - "filters": List of tuples (filter, estimated selectivity) applied to the loaded
+              ExoDataFrame, in the order of their application,
+            - "columns": Columns of the result (None for all the columns)
+        """
+        plan = {"database": self._database, "pushed_columns": None, "pushed_filters": [], "filters": [],
+                "columns": self._columns}
+        if self._database is not None:
+            plan["pushed_filters"] = list(self._filters)
+            if self._columns is not None:
+                plan["pushed_columns"] = list(dict.fromkeys(self._columns + [filt[0] for filt in self._filters]))
+        else:
+            plan["filters"] = sorted(zip(self._filters, self._get_selectivities()), key=lambda item: item[1])
+        return plan
+
+    def _get_selectivities(self):
+        """Return the fraction of the rows of the source which satisfy each filter (estimated on a sample)."""
+        df = self._source
+        if len(df) > selectivity_sample_size:
+            positions = default_rng(0).choice(len(df), selectivity_sample_size, replace=False)
+            df = df.iloc[positions]
+        if len(df) == 0:
+            return [1., ] * len(self._filters)
+        return [get_filter_mask(df, [filt, ]).mean() for filt in self._filters]
+
+    def explain(self):
+        """Return the description of the optimised plan of the query."""
+        plan = self.get_plan()
+        lines = ["Query plan:"]
+        if plan["database"] is not None:
+            lines.append("  Load {} ({}{})".format(plan["database"], "unified" if self._unify else "not unified",
+                                                   ", from the cache if valid" if self._use_cache else ""))
+            lines.append("    pushed down columns: {}".format("all" if plan["pushed_columns"] is None
+                                                              else plan["pushed_columns"]))
+            lines.append("    pushed down filters: {}".format(plan["pushed_filters"] or "none"))
+        else:
+            lines.append("  Scan ExoDataFrame ({} rows)".format(len(self._source)))
+            for filt, selectivity in plan["filters"]:
+                lines.append("  Filter {} {} {!r} (selectivity ~{:.2f})".format(*(filt + (selectivity, ))))
+        lines.append("  Project {}".format("all columns" if plan["columns"] is None else plan["columns"]))
+        return "\n".join(lines)
+
+    def collect(self):
+        """Execute the query and return the result.
+
+        :return ExoDataFrame res: Selected rows and columns
+        """
+        plan = self.get_plan()
+        if plan["database"] is not None:
+            res = self._source.__class__()
+            res.load(plan["database"], unify=self._unify, use_cache=self._use_cache, columns=plan["pushed_columns"],
+                     filters=plan["pushed_filters"] or None, chunksize=self._chunksize)
+            return res if plan["columns"] is None else res[plan["columns"]]
+        df = self._source
+        positions = arange(len(df))
+        for (column, operator, value), _ in plan["filters"]:
+            values = df[column]
+            if len(positions) < len(df):
+                values = values.iloc[positions]
+            positions = positions[comparison_operators[operator](values, value).to_numpy(dtype=bool,
+                                                                                       na_value=False)]
+        if plan["columns"] is None:
+            return df.iloc[positions]
+        return df.iloc[positions, df.columns.get_indexer(plan["columns"])]
@@ -0,0 +1,159 @@
+"""Publication of an ExoDataFrame in shared memory, to be attached without copy by other processes.
+
+publish writes the ExoDataFrame once in an Arrow IPC file of shared_memory_folder (/dev/shm, a memory
+backed file system, when it exists), with its column_info and databases_included in the metadata of
+the file. attach memory-maps the file and builds an ExoDataFrame whose columns are views on the
+mapped buffers, so the time and memory needed to attach only depend on the number of columns, not on
+the number of rows, and all the processes attached share the same physical memory.
+
+The columns are zero-copy for the numerical dtypes without missing values in Arrow: the float columns
+are written with their NaN values (and not as missing values), the text columns become Arrow-backed
+strings and the categoricals keep their codes. Only the boolean columns (bit-packed in Arrow) and
+the columns with nullable dtypes (Int8, boolean, ...) are converted when attaching, and pandas checks
+the categories of the categoricals (which takes a time proportional to their number of categories).
+The attached values are read-only: modifying them requires a copy of the ExoDataFrame
+(ExoDataFrame.copy). The first attach of a process also imports astropy to rebuild the units.
+
+The file stays valid for the attached processes after unpublish (the memory is released when the last
+of them detaches).
+"""
+from json import dumps, loads
+from os import listdir, remove, replace
+from os.path import isdir, isfile, join
+from tempfile import gettempdir
+from uuid import uuid4
+
+from pandas import RangeIndex, StringDtype
+from pandas.api.types import is_extension_array_dtype, is_float_dtype
+
+from .databases.column_registry import FrameColumn, FrameColumnInfo
+from .databases.unit_conversion import json_2_unit, unit_2_json
+
+
+shared_memory_folder = "/dev/shm" if isdir("/dev/shm") else gettempdir()
+
+metadata_key = b"exopandas"
+index_column = "__index__"
+
+
+def get_shared_path(name):
+    """Return the path of the file of a published ExoDataFrame."""
+    return join(shared_memory_folder, "exopandas-{}.arrow".format(name))
+
+
+def get_metadata(edf):
+    """Return the metadata of an ExoDataFrame needed to rebuild it (JSON serialisable dictionary).
+
+    :param ExoDataFrame edf: ExoDataFrame
+    :return dict metadata: Dictionary with the keys "column_info" (list of the fields of the FrameColumn
+        records), "databases_included", "index" (None or the start, stop and step of a RangeIndex) and
+        "dtypes" (dtypes of the columns with a nullable dtype, restored when attaching). The indexes
+        which are not RangeIndex are stored in the column index_column.
+    """
+    if isinstance(edf.index, RangeIndex):
+        index = [edf.index.start, edf.index.stop, edf.index.step]
+    else:
+        index = None
+    column_info = [[record.column, record.description, unit_2_json(record.unit), bool(record.unified),
+                    record.database] for record in edf._column_info if record.column in edf.columns]
+    dtypes = {column: str(dtype) for column, dtype in edf.dtypes.items()
+              if is_extension_array_dtype(dtype) and (dtype.name not in ("category", "str", "string"))}
+    return {"column_info": column_info, "databases_included": list(edf._databases_included), "index": index,
+            "index_name": edf.index.name, "dtypes": dtypes}
+
+
+def get_column_info(metadata):
+    """Return the FrameColumnInfo (frozen) of metadata returned by get_metadata."""
+    return FrameColumnInfo([FrameColumn(column, description, json_2_unit(unit), unified, database)
+                            for column, description, unit, unified, database in metadata["column_info"]]).freeze()
+
+
+def _get_table(edf):
+    """Return the Arrow table of an ExoDataFrame, with the NaN of the float columns kept as values."""
+    from pyarrow import ArrowException, Table, array
+    arrays = []
+    names = []
+    columns = list(edf.columns)
+    if not(isinstance(edf.index, RangeIndex)):
+        columns.append(index_column)
+    for column in columns:
+        values = edf.index.to_series() if column == index_column else edf[column]
+        if not(isinstance(column, str)):
+            raise ValueError("The columns should be strings to publish the ExoDataFrame, got {!r}."
+                             "".format(column))
+        try:
+            if is_float_dtype(values.dtype) and not(is_extension_array_dtype(values.dtype)):
+                arrays.append(array(values.to_numpy(), from_pandas=False))
+            else:
+                arrays.append(array(values, from_pandas=True))
+        except (ArrowException, TypeError) as e:
+            raise ValueError("Column {} cannot be stored in Arrow ({}).".format(column, e))
+        names.append(column)
+    return Table.from_arrays(arrays, names=names)
+
+
+def publish(edf, name=None):
+    """Write an ExoDataFrame in shared memory.
+
+    :param ExoDataFrame edf: ExoDataFrame to publish
+    :param str name: Name of the publication. If None, a random name is used. An existing publication
+        with the same name is replaced (the processes attached to it keep the previous version).
+    :return str name: Name of the publication, to pass to attach
+    """
+    from pyarrow import OSFile
+    from pyarrow.ipc import new_file
+    if name is None:
+        name = uuid4().hex
+    table = _get_table(edf)
+    table = table.replace_schema_metadata({metadata_key: dumps(get_metadata(edf)).encode()})
+    filename = get_shared_path(name)
+    with OSFile(filename + ".tmp", "wb") as f, new_file(f, table.schema) as writer:
+        writer.write_table(table)
+    replace(filename + ".tmp", filename)
+    return name
+
+
+def attach(name):
+    """Return the DataFrame, column_info and databases_included of a publication, without copy.
+
+    :param str name: Name of the publication (see publish)
+    :return DataFrame df: DataFrame whose columns are views on the shared memory
+    :return FrameColumnInfo column_info: Column information
+    :return tuple databases_included: Databases included
+    """
+    from pyarrow import large_string, memory_map, string
+    from pyarrow.ipc import open_file
+    filename = get_shared_path(name)
+    if not(isfile(filename)):
+        raise ValueError("There is no ExoDataFrame published with the name {}.".format(name))
+    with memory_map(filename) as source:
+        table = open_file(source).read_all()
+    metadata = loads(table.schema.metadata[metadata_key])
+    str_dtype = StringDtype("pyarrow", na_value=float("nan"))
+    # split_blocks keeps one block per column, which avoids the copies of the consolidation
+    df = table.to_pandas(split_blocks=True, types_mapper={string(): str_dtype, large_string(): str_dtype}.get)
+    for column, dtype in metadata["dtypes"].items():
+        df[column] = df[column].astype(dtype)
+    if index_column in df.columns:
+        df = df.set_index(index_column)
+        df.index.name = metadata["index_name"]
+    elif metadata["index"] is not None:
+        df.index = RangeIndex(*metadata["index"])
+    return df, get_column_info(metadata), tuple(metadata["databases_included"])
+
+
+def unpublish(name):
+    """Remove a publication (the processes attached to it can still use it).
+
+    :param str name: Name of the publication (see publish)
+    """
+    filename = get_shared_path(name)
+    if isfile(filename):
+        remove(filename)
+
+
+def get_published_names():
+    """Return the names of the publications of shared_memory_folder."""
+    prefix, suffix = "exopandas-", ".arrow"
+    return sorted([filename[len(prefix):-len(suffix)] for filename in listdir(shared_memory_folder)
+                   if filename.startswith(prefix) and filename.endswith(suffix)])
@@ -0,0 +1,39 @@
+"""Fixtures of the tests, which run on the synthetic catalogs of benchmarks/catalogs.py.
+
+The cache, the snapshot store and the shared memory folder are redirected to the temporary folder of
+each test, so the tests never read or write the real databases.
+"""
+import sys
+from os.path import dirname, join
+
+import pytest
+
+sys.path.insert(0, join(dirname(dirname(dirname(__file__))), "benchmarks"))
+
+import catalogs  # noqa: E402
+
+from exopandas import sharing  # noqa: E402
+from exopandas.databases import cache, snapshots  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def folders(tmp_path, monkeypatch):
+    """Redirect the folders written by exopandas to the temporary folder of the test."""
+    monkeypatch.setattr(cache, "cache_folder", str(tmp_path / "cache"))
+    monkeypatch.setattr(snapshots, "snapshot_folder", str(tmp_path / "snapshots"))
+    (tmp_path / "shm").mkdir()
+    monkeypatch.setattr(sharing, "shared_memory_folder", str(tmp_path / "shm"))
+
+
+@pytest.fixture
+def install(tmp_path):
+    """Return a function writing synthetic catalogs and redirecting the databases to them.
+
+    The function takes the list of the databases and the scale of the catalogs (see
+    catalogs.write_catalogs) and returns the dictionary {database: path of the catalog}.
+    """
+    def install(databases, scale=0.05):
+        paths = catalogs.write_catalogs(str(tmp_path), scale=scale, databases=databases)
+        catalogs.install_catalogs(paths)
+        return paths
+    return install
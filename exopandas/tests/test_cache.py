@@ -0,0 +1,33 @@
+"""Tests of the on-disk cache of the databases."""
+from exopandas.databases import cache
+from exopandas.databases.registry import dico_databases
+
+
+def test_cache_is_valid_until_the_source_changes(install):
+    path = install(["exoplanetarchive"])["exoplanetarchive"]
+    load_db = dico_databases["exoplanetarchive"]["load_db"]
+    db = cache.load_db_cached("exoplanetarchive", load_db, source_file=path)
+    assert cache.is_cache_valid("exoplanetarchive", source_file=path)
+    assert len(cache.read_cache("exoplanetarchive", source_file=path)) == len(db)
+    with open(path, "a") as f:
+        f.write(open(path).read().splitlines()[-1] + "\n")
+    assert not(cache.is_cache_valid("exoplanetarchive", source_file=path))
+    assert cache.read_cache("exoplanetarchive", source_file=path) is None
+    assert len(cache.load_db_cached("exoplanetarchive", load_db, source_file=path)) == len(db) + 1
+
+
+def test_source_changed_during_the_load_invalidates_the_cache(install):
+    path = install(["exoplanetarchive"])["exoplanetarchive"]
+    load_db = dico_databases["exoplanetarchive"]["load_db"]
+
+    def load_and_modify(*args, **kwargs):
+        db = load_db(*args, **kwargs)
+        with open(path, "a") as f:
+            f.write(open(path).read().splitlines()[-1] + "\n")
+        return db
+
+    db = cache.load_db_cached("exoplanetarchive", load_and_modify, source_file=path)
+    # The cache describes the version which was read, not the version of the source after the load
+    assert not(cache.is_cache_valid("exoplanetarchive", source_file=path))
+    assert len(cache.load_db_cached("exoplanetarchive", load_db, source_file=path)) == len(db) + 1
+    assert cache.is_cache_valid("exoplanetarchive", source_file=path)
@@ -0,0 +1,32 @@
+"""Tests of the matching of the rows of two catalogs on the sky and on similar names."""
+from numpy import array, isnan
+
+from exopandas.crossmatch import crossmatch_sky, get_sky_match_keys
+from exopandas.names import get_fuzzy_match_keys
+
+
+def test_crossmatch_sky_within_tolerance():
+    ra1, dec1 = array([10., 200., 359.9999]), array([-30., 45., 0.])
+    # 1 arcsec, 10 arcsec and across ra = 0 (0.36 + 0.36 arcsec)
+    ra2, dec2 = array([10. + 1. / 3600 / 0.866025, 200., 0.0001]), array([-30., 45. + 10. / 3600, 0.])
+    idx, sep = crossmatch_sky(ra1, dec1, ra2, dec2, tolerance=2.)
+    assert idx.tolist() == [0, -1, 2]
+    assert abs(sep[0] - 1.) < 1e-3
+    assert isnan(sep[1])
+    assert abs(sep[2] - 0.72) < 1e-3
+
+
+def test_sky_match_keys_pair_the_planets_by_letter():
+    ra, dec = array([10., 10.]), array([20., 20.])
+    key1, key2, sep = get_sky_match_keys(ra, dec, ra[::-1], dec[::-1], names1=["A b", "A c"],
+                                         names2=["B c", "B b"])
+    assert key2.tolist() == key1[::-1].tolist()
+    assert (sep == 0.).all()
+
+
+def test_fuzzy_match_keys():
+    key1, key2, score = get_fuzzy_match_keys(["WASP-12 b", "HD 209458 b"], ["wasp 12 b", "HD209458b", "Kepler-7 b"])
+    assert key2[0] == key1[0]
+    assert key2[1] == key1[1]
+    assert key2[2] not in key1
+    assert isnan(score[2])
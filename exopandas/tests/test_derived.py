@@ -0,0 +1,39 @@
+"""Tests of the derived columns."""
+import pytest
+from numpy import isinf
+
+from exopandas.derived import get_derivations
+from exopandas.exodataframe import ExoDataFrame
+
+
+@pytest.fixture
+def tepcat(install):
+    install(["tepcat well-studied"], scale=0.2)
+    edf = ExoDataFrame()
+    edf.load("tepcat well-studied")
+    return edf
+
+
+@pytest.mark.parametrize("column, mass, radius", [("st_rho", "st_mass", "st_rad"),
+                                                  ("pl_rhoj", "pl_massj", "pl_radj")])
+def test_densities_are_in_solar_and_jovian_densities(tepcat, column, mass, radius):
+    derived = tepcat.drop(columns=[column]).derive(column)
+    expected = tepcat[mass] / tepcat[radius]**3
+    assert derived[column].notna().sum() > 0
+    assert ((derived[column] / expected).dropna() - 1.).abs().max() < 1e-6
+
+
+def test_derive_does_not_write_infinite_values(tepcat):
+    edf = tepcat.drop(columns=["st_rho"])
+    edf.loc[edf.index[:3], "st_rad"] = 0.
+    derived = edf.derive("st_rho")
+    assert not(isinf(derived["st_rho"]).any())
+    assert derived["st_rho"].iloc[:3].isna().all()
+
+
+def test_scaled_semi_major_axis_from_the_stellar_density():
+    import astropy.units as u
+    derivation = [derivation for derivation in get_derivations()["pl_aR"] if derivation.inputs[0][0] == "st_rho"][0]
+    scale = derivation.get_scale([u.M_sun / u.R_sun**3, u.d], u.dimensionless_unscaled)
+    # The Earth is at 215 solar radii of the Sun
+    assert derivation.evaluate([1., 365.25], scale) == pytest.approx(215., rel=0.01)
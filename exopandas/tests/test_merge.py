@@ -0,0 +1,58 @@
+"""Tests of the merges of databases and of the resolution of the overlapping columns."""
+import pytest
+
+from exopandas.exodataframe import ExoDataFrame
+
+
+def test_load_many_default_rule_resolves_the_overlaps(install):
+    databases = ["exoplanetarchive", "exoplaneteu", "tepcat well-studied", "tepcat planning"]
+    install(databases)
+    edf = ExoDataFrame()
+    edf.load_many(databases)
+    assert not([column for column in edf.columns if column.endswith(("_x", "_y"))])
+    assert "pl_per" in edf.columns
+    assert set(edf["pl_per_src"].dropna().unique()) <= {-1, 0, 1, 2, 3}
+
+
+def test_load_many_merges_sweetcat_on_the_star_name(install):
+    install(["exoplanetarchive", "sweetcat"])
+    edf = ExoDataFrame()
+    edf.load_many(["exoplanetarchive", "sweetcat"], columns=["pl_name", "st_teff"])
+    assert edf._databases_included == ("exoplanetarchive", "sweetcat")
+    planets = edf[edf["pl_name"].notna()]
+    # The two planets of each star are matched with the row of their star in sweetcat
+    assert not(planets["pl_name"].duplicated().any())
+    assert (planets["st_teff_src"] == 1).any()
+    assert edf.loc[edf["pl_name"].isna(), "st_teff_src"].isin([-1, 1]).all()
+
+
+def test_load_many_raises_without_a_merge_key(install):
+    install(["tepcat well-studied", "sweetcat"])
+    with pytest.raises(ValueError, match="merged on"):
+        ExoDataFrame().load_many(["tepcat well-studied", "sweetcat"])
+
+
+@pytest.mark.parametrize("rule", ["left", "min_error"])
+def test_error_bars_follow_the_resolved_value(install, rule):
+    install(["exoplanetarchive", "exoplaneteu"], scale=0.2)
+    edf = ExoDataFrame()
+    edf.load("exoplanetarchive")
+    edf = edf.merge("exoplaneteu", kwargs_merge_col={"rule": rule})
+    from_archive = (edf["pl_per_src"] == 0).to_numpy()
+    from_eu = (edf["pl_per_src"] == 1).to_numpy()
+    assert (from_archive.sum() > 0) and (from_eu.sum() > 0)
+    # The error bars of a database are only kept on the rows whose value comes from this database
+    assert edf["pl_per_err_inf"][from_archive].isna().all()
+    assert edf["pl_orbpererr1"][from_eu].isna().all()
+
+
+def test_min_error_compares_the_error_bars_of_both_databases(install):
+    install(["exoplanetarchive", "exoplaneteu"], scale=0.2)
+    counts = {}
+    for rule in ("left", "min_error"):
+        edf = ExoDataFrame()
+        edf.load("exoplanetarchive")
+        edf = edf.merge("exoplaneteu", kwargs_merge_col={"rule": rule})
+        counts[rule] = (edf["pl_per_src"] == 1).sum()
+    # With "left" the values of exoplanet.eu only fill the missing values of the archive
+    assert counts["min_error"] > counts["left"]
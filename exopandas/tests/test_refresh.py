@@ -0,0 +1,71 @@
+"""Tests of the refresh of the databases included in an ExoDataFrame."""
+from os import utime
+
+import pytest
+from pandas import concat, read_csv
+
+from exopandas.databases import cache
+from exopandas.databases.registry import dico_databases
+from exopandas.exodataframe import ExoDataFrame
+
+
+@pytest.fixture
+def archive(install):
+    """Return the path of the synthetic archive, a function rewriting it and the merged ExoDataFrame."""
+    paths = install(["exoplanetarchive", "exoplaneteu"])
+    path = paths["exoplanetarchive"]
+    header = open(path).readline()
+
+    def write(db, mtime=2e9):
+        with open(path, "w") as f:
+            f.write(header)
+            db.to_csv(f, index=False)
+        utime(path, (mtime, mtime))
+
+    edf = ExoDataFrame()
+    edf.load_many(["exoplanetarchive", "exoplaneteu"], kwargs_merge_col={"rule": "min_error"})
+    return path, write, edf
+
+
+def test_refresh_raises_when_a_resolved_value_changed(archive):
+    path, write, edf = archive
+    key = dico_databases["exoplanetarchive"]["key"]
+    raw = read_csv(path, comment="#")
+    name = edf.loc[edf["pl_per_src"] == 0, "pl_name"].iloc[0]
+    raw.loc[raw[key] == name, "pl_orbper"] = 999.
+    write(raw)
+    before = edf.copy()
+    with pytest.raises(ValueError):
+        edf.refresh("exoplanetarchive")
+    assert edf.equals(before)
+    assert not(cache.is_cache_valid("exoplanetarchive", source_file=path))
+
+
+def test_refresh_appends_the_new_rows(archive):
+    path, write, edf = archive
+    key = dico_databases["exoplanetarchive"]["key"]
+    raw = read_csv(path, comment="#")
+    extra = raw.iloc[[0]].copy()
+    extra[key] = "New planet b"
+    write(concat([raw, extra]))
+    diff = edf.refresh("exoplanetarchive")
+    assert (len(diff.inserted), len(diff.updated), len(diff.deleted)) == (1, 0, 0)
+    row = edf[edf["pl_name"] == "New planet b"]
+    assert len(row) == 1
+    assert edf["pl_per_src"].dtype.kind == "i"
+    assert (row["pl_per_src"] == 0).all() or row["pl_per"].isna().all()
+    assert cache.is_cache_valid("exoplanetarchive", source_file=path)
+
+
+def test_refresh_fills_the_missing_resolved_values(archive):
+    path, write, edf = archive
+    key = dico_databases["exoplanetarchive"]["key"]
+    raw = read_csv(path, comment="#")
+    name = edf.loc[(edf["pl_per_src"] == -1) & edf["pl_name"].isin(raw[key]), "pl_name"].iloc[0]
+    raw.loc[raw[key] == name, "pl_orbper"] = 5.5
+    write(raw)
+    edf.refresh("exoplanetarchive")
+    row = edf[edf["pl_name"] == name]
+    assert row["pl_per"].tolist() == [5.5]
+    assert row["pl_per_src"].tolist() == [0]
+    assert edf["pl_per_src"].dtype.kind == "i"
@@ -0,0 +1,39 @@
+"""Tests of the publication of the ExoDataFrames in shared memory and of the snapshots of the databases."""
+import pytest
+
+from exopandas.databases.snapshots import get_snapshots, read_snapshot, take_snapshot
+from exopandas.exodataframe import ExoDataFrame
+from exopandas.sharing import get_published_names, unpublish
+
+
+def test_publish_and_attach(install):
+    install(["exoplanetarchive", "exoplaneteu"])
+    edf = ExoDataFrame()
+    edf.load_many(["exoplanetarchive", "exoplaneteu"])
+    name = edf.publish()
+    assert name in get_published_names()
+    attached = ExoDataFrame()
+    attached.attach(name)
+    assert attached.equals(edf)
+    assert attached.databases_included == edf.databases_included
+    assert attached.get_unit("pl_per") == edf.get_unit("pl_per")
+    unpublish(name)
+    assert name not in get_published_names()
+    with pytest.raises(ValueError):
+        ExoDataFrame().attach(name)
+
+
+def test_snapshots_keep_the_versions(install):
+    path = install(["exoplanetarchive"])["exoplanetarchive"]
+    first = take_snapshot("exoplanetarchive", date="2024-01-01")
+    assert take_snapshot("exoplanetarchive", date="2024-02-01") == first
+    assert len(get_snapshots("exoplanetarchive")) == 1
+    with open(path, "a") as f:
+        f.write(open(path).read().splitlines()[-1] + "\n")
+    assert take_snapshot("exoplanetarchive", date="2024-03-01") != first
+    old = read_snapshot("exoplanetarchive", "2024-02-15")
+    new = read_snapshot("exoplanetarchive", "2024-03-01")
+    assert len(new) == len(old) + 1
+    assert new.iloc[:len(old)].equals(old)
+    with pytest.raises(ValueError):
+        read_snapshot("exoplanetarchive", "2023-12-31")
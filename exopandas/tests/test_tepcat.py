@@ -0,0 +1,42 @@
+"""Tests of the reader of the TEPCat files."""
+import pytest
+
+from exopandas.databases import tepcat
+
+
+def test_columns_are_read_by_position(install, capsys):
+    path = install(["tepcat well-studied"])["tepcat well-studied"]
+    lines = open(path).read().splitlines()
+    # A renamed header column keeps its position (and the names of the module) with a warning
+    lines[0] = lines[0].replace("System", "Name", 1)
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    db = tepcat.load_db_WS()
+    assert list(db.columns[:len(tepcat.columns_WS)]) == list(tepcat.columns_WS)
+    assert db["System"].str.startswith("Star-").all()
+    assert "WARNING" in capsys.readouterr().out
+
+
+def test_text_columns_are_trimmed(install):
+    path = install(["tepcat well-studied"])["tepcat well-studied"]
+    lines = open(path).read().splitlines()
+    with open(path, "w") as f:
+        f.write("\n".join([lines[0]] + [line.replace(",", ",  ") for line in lines[1:]]) + "\n")
+    db = tepcat.load_db_WS()
+    assert (db["Discovery_reference"] == db["Discovery_reference"].str.strip()).all()
+
+
+def test_header_column_info_of_a_missing_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(tepcat, "database_file_HM", str(tmp_path / "missing.csv"))
+    assert not(hasattr(tepcat, "column_info_HM"))
+    with pytest.raises(AttributeError):
+        tepcat.column_info_HM
+
+
+@pytest.mark.parametrize("code", tepcat._header_tables)
+def test_header_column_info_matches_the_columns(install, code):
+    database = {"HM": "tepcat homogeneous-meas", "HP": "tepcat homogeneous-phys", "Ob": "tepcat obliquity"}[code]
+    install([database])
+    column_info = getattr(tepcat, "column_info_{}".format(code))
+    names = tepcat.get_schema(getattr(tepcat, "database_file_{}".format(code)))[0]
+    assert {record.original_column for record in column_info} <= set(names)